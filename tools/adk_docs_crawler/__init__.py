@@ -8,28 +8,40 @@ Components:
 - crawler: Site discovery and content fetching
 - extractor: HTML/Markdown parsing and normalization
 - chunker: RAG-ready chunking with metadata
+- indexer: Local BM25 index over the chunks
+- docs_index: Memory-mapped index reader + search_adk_docs agent tool
 - uploader: GCS upload with structured paths
 
 Usage:
     python -m tools.adk_docs_crawler crawl
     python -m tools.adk_docs_crawler upload
     python -m tools.adk_docs_crawler run  # Full pipeline
+    python -m tools.adk_docs_crawler index  # Index existing chunks.jsonl
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Hustle Team"
 __license__ = "MIT"
 
-from .config import load_config
-from .crawler import ADKDocsCrawler
-from .extractor import ContentExtractor
-from .chunker import RAGChunker
-from .uploader import GCSUploader
-
-__all__ = [
-    "load_config",
-    "ADKDocsCrawler",
-    "ContentExtractor",
-    "RAGChunker",
-    "GCSUploader",
-]
+# Components are imported on first access: agents import docs_index without
+# the crawler's dependencies (requests, bs4, google-cloud-storage)
+_EXPORTS = {
+    "load_config": ".config",
+    "ADKDocsCrawler": ".crawler",
+    "ContentExtractor": ".extractor",
+    "RAGChunker": ".chunker",
+    "DocsIndexer": ".indexer",
+    "GCSUploader": ".uploader",
+    "search_adk_docs": ".docs_index",
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+
+
+__all__ = list(_EXPORTS)
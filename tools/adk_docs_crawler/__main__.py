@@ -7,9 +7,12 @@ Usage:
     python -m tools.adk_docs_crawler extract   # Extract only
     python -m tools.adk_docs_crawler chunk     # Chunk only
     python -m tools.adk_docs_crawler upload    # Upload only
+    python -m tools.adk_docs_crawler index     # Build search index from chunks.jsonl
+    python -m tools.adk_docs_crawler search "how do I add a tool"
 """
 
 import sys
+import json
 import logging
 import argparse
 from pathlib import Path
@@ -18,6 +21,8 @@ from .config import load_config
 from .crawler import ADKDocsCrawler
 from .extractor import ContentExtractor
 from .chunker import RAGChunker
+from .docs_index import DocsIndex
+from .indexer import DocsIndexer
 from .uploader import GCSUploader
 
 
@@ -49,6 +54,7 @@ def run_pipeline(config, skip_upload=False):
     manifest_path = Path(output["manifest_file"])
     docs_path = Path(output["raw_docs_file"])
     chunks_path = Path(output["chunks_file"])
+    index_dir = Path(output["index_dir"])
 
     # Step 1: Crawl
     logger.info("\n" + "="*80)
@@ -80,10 +86,17 @@ def run_pipeline(config, skip_upload=False):
     chunks = chunker.chunk(docs)
     chunker.save_chunks(chunks, chunks_path)
 
-    # Step 4: Upload
+    # Step 4: Index
+    logger.info("\n" + "="*80)
+    logger.info("Step 4: Indexing")
+    logger.info("="*80)
+
+    DocsIndexer(config).build(chunks, index_dir)
+
+    # Step 5: Upload
     if not skip_upload:
         logger.info("\n" + "="*80)
-        logger.info("Step 4: Uploading")
+        logger.info("Step 5: Uploading")
         logger.info("="*80)
 
         uploader = GCSUploader(config)
@@ -99,6 +112,7 @@ def run_pipeline(config, skip_upload=False):
         logger.info(f"  • Manifest: {manifest_path}")
         logger.info(f"  • Docs: {docs_path}")
         logger.info(f"  • Chunks: {chunks_path}")
+        logger.info(f"  • Index: {index_dir}")
 
     # Summary
     logger.info(f"\n📊 Summary:")
@@ -107,10 +121,25 @@ def run_pipeline(config, skip_upload=False):
     logger.info(f"  • Chunks: {len(chunks)}")
 
 
+def run_index(config):
+    """Build the search index from an existing chunks file"""
+    output = config["output"]
+    indexer = DocsIndexer(config)
+    indexer.build(indexer.load_chunks(output["chunks_file"]), output["index_dir"])
+
+
+def run_search(config, query, top_k):
+    """Query the local index (the ranking the agents' search_adk_docs tool uses)"""
+    index = DocsIndex(config["output"]["index_dir"])
+    print(json.dumps(index.search(query, top_k), indent=2))
+
+
 def main():
     parser = argparse.ArgumentParser(description="ADK Docs Crawler for Hustle")
-    parser.add_argument("command", choices=["run", "crawl", "extract", "chunk", "upload"],
+    parser.add_argument("command", choices=["run", "crawl", "extract", "chunk", "index", "search", "upload"],
                         help="Command to execute")
+    parser.add_argument("query", nargs="?", help="Query for the search command")
+    parser.add_argument("--top-k", type=int, default=3, help="Results for the search command")
     parser.add_argument("--skip-upload", action="store_true",
                         help="Skip GCS upload (for testing)")
     parser.add_argument("--config", type=str, help="Path to config.yaml")
@@ -118,13 +147,17 @@ def main():
     args = parser.parse_args()
 
     try:
-        # Load config
-        config = load_config(args.config)
+        # Load config (index/search are local and don't need GCP settings)
+        config = load_config(args.config, require_gcp=args.command not in ("index", "search"))
         setup_logging(config)
 
         # Execute command
         if args.command == "run":
             run_pipeline(config, skip_upload=args.skip_upload)
+        elif args.command == "index":
+            run_index(config)
+        elif args.command == "search":
+            run_search(config, args.query or "", args.top_k)
         else:
             print(f"Command '{args.command}' not yet implemented")
             print("Use 'run' for full pipeline")
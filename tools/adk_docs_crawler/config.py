@@ -14,12 +14,13 @@ from string import Template
 logger = logging.getLogger(__name__)
 
 
-def load_config(config_path: str | None = None) -> Dict[str, Any]:
+def load_config(config_path: str | None = None, require_gcp: bool = True) -> Dict[str, Any]:
     """
     Load configuration from YAML file with environment variable substitution.
 
     Args:
         config_path: Path to config.yaml (defaults to same directory as this file)
+        require_gcp: Validate GCP settings (not needed for local index/search)
 
     Returns:
         dict: Configuration with environment variables substituted
@@ -51,7 +52,8 @@ def load_config(config_path: str | None = None) -> Dict[str, Any]:
     config = yaml.safe_load(substituted)
 
     # Validate required GCP env vars
-    _validate_gcp_config(config)
+    if require_gcp:
+        _validate_gcp_config(config)
 
     # Create output directories
     _ensure_output_dirs(config)
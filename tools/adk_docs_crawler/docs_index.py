@@ -0,0 +1,206 @@
+"""Memory-mapped BM25 index over ADK doc chunks - read side and agent tool
+
+Stdlib only, so agents can import it without the crawler dependencies.
+The index is built by `indexer.DocsIndexer` (`python -m tools.adk_docs_crawler index`).
+
+Index directory layout:
+- index.json: BM25 parameters, vocabulary (term -> [posting offset, df]),
+  section offsets into index.bin
+- index.bin: doc lengths (uint32 x N), passage offsets (uint64 x N+1),
+  postings (uint32 pairs: doc, term frequency)
+- passages.jsonl: one JSON passage per chunk, read by byte offset
+
+The binary files are memory-mapped, so a process only pages in the postings
+of the query terms and the passages it returns.
+
+Agents get the tool from `load_search_tool()`. This file has no imports from
+its package, so an agent deployed without the repo root can ship a copy of it
+as a top-level `docs_index` module.
+"""
+
+import heapq
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+# Default is where `python -m tools.adk_docs_crawler index` writes it, resolved
+# against the repo root rather than the working directory
+INDEX_DIR = os.getenv(
+    "HUSTLE_DOCS_INDEX_DIR",
+    str(Path(__file__).resolve().parent.parent.parent / "tmp" / "adk_crawler" / "index"),
+)
+
+# Passage text returned to the model is capped to keep tool responses small
+MAX_PASSAGE_CHARS = int(os.getenv("HUSTLE_DOCS_MAX_PASSAGE_CHARS", "1200"))
+MAX_TOP_K = 10
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i if in into is it its "
+    "of on or so that the their then there these this to use using was what "
+    "when where which who why will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased alphanumeric terms without stopwords (shared by index and queries)"""
+    return [t for t in _TOKEN.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+class DocsIndex:
+    """Read-only BM25 index over memory-mapped files"""
+
+    def __init__(self, index_dir: str | Path):
+        index_dir = Path(index_dir)
+
+        with open(index_dir / "index.json") as f:
+            meta = json.load(f)
+        if meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported docs index version: {meta.get('version')}")
+        if meta.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Docs index was built {meta.get('byteorder')}-endian, this host is {sys.byteorder}")
+
+        self.index_dir = index_dir
+        self.doc_count: int = meta["doc_count"]
+        self.avg_doc_len: float = meta["avg_doc_len"]
+        self.k1: float = meta["k1"]
+        self.b: float = meta["b"]
+        self.terms: Dict[str, List[int]] = meta["terms"]
+
+        self._bin_file = open(index_dir / "index.bin", "rb")
+        self._passages_file = open(index_dir / "passages.jsonl", "rb")
+        self._bin = mmap.mmap(self._bin_file.fileno(), 0, access=mmap.ACCESS_READ)
+        # mmap rejects empty files, as written for an index of no chunks
+        self._passages = (
+            mmap.mmap(self._passages_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if os.fstat(self._passages_file.fileno()).st_size else b""
+        )
+
+        sections = meta["sections"]
+        view = memoryview(self._bin)
+        n = self.doc_count
+        self._doc_lengths = view[sections["doc_lengths"]:sections["doc_lengths"] + 4 * n].cast("I")
+        self._passage_offsets = view[sections["passage_offsets"]:sections["passage_offsets"] + 8 * (n + 1)].cast("Q")
+        self._postings = view[sections["postings"]:].cast("I")
+
+    def search(self, query: str, top_k: int = 3) -> List[Dict[str, Any]]:
+        """
+        Rank chunks for a query with BM25.
+
+        Returns:
+            list: Up to top_k passages (best first) with their score
+        """
+        scores: Dict[int, float] = {}
+        # An index of empty chunks has avg_doc_len 0 (and no postings to score)
+        k1, b, avg_doc_len = self.k1, self.b, self.avg_doc_len or 1.0
+        doc_lengths = self._doc_lengths
+
+        for term in set(tokenize(query)):
+            entry = self.terms.get(term)
+            if entry is None:
+                continue
+
+            offset, df = entry
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+            postings = self._postings[offset:offset + 2 * df]
+            for i in range(0, 2 * df, 2):
+                doc, tf = postings[i], postings[i + 1]
+                norm = tf + k1 * (1 - b + b * doc_lengths[doc] / avg_doc_len)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (k1 + 1) / norm
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [{**self.passage(doc), "score": round(score, 3)} for doc, score in best]
+
+    def passage(self, doc: int) -> Dict[str, Any]:
+        """Stored passage for a chunk"""
+        start, end = self._passage_offsets[doc], self._passage_offsets[doc + 1]
+        return json.loads(self._passages[start:end])
+
+
+_index: Optional[DocsIndex] = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+
+def get_docs_index() -> Optional[DocsIndex]:
+    """
+    Return the process-wide DocsIndex, mapping it on first use.
+
+    Returns None (logged once) if HUSTLE_DOCS_INDEX_DIR has no usable index.
+    """
+    global _index, _index_loaded
+
+    if not _index_loaded:
+        with _index_lock:
+            if not _index_loaded:
+                try:
+                    _index = DocsIndex(INDEX_DIR)
+                    logger.info(f"📚 Docs index loaded: {_index.doc_count} chunks from {INDEX_DIR}")
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"⚠️  Docs index unavailable at {INDEX_DIR}: {e}")
+                _index_loaded = True
+
+    return _index
+
+
+def load_search_tool() -> Optional[Callable[..., dict]]:
+    """
+    Map the docs index and return the `search_adk_docs` tool for an agent.
+
+    Call it when the agent is built, so the index is mapped at startup rather
+    than on the first question.
+
+    Returns:
+        search_adk_docs, or None (with a warning) if there is no usable index
+        at HUSTLE_DOCS_INDEX_DIR
+    """
+    if get_docs_index() is None:
+        return None
+    return search_adk_docs
+
+
+def search_adk_docs(query: str, top_k: int = 3) -> dict:
+    """
+    Search the Google Agent Development Kit (ADK) documentation.
+
+    Use this for "how do I..." questions about building, running or deploying
+    agents, tools, sessions and callbacks with ADK. Answer from the returned
+    passages and cite their URLs.
+
+    Args:
+        query (str): The question or keywords to search for.
+        top_k (int, optional): Number of passages to return (1-10). Defaults to 3.
+
+    Returns:
+        dict: Search results including:
+            - status: "success", "no_results" or "unavailable"
+            - results: Passages with title, section, url, text and score
+    """
+    index = get_docs_index()
+    if index is None:
+        return {"status": "unavailable", "message": "ADK docs index is not available", "results": []}
+
+    passages = index.search(query, max(1, min(int(top_k), MAX_TOP_K)))
+    results = [
+        {
+            "title": p["title"],
+            "section": " > ".join(p["heading_path"]),
+            "url": p["url"],
+            "text": p["text"][:MAX_PASSAGE_CHARS],
+            "score": p["score"],
+        }
+        for p in passages
+    ]
+
+    return {"status": "success" if results else "no_results", "query": query, "results": results}
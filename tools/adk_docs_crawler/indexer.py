@@ -0,0 +1,105 @@
+"""BM25 index builder - turns chunks into a memory-mappable search index"""
+
+import json
+import logging
+import sys
+from array import array
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any
+
+from .docs_index import INDEX_VERSION, tokenize
+
+logger = logging.getLogger(__name__)
+
+
+class DocsIndexer:
+    """Build the local BM25 index read by `docs_index.DocsIndex`"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config.get("indexing", {})
+        self.k1 = self.config.get("k1", 1.2)
+        self.b = self.config.get("b", 0.75)
+
+    def build(self, chunks: List[Dict[str, Any]], output_dir: str | Path) -> Dict[str, Any]:
+        """
+        Build and save the index for a list of chunks.
+
+        Title and heading path are indexed with the chunk text, so a query
+        naming a page or section matches its chunks.
+
+        Returns:
+            dict: Index stats (chunks, terms, postings, bytes)
+        """
+        logger.info(f"🗂️  Indexing {len(chunks)} chunks...")
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        doc_lengths = array("I")
+        passage_offsets = array("Q", [0])
+        postings: Dict[str, List[int]] = {}
+
+        with open(output_dir / "passages.jsonl", "wb") as passages:
+            for doc, chunk in enumerate(chunks):
+                tokens = tokenize(" ".join([chunk["title"], *chunk["heading_path"], chunk["text"]]))
+                doc_lengths.append(len(tokens))
+                for term, tf in Counter(tokens).items():
+                    postings.setdefault(term, []).extend((doc, tf))
+
+                line = json.dumps({
+                    "chunk_id": chunk["chunk_id"],
+                    "url": chunk["url"],
+                    "title": chunk["title"],
+                    "heading_path": chunk["heading_path"],
+                    "text": chunk["text"],
+                }).encode("utf-8") + b"\n"
+                passages.write(line)
+                passage_offsets.append(passage_offsets[-1] + len(line))
+
+        # Postings in term order: offsets are in uint32 units from the postings section
+        terms: Dict[str, List[int]] = {}
+        flat = array("I")
+        for term in sorted(postings):
+            terms[term] = [len(flat), len(postings[term]) // 2]
+            flat.extend(postings[term])
+
+        sections = {"doc_lengths": 0}
+        sections["passage_offsets"] = sections["doc_lengths"] + len(doc_lengths) * doc_lengths.itemsize
+        sections["postings"] = sections["passage_offsets"] + len(passage_offsets) * passage_offsets.itemsize
+
+        with open(output_dir / "index.bin", "wb") as f:
+            doc_lengths.tofile(f)
+            passage_offsets.tofile(f)
+            flat.tofile(f)
+
+        with open(output_dir / "index.json", "w") as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "byteorder": sys.byteorder,
+                "built_at": datetime.utcnow().isoformat() + "Z",
+                "doc_count": len(chunks),
+                "avg_doc_len": sum(doc_lengths) / len(chunks) if chunks else 0.0,
+                "k1": self.k1,
+                "b": self.b,
+                "sections": sections,
+                "terms": terms,
+            }, f)
+
+        stats = {
+            "chunks": len(chunks),
+            "terms": len(terms),
+            "postings": len(flat) // 2,
+            "bytes": sum(p.stat().st_size for p in output_dir.iterdir()),
+        }
+        logger.info(
+            f"✅ Indexed {stats['chunks']} chunks ({stats['terms']} terms, "
+            f"{stats['bytes'] / 1024:.0f} KB) to {output_dir}"
+        )
+        return stats
+
+    @staticmethod
+    def load_chunks(chunks_path: str | Path) -> List[Dict[str, Any]]:
+        """Load chunks from JSONL"""
+        with open(chunks_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,133 @@
+"""Unit tests for docs_index (run: pytest tools/adk_docs_crawler/test_docs_index.py)"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from . import docs_index
+from .docs_index import DocsIndex, load_search_tool, search_adk_docs, tokenize
+from .indexer import DocsIndexer
+
+CHUNKS = [
+    {
+        "chunk_id": "tools-1",
+        "url": "https://google.github.io/adk-docs/tools/function-tools/",
+        "title": "Function tools",
+        "heading_path": ["Tools", "Function tools"],
+        "text": "Wrap a Python function with FunctionTool to give an agent a custom tool.",
+    },
+    {
+        "chunk_id": "sessions-1",
+        "url": "https://google.github.io/adk-docs/sessions/",
+        "title": "Sessions",
+        "heading_path": ["Sessions"],
+        "text": "A session service stores the events and state of a conversation.",
+    },
+    {
+        "chunk_id": "deploy-1",
+        "url": "https://google.github.io/adk-docs/deploy/agent-engine/",
+        "title": "Deploy to Agent Engine",
+        "heading_path": ["Deploy", "Agent Engine"],
+        "text": "Deploy an agent with agent_engines.create and an AdkApp.",
+    },
+]
+
+
+def _build(tmp_path, chunks):
+    DocsIndexer({"indexing": {"k1": 1.2, "b": 0.75}}).build(chunks, tmp_path)
+    return DocsIndex(tmp_path)
+
+
+def test_tokenize_drops_stopwords_and_single_characters():
+    assert tokenize("How do I add a FunctionTool to an agent?") == ["add", "functiontool", "agent"]
+
+
+def test_search_ranks_the_matching_chunk_first(tmp_path):
+    index = _build(tmp_path, CHUNKS)
+
+    results = index.search("how do I store session state", top_k=2)
+
+    assert results[0]["chunk_id"] == "sessions-1"
+    assert results[0]["url"] == CHUNKS[1]["url"]
+    assert len(results) <= 2
+    assert all(earlier["score"] >= later["score"] for earlier, later in zip(results, results[1:]))
+
+
+def test_title_and_headings_are_indexed(tmp_path):
+    index = _build(tmp_path, CHUNKS)
+
+    assert index.search("function tools")[0]["chunk_id"] == "tools-1"
+
+
+def test_unknown_terms_return_no_results(tmp_path):
+    index = _build(tmp_path, CHUNKS)
+
+    assert index.search("zebra") == []
+    assert index.search("the and of") == []
+
+
+def test_passages_round_trip(tmp_path):
+    index = _build(tmp_path, CHUNKS)
+
+    assert [index.passage(doc)["chunk_id"] for doc in range(index.doc_count)] == [
+        chunk["chunk_id"] for chunk in CHUNKS
+    ]
+
+
+@pytest.mark.parametrize("chunks", [
+    [],
+    [{"chunk_id": "empty", "url": "https://example.com", "title": "", "heading_path": [], "text": ""}],
+])
+def test_empty_index_searches_without_error(tmp_path, chunks):
+    index = _build(tmp_path, chunks)
+
+    assert index.avg_doc_len == 0
+    assert index.search("agent") == []
+
+
+def test_zero_average_length_does_not_divide_by_zero(tmp_path):
+    _build(tmp_path, CHUNKS)
+    meta = json.loads((tmp_path / "index.json").read_text())
+    (tmp_path / "index.json").write_text(json.dumps({**meta, "avg_doc_len": 0}))
+
+    assert DocsIndex(tmp_path).search("session state")[0]["chunk_id"] == "sessions-1"
+
+
+@pytest.fixture
+def fresh_index(monkeypatch):
+    monkeypatch.setattr(docs_index, "_index", None)
+    monkeypatch.setattr(docs_index, "_index_loaded", False)
+
+    def point_at(index_dir):
+        monkeypatch.setattr(docs_index, "INDEX_DIR", str(index_dir))
+
+    return point_at
+
+
+def test_load_search_tool_maps_the_index(tmp_path, fresh_index):
+    DocsIndexer({"indexing": {"k1": 1.2, "b": 0.75}}).build(CHUNKS, tmp_path)
+    fresh_index(tmp_path)
+
+    assert load_search_tool() is search_adk_docs
+    assert docs_index._index.doc_count == len(CHUNKS)
+    assert search_adk_docs("session state")["results"][0]["url"] == CHUNKS[1]["url"]
+
+
+def test_load_search_tool_without_an_index(tmp_path, fresh_index, caplog):
+    fresh_index(tmp_path / "missing")
+
+    assert load_search_tool() is None
+    assert "Docs index unavailable" in caplog.text
+
+
+def test_default_index_dir_does_not_depend_on_the_working_directory(monkeypatch, tmp_path):
+    monkeypatch.delenv("HUSTLE_DOCS_INDEX_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+    spec = importlib.util.spec_from_file_location("docs_index_copy", docs_index.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    repo_root = Path(docs_index.__file__).resolve().parents[2]
+    assert Path(module.INDEX_DIR) == repo_root / "tmp" / "adk_crawler" / "index"
@@ -0,0 +1,130 @@
+"""
+Cold start benchmark for the orchestrator modules.
+
+Imports each orchestrator module in a fresh Python process (as a new Cloud
+Functions / Cloud Run instance would) and reports import wall time. Optionally
+also times the first client/agent build, which needs GCP credentials.
+
+Usage:
+    python bench_cold_start.py                 # import time, 10 runs each
+    python bench_cold_start.py --runs 25
+    python bench_cold_start.py --first-build   # + first orchestrator build
+    python bench_cold_start.py --importtime    # slowest imports (-X importtime)
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SRC_DIR = Path(__file__).parent / "src"
+
+MODULES = {
+    "orchestrator_agent": "get_orchestrator()",
+    "orchestrator_agent_adk": "get_orchestrator_agent()",
+}
+
+_IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(f"import {{(time.perf_counter() - start) * 1000:.2f}}")
+{first_build}
+"""
+
+_FIRST_BUILD_SNIPPET = """
+start = time.perf_counter()
+{module}.{builder}
+print(f"first_build {{(time.perf_counter() - start) * 1000:.2f}}")
+"""
+
+
+def _run_once(module: str, first_build: bool) -> Optional[Dict[str, float]]:
+    code = _IMPORT_SNIPPET.format(
+        module=module,
+        first_build=_FIRST_BUILD_SNIPPET.format(module=module, builder=MODULES[module])
+        if first_build else "",
+    )
+    env = dict(os.environ, HUSTLE_LOG_BACKEND="local")
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        print(f"❌ {module}: {proc.stderr.strip().splitlines()[-1]}")
+        return None
+
+    timings = {}
+    for line in proc.stdout.splitlines():
+        name, _, value = line.partition(" ")
+        if name in ("import", "first_build"):
+            timings[name] = float(value)
+    return timings
+
+
+def _report(module: str, samples: List[Dict[str, float]]) -> None:
+    for phase in ("import", "first_build"):
+        values = [sample[phase] for sample in samples if phase in sample]
+        if not values:
+            continue
+        print(
+            f"  {phase:<12} min {min(values):8.1f} ms | "
+            f"median {statistics.median(values):8.1f} ms | "
+            f"max {max(values):8.1f} ms"
+        )
+
+
+def _importtime(module: str, top: int = 15) -> None:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        env=dict(os.environ, HUSTLE_LOG_BACKEND="local"),
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self [us] | cumulative | imported package"
+        _, cumulative_us, name = line.split("|", 2)
+        rows.append((int(cumulative_us), name.strip()))
+
+    print(f"  slowest imports (cumulative):")
+    for cumulative_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"    {cumulative_us / 1000:8.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Orchestrator cold start benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="Fresh processes per module")
+    parser.add_argument("--first-build", action="store_true",
+                        help="Also time the first orchestrator build (needs GCP credentials)")
+    parser.add_argument("--importtime", action="store_true",
+                        help="Show the slowest imports via python -X importtime")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("ORCHESTRATOR COLD START BENCHMARK")
+    print("=" * 80)
+
+    for module in MODULES:
+        print(f"\n{module} ({args.runs} runs)")
+        samples = [
+            timing for timing in (_run_once(module, args.first_build) for _ in range(args.runs))
+            if timing
+        ]
+        if samples:
+            _report(module, samples)
+        if args.importtime:
+            _importtime(module)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Hustle sub-agents (validation, user-creation,
+onboarding, analytics).
+
+Serves `POST /v1/projects/{project}/locations/{region}/agents/hustle-{agent}-agent:execute`,
+the path the orchestrator's HTTP transport calls when HUSTLE_A2A_ENDPOINT is
+set (see src/client_pool.py). Each agent answers with the fields the
+orchestrator reads (valid, userId, playerId, gameId(s), emailSent, tracked)
+after a latency drawn from a lognormal distribution, and fails with HTTP 503
+at a configurable rate.
+
+Usage:
+    python fake_agents.py                              # port 8808, default profile
+    python fake_agents.py --latency validation=20:120 --failure-rate onboarding=0.05
+    python fake_agents.py --config profile.json        # {"validation": {"median_ms": 20, ...}}
+
+    HUSTLE_A2A_ENDPOINT=http://127.0.0.1:8808 python ...  # point the orchestrator here
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_PORT = 8808
+
+_PATH = re.compile(r"/agents/hustle-(?P<agent>[a-z-]+)-agent:execute$")
+
+
+@dataclass
+class AgentProfile:
+    """Latency (lognormal, from median and p99) and failure rate of one agent"""
+    median_ms: float
+    p99_ms: float
+    failure_rate: float = 0.0
+
+    def latency_s(self, rng: random.Random) -> float:
+        # p99 of a lognormal is median * exp(2.326 * sigma)
+        sigma = math.log(max(self.p99_ms, self.median_ms) / self.median_ms) / 2.326
+        return rng.lognormvariate(math.log(self.median_ms), sigma) / 1000
+
+
+# Rough shape of the deployed agents (LLM-backed, so tens to hundreds of ms)
+DEFAULT_PROFILES: Dict[str, AgentProfile] = {
+    "validation": AgentProfile(median_ms=80, p99_ms=400, failure_rate=0.01),
+    "user-creation": AgentProfile(median_ms=150, p99_ms=800, failure_rate=0.01),
+    "onboarding": AgentProfile(median_ms=300, p99_ms=1500, failure_rate=0.01),
+    "analytics": AgentProfile(median_ms=50, p99_ms=300, failure_rate=0.01),
+}
+
+
+def _validation(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    return {"valid": True, "errors": []}
+
+
+def _user_creation(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    intent = parameters.get("intent")
+    if intent == "player_creation":
+        return {"playerId": f"player-{uuid.uuid4().hex[:12]}", "created": True}
+    if intent == "game_logging":
+        return {"gameId": f"game-{uuid.uuid4().hex[:12]}", "created": True}
+    if intent == "game_logging_bulk":
+        games = parameters.get("data", {}).get("games", [])
+        return {"gameIds": [f"game-{uuid.uuid4().hex[:12]}" for _ in games], "created": True}
+    return {"userId": f"user-{uuid.uuid4().hex[:12]}", "created": True}
+
+
+def _onboarding(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    return {"emailSent": True, "tokenId": uuid.uuid4().hex}
+
+
+def _analytics(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    return {"tracked": True, "events": len(parameters.get("events", [])) or 1}
+
+
+RESPONDERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "validation": _validation,
+    "user-creation": _user_creation,
+    "onboarding": _onboarding,
+    "analytics": _analytics,
+}
+
+
+class FakeAgentServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the agent profiles and call counts"""
+
+    daemon_threads = True
+    # Load tests open many connections at once
+    request_queue_size = 1024
+
+    def __init__(self, address, profiles: Dict[str, AgentProfile], seed: Optional[int] = None):
+        super().__init__(address, _Handler)
+        self.profiles = profiles
+        self.calls: Dict[str, int] = {agent: 0 for agent in profiles}
+        self.failures: Dict[str, int] = {agent: 0 for agent in profiles}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self, agent: str) -> Optional[float]:
+        """Latency in seconds for one call, or None if the call should fail."""
+        profile = self.profiles[agent]
+        with self._lock:
+            self.calls[agent] += 1
+            latency_s = profile.latency_s(self._rng)
+            if self._rng.random() < profile.failure_rate:
+                self.failures[agent] += 1
+                return None
+        return latency_s
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"calls": dict(self.calls), "failures": dict(self.failures)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive for the orchestrator's pooled connections
+    server: FakeAgentServer
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        match = _PATH.search(self.path)
+        if match is None or match.group("agent") not in self.server.profiles:
+            self._reply(404, {"error": f"Unknown agent path: {self.path}"})
+            return
+
+        agent = match.group("agent")
+        latency_s = self.server.draw(agent)
+        if latency_s is None:
+            time.sleep(self.server.profiles[agent].median_ms / 1000)
+            self._reply(503, {"error": f"{agent} unavailable (injected failure)"})
+            return
+
+        time.sleep(latency_s)
+        parameters = json.loads(body or b"{}").get("parameters") or {}
+        self._reply(200, {"output": RESPONDERS[agent](parameters)})
+
+    def do_GET(self) -> None:
+        if self.path == "/healthz":
+            self._reply(200, {"status": "ok"})
+        elif self.path == "/stats":
+            self._reply(200, self.server.stats())
+        else:
+            self._reply(404, {"error": "Not found"})
+
+    def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # One line per request would dominate a load test
+
+
+def start_server(
+    port: int = DEFAULT_PORT,
+    profiles: Optional[Dict[str, AgentProfile]] = None,
+    seed: Optional[int] = None,
+    host: str = "127.0.0.1",
+) -> FakeAgentServer:
+    """
+    Start the fake agents on a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free port; see server.server_address)
+        profiles: Per-agent profiles (defaults to DEFAULT_PROFILES)
+        seed: Random seed for reproducible latencies and failures
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    server = FakeAgentServer((host, port), profiles or dict(DEFAULT_PROFILES), seed)
+    threading.Thread(target=server.serve_forever, name="fake-agents", daemon=True).start()
+    return server
+
+
+def parse_profiles(
+    config_path: Optional[str] = None,
+    latency: Optional[list] = None,
+    failure_rate: Optional[list] = None,
+) -> Dict[str, AgentProfile]:
+    """
+    Build agent profiles from a JSON file and/or CLI overrides.
+
+    Args:
+        config_path: JSON object of agent -> {median_ms, p99_ms, failure_rate}
+        latency: ["agent=median_ms:p99_ms", ...] ("*" for every agent)
+        failure_rate: ["agent=rate", ...] ("*" for every agent)
+    """
+    profiles = {agent: AgentProfile(**asdict(profile)) for agent, profile in DEFAULT_PROFILES.items()}
+
+    if config_path:
+        with open(config_path) as f:
+            for agent, values in json.load(f).items():
+                profiles[agent] = AgentProfile(**{**asdict(profiles.get(agent, DEFAULT_PROFILES["validation"])), **values})
+
+    def targets(agent: str):
+        return list(profiles) if agent == "*" else [agent]
+
+    for item in latency or []:
+        agent, _, value = item.partition("=")
+        median_ms, _, p99_ms = value.partition(":")
+        for name in targets(agent):
+            profiles[name].median_ms = float(median_ms)
+            profiles[name].p99_ms = float(p99_ms or median_ms)
+
+    for item in failure_rate or []:
+        agent, _, value = item.partition("=")
+        for name in targets(agent):
+            profiles[name].failure_rate = float(value)
+
+    return profiles
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--config", help="JSON file of per-agent profiles")
+    parser.add_argument("--latency", action="append", metavar="AGENT=MEDIAN_MS:P99_MS",
+                        help="Latency override (repeatable; AGENT may be *)")
+    parser.add_argument("--failure-rate", action="append", metavar="AGENT=RATE",
+                        help="Failure rate override, 0-1 (repeatable; AGENT may be *)")
+    parser.add_argument("--seed", type=int, help="Random seed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the Hustle sub-agents")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--host", default="127.0.0.1")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    profiles = parse_profiles(args.config, args.latency, args.failure_rate)
+    server = FakeAgentServer((args.host, args.port), profiles, args.seed)
+
+    print(f"Fake agents on http://{args.host}:{args.port}")
+    for agent, profile in profiles.items():
+        print(f"  {agent:<14} median {profile.median_ms:g}ms  p99 {profile.p99_ms:g}ms  "
+              f"failures {profile.failure_rate:.1%}")
+    print(f"Set HUSTLE_A2A_ENDPOINT=http://{args.host}:{args.port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Load generator for the Hustle orchestrator.
+
+Drives `handle_request` (or `handle_request_async` with --async) at a target
+request rate against the local stand-in agents in fake_agents.py and reports
+throughput, success rate and latency percentiles per intent.
+
+Requests are sent open-loop: each one is scheduled at a fixed time and its
+latency is measured from that time, so a stalled orchestrator shows up as
+queueing latency instead of a lower request rate.
+
+Usage:
+    python load_generator.py --rps 50 --duration 30          # starts fake agents in-process
+    python load_generator.py --endpoint http://127.0.0.1:8808 --rps 200 --async
+    python load_generator.py --mix user_registration=1,game_logging=4 --failure-rate '*=0.05'
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+DEFAULT_MIX = "user_registration=1,player_creation=2,game_logging=6,game_logging_bulk=1"
+
+
+# ============================================================================
+# REQUEST PAYLOADS
+# ============================================================================
+
+def _game(rng: random.Random) -> Dict[str, Any]:
+    goals_for, goals_against = rng.randint(0, 5), rng.randint(0, 5)
+    return {
+        "playerId": f"player-{rng.randint(1, 1000)}",
+        "date": "2026-09-12",
+        "opponent": rng.choice(["Rovers", "United", "Athletic", "City"]),
+        "result": "Win" if goals_for > goals_against else "Loss" if goals_for < goals_against else "Draw",
+        "finalScore": f"{goals_for}-{goals_against}",
+        "minutesPlayed": rng.randint(10, 90),
+        "goals": rng.randint(0, 3),
+        "assists": rng.randint(0, 2),
+    }
+
+
+def build_request(intent: str, uid: str, rng: random.Random) -> Dict[str, Any]:
+    """A valid request for intent (unique email per registration)."""
+    if intent == "user_registration":
+        return {
+            "intent": intent,
+            "data": {
+                "firstName": "Load",
+                "lastName": "Test",
+                "email": f"load-{uuid.uuid4().hex[:12]}@example.com",
+                "password": "correct-horse-battery",
+                "agreedToTerms": True,
+                "isParentGuardian": True,
+            },
+        }
+
+    auth = {"uid": uid}
+    if intent == "player_creation":
+        data = {
+            "name": f"Player {rng.randint(1, 10000)}",
+            "birthday": "2012-05-01",
+            "position": rng.choice(["Forward", "Midfielder", "Defender", "Goalkeeper"]),
+            "teamClub": "Load Test FC",
+        }
+    elif intent == "game_logging":
+        data = _game(rng)
+    elif intent == "game_logging_bulk":
+        data = {"games": [_game(rng) for _ in range(rng.randint(20, 250))]}
+    else:
+        raise ValueError(f"Unknown intent: {intent}")
+
+    return {"intent": intent, "data": data, "auth": auth}
+
+
+def parse_mix(mix: str) -> Tuple[List[str], List[float]]:
+    intents, weights = [], []
+    for item in mix.split(","):
+        intent, _, weight = item.partition("=")
+        intents.append(intent.strip())
+        weights.append(float(weight or 1))
+    return intents, weights
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class Recorder:
+    """Per-intent latencies, outcomes and error codes"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.successes: Counter = Counter()
+        self.errors: Dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def record(self, intent: str, latency_s: float, result: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.latencies[intent].append(latency_s)
+            if result is None:
+                self.errors[intent]["EXCEPTION"] += 1
+            elif result.get("success"):
+                self.successes[intent] += 1
+            else:
+                for error in result.get("errors") or [{"code": "UNKNOWN"}]:
+                    self.errors[intent][error.get("code", "UNKNOWN")] += 1
+
+    def summary(self, elapsed_s: float) -> Dict[str, Any]:
+        intents = {}
+        for intent in sorted(self.latencies):
+            values = sorted(self.latencies[intent])
+            intents[intent] = {
+                "requests": len(values),
+                "throughput_rps": round(len(values) / elapsed_s, 2),
+                "success_rate": round(self.successes[intent] / len(values), 4),
+                "p50_ms": round(_percentile(values, 0.50) * 1000, 1),
+                "p90_ms": round(_percentile(values, 0.90) * 1000, 1),
+                "p99_ms": round(_percentile(values, 0.99) * 1000, 1),
+                "max_ms": round(values[-1] * 1000, 1),
+                "errors": dict(self.errors[intent]),
+            }
+
+        total = sum(len(values) for values in self.latencies.values())
+        return {
+            "elapsed_s": round(elapsed_s, 2),
+            "requests": total,
+            "throughput_rps": round(total / elapsed_s, 2),
+            "intents": intents,
+        }
+
+
+def print_report(summary: Dict[str, Any]) -> None:
+    print(f"\n{summary['requests']} requests in {summary['elapsed_s']}s "
+          f"({summary['throughput_rps']} req/s)\n")
+    print(f"{'intent':<20}{'count':>7}{'req/s':>8}{'ok':>8}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}")
+    for intent, stats in summary["intents"].items():
+        print(
+            f"{intent:<20}{stats['requests']:>7}{stats['throughput_rps']:>8}"
+            f"{stats['success_rate']:>8.1%}{stats['p50_ms']:>9}{stats['p90_ms']:>9}"
+            f"{stats['p99_ms']:>9}{stats['max_ms']:>9}"
+        )
+        if stats["errors"]:
+            errors = ", ".join(f"{code}={count}" for code, count in sorted(stats["errors"].items()))
+            print(f"{'':<20}errors: {errors}")
+
+
+# ============================================================================
+# DRIVERS
+# ============================================================================
+
+def _schedule(
+    rps: float,
+    duration_s: float,
+    mix: str,
+    users: int,
+    seed: Optional[int],
+) -> List[Tuple[float, str, Dict[str, Any]]]:
+    """Build (offset_s, intent, request) for every request up front."""
+    rng = random.Random(seed)
+    intents, weights = parse_mix(mix)
+    uids = [f"loadtest-user-{i}" for i in range(users)]
+    count = int(rps * duration_s)
+    return [
+        (i / rps, intent, build_request(intent, rng.choice(uids), rng))
+        for i, intent in enumerate(rng.choices(intents, weights, k=count))
+    ]
+
+
+def run_threads(
+    handle_request: Callable[[Dict[str, Any]], Dict[str, Any]],
+    schedule: List[Tuple[float, str, Dict[str, Any]]],
+    workers: int,
+    recorder: Recorder,
+) -> float:
+    """Send the schedule from a thread pool; returns elapsed seconds."""
+    def send(scheduled_at: float, intent: str, request: Dict[str, Any]) -> None:
+        try:
+            result = handle_request(request)
+        except Exception:
+            result = None
+        recorder.record(intent, time.perf_counter() - scheduled_at, result)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for offset_s, intent, request in schedule:
+            delay = start + offset_s - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(send, start + offset_s, intent, request)
+    return time.perf_counter() - start
+
+
+def run_async(
+    handle_request_async: Callable[[Dict[str, Any]], Any],
+    schedule: List[Tuple[float, str, Dict[str, Any]]],
+    recorder: Recorder,
+) -> float:
+    """Send the schedule as tasks on one event loop; returns elapsed seconds."""
+    async def send(scheduled_at: float, intent: str, request: Dict[str, Any]) -> None:
+        try:
+            result = await handle_request_async(request)
+        except Exception:
+            result = None
+        recorder.record(intent, time.perf_counter() - scheduled_at, result)
+
+    async def main() -> float:
+        start = time.perf_counter()
+        tasks = []
+        for offset_s, intent, request in schedule:
+            delay = start + offset_s - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(send(start + offset_s, intent, request)))
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+    return asyncio.run(main())
+
+
+def main() -> None:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import fake_agents
+
+    parser = argparse.ArgumentParser(description="Load test the Hustle orchestrator")
+    parser.add_argument("--rps", type=float, default=20, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds of load to send")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Intent weights, e.g. game_logging=4,player_creation=1")
+    parser.add_argument("--users", type=int, default=50, help="Distinct authenticated uids")
+    parser.add_argument("--workers", type=int, default=256, help="Threads sending requests (sync mode)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Use handle_request_async")
+    parser.add_argument("--endpoint", help="Use running fake agents instead of starting them in-process")
+    parser.add_argument("--json", dest="json_path", help="Also write the summary to this file")
+    fake_agents.add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    endpoint = args.endpoint
+    if endpoint is None:
+        profiles = fake_agents.parse_profiles(args.config, args.latency, args.failure_rate)
+        server = fake_agents.start_server(port=0, profiles=profiles, seed=args.seed)
+        endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Must be set before the orchestrator modules are imported
+    os.environ["HUSTLE_A2A_ENDPOINT"] = endpoint
+    os.environ.setdefault("HUSTLE_LOG_BACKEND", "local")
+    os.environ.setdefault("HUSTLE_TRACE_EXPORTER", "none")
+    sys.path.insert(0, SRC_DIR)
+
+    import logging
+    logging.basicConfig(level=logging.WARNING)
+    import orchestrator_agent
+
+    schedule = _schedule(args.rps, args.duration, args.mix, args.users, args.seed)
+    print(f"Sending {len(schedule)} requests at {args.rps:g} req/s to agents at {endpoint}"
+          f" ({'async' if args.use_async else f'{args.workers} threads'})")
+
+    # Build the orchestrator before the clock starts
+    orchestrator_agent.get_orchestrator()
+
+    recorder = Recorder()
+    if args.use_async:
+        elapsed_s = run_async(orchestrator_agent.handle_request_async, schedule, recorder)
+    else:
+        elapsed_s = run_threads(orchestrator_agent.handle_request, schedule, args.workers, recorder)
+
+    summary = recorder.summary(elapsed_s)
+    print_report(summary)
+
+    if server is not None:
+        summary["agents"] = server.stats()
+        server.shutdown()
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
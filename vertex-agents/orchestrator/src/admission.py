@@ -0,0 +1,171 @@
+"""
+Admission control for the orchestrator entry point.
+
+Each request fans out to up to four remote agents, so accepting unbounded
+concurrent work makes every request slow down together during a burst.
+`AdmissionController.admit` runs before any work and rejects immediately
+instead of queueing:
+
+- Global concurrency limit (HUSTLE_MAX_CONCURRENT_REQUESTS). Requests are
+  counted while they execute.
+- Priority lanes: each intent's lane may use only a share of the limit, so
+  lower lanes are shed first and registrations keep headroom when the
+  instance is saturated (LANE_SHARES).
+- Per-uid token buckets (HUSTLE_USER_RATE_PER_SECOND, HUSTLE_USER_BURST).
+  Unauthenticated requests (registration) have no uid and are bounded by the
+  concurrency limit only.
+
+Rejections use the orchestrator error shape plus `retryAfterMs`:
+RATE_LIMITED (HTTP 429) or OVERLOADED (HTTP 503).
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+MAX_CONCURRENT_REQUESTS = int(os.getenv("HUSTLE_MAX_CONCURRENT_REQUESTS", "64"))
+USER_RATE_PER_SECOND = float(os.getenv("HUSTLE_USER_RATE_PER_SECOND", "2"))
+USER_BURST = float(os.getenv("HUSTLE_USER_BURST", "10"))
+MAX_TRACKED_USERS = int(os.getenv("HUSTLE_RATE_LIMIT_MAX_USERS", "10000"))
+OVERLOADED_RETRY_AFTER_MS = int(os.getenv("HUSTLE_OVERLOADED_RETRY_AFTER_MS", "1000"))
+
+# Share of the concurrency limit each lane may use (higher lanes first)
+LANE_SHARES: Dict[str, float] = {
+    "critical": 1.0,
+    "standard": 0.8,
+    "bulk": 0.5,
+}
+
+INTENT_LANES: Dict[str, str] = {
+    "user_registration": "critical",
+    "player_creation": "standard",
+    "game_logging": "standard",
+    "game_logging_bulk": "bulk",
+    "free_form": "bulk",
+}
+DEFAULT_LANE = "standard"
+
+
+class TokenBucket:
+    """Refills `rate` tokens per second up to `burst`; not thread-safe"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated_at")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = now
+
+    def try_take(self, now: float) -> float:
+        """
+        Take one token.
+
+        Returns:
+            0 if taken, otherwise seconds until a token is available
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    """Concurrency limit with priority lanes and per-uid rate limits"""
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        rate_per_second: float = USER_RATE_PER_SECOND,
+        burst: float = USER_BURST,
+        max_users: int = MAX_TRACKED_USERS,
+    ):
+        self.max_concurrent = max_concurrent
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_users = max_users
+        self.in_flight = 0
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lane_limit(self, lane: str) -> int:
+        return max(1, int(self.max_concurrent * LANE_SHARES.get(lane, LANE_SHARES[DEFAULT_LANE])))
+
+    def admit(self, intent: str, uid: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Reserve a concurrency slot for one request.
+
+        Args:
+            intent: Intent name (selects the priority lane)
+            uid: Caller's uid, or None for unauthenticated requests
+
+        Returns:
+            None if admitted (call `release` when the request finishes), or
+            an error entry with code RATE_LIMITED / OVERLOADED and retryAfterMs
+        """
+        lane = INTENT_LANES.get(intent, DEFAULT_LANE)
+        now = time.monotonic()
+
+        with self._lock:
+            if self.in_flight >= self.lane_limit(lane):
+                return _rejection(
+                    "OVERLOADED",
+                    "Too many requests in progress, please retry shortly",
+                    OVERLOADED_RETRY_AFTER_MS,
+                )
+
+            if uid is not None and self.rate_per_second > 0:
+                wait_s = self._bucket(uid, now).try_take(now)
+                if wait_s:
+                    return _rejection(
+                        "RATE_LIMITED",
+                        "Too many requests, please slow down",
+                        int(wait_s * 1000) + 1,
+                    )
+
+            self.in_flight += 1
+            return None
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def _bucket(self, uid: str, now: float) -> TokenBucket:
+        bucket = self._buckets.get(uid)
+        if bucket is None:
+            bucket = self._buckets[uid] = TokenBucket(self.rate_per_second, self.burst, now)
+            # Forgetting the least recent user only refills their bucket early
+            while len(self._buckets) > self.max_users:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(uid)
+        return bucket
+
+
+def _rejection(code: str, message: str, retry_after_ms: int) -> Dict[str, Any]:
+    return {
+        "agent": "orchestrator",
+        "code": code,
+        "message": message,
+        "retryAfterMs": retry_after_ms,
+    }
+
+
+_controller: Optional[AdmissionController] = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Return the process-wide AdmissionController, creating it on first use."""
+    global _controller
+
+    if _controller is None:
+        with _controller_lock:
+            if _controller is None:
+                _controller = AdmissionController()
+
+    return _controller
@@ -0,0 +1,242 @@
+"""
+Fire-and-forget analytics outbox for the orchestrator.
+
+Analytics events are never on a request's critical path. Handlers call
+`AnalyticsOutbox.enqueue()`, which only puts the event on an in-memory queue
+and returns. A daemon thread drains the queue in micro-batches (up to
+HUSTLE_ANALYTICS_BATCH_SIZE events, or whatever arrived within
+HUSTLE_ANALYTICS_FLUSH_INTERVAL_MS) and sends each batch to the analytics agent
+in one A2A call. The outbox adds no retries of its own. `send_task` retries a
+batch only if the request was never sent (analytics is non-idempotent in
+resilience.py, so it is neither hedged nor retried after a timeout), so the
+agent never receives an event twice.
+
+Pending events are flushed on interpreter exit. Events whose batch still
+fails, or that arrive while the queue is full, are dropped and counted in
+`stats` rather than failing the request.
+
+The flusher thread needs CPU after the response is sent. On request-billed
+Cloud Run (the default CPU throttling) or Cloud Functions it gets almost none
+between requests, so events can sit in the queue until the next request or
+be lost when the instance is shut down. Deploy with CPU always allocated
+(`--no-cpu-throttling`), or set HUSTLE_ANALYTICS_FLUSH_BEFORE_RESPONSE=true to
+have `handle_request` flush the outbox before it returns.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = int(os.getenv("HUSTLE_ANALYTICS_BATCH_SIZE", "50"))
+FLUSH_INTERVAL_MS = int(os.getenv("HUSTLE_ANALYTICS_FLUSH_INTERVAL_MS", "1000"))
+MAX_QUEUE_SIZE = int(os.getenv("HUSTLE_ANALYTICS_MAX_QUEUE", "10000"))
+
+# For request-billed runtimes where background threads get no CPU after the response
+FLUSH_BEFORE_RESPONSE = os.getenv("HUSTLE_ANALYTICS_FLUSH_BEFORE_RESPONSE", "false").lower() == "true"
+FLUSH_BEFORE_RESPONSE_TIMEOUT_S = float(os.getenv("HUSTLE_ANALYTICS_FLUSH_TIMEOUT_MS", "2000")) / 1000
+
+EXIT_FLUSH_TIMEOUT_S = 5.0
+
+# Queued by flush() and close() to wake the flusher from a blocking get
+_WAKE: Dict[str, Any] = {}
+
+
+class AnalyticsOutbox:
+    """
+    In-memory analytics queue with a background micro-batching flusher.
+
+    Args:
+        send_batch: Delivers a list of events; returns True on success.
+        batch_size: Maximum events per delivery.
+        flush_interval_ms: Maximum time an event waits for its batch to fill.
+        max_queue_size: Events beyond this are dropped.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[Dict[str, Any]]], bool],
+        batch_size: int = BATCH_SIZE,
+        flush_interval_ms: int = FLUSH_INTERVAL_MS,
+        max_queue_size: int = MAX_QUEUE_SIZE,
+    ):
+        self.send_batch = send_batch
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_ms / 1000
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+        # Events enqueued but not yet delivered or dropped (queued + in a batch)
+        self._pending = 0
+        self._flushing = 0
+        self._drained = threading.Condition()
+
+        self.stats = {
+            "enqueued": 0,
+            "sent": 0,
+            "batches": 0,
+            "dropped": 0,
+        }
+
+    def enqueue(
+        self,
+        event: str,
+        user_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **fields: Any
+    ) -> bool:
+        """
+        Queue an analytics event without waiting for delivery.
+
+        Args:
+            event: Event name (user_registration, player_creation, ...)
+            user_id: Acting user
+            metadata: Free-form event properties
+            **fields: Extra top-level fields (playerId, sessionId, ...)
+
+        Returns:
+            True if the event was queued, False if it was dropped
+        """
+        self._ensure_started()
+
+        record = {
+            "event": event,
+            "userId": user_id,
+            "metadata": metadata or {},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            **fields,
+        }
+
+        # Counted before the put so flush() never sees a queued event as done
+        with self._drained:
+            self._pending += 1
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._done(1)
+            self.stats["dropped"] += 1
+            logger.warning(f"Analytics outbox full, dropping {event} event", extra={"event": event})
+            return False
+
+        self.stats["enqueued"] += 1
+        return True
+
+    def flush(self, timeout: float = EXIT_FLUSH_TIMEOUT_S) -> bool:
+        """
+        Wait until every queued event has been delivered or dropped.
+
+        While a flush is waiting, the flusher sends batches as soon as the
+        queue is empty instead of waiting for them to fill.
+
+        Returns:
+            True if the outbox drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._drained:
+            self._flushing += 1
+            if self._pending:
+                self._wake()
+            try:
+                while self._pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._drained.wait(remaining)
+                return True
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: float = EXIT_FLUSH_TIMEOUT_S) -> None:
+        """Flush pending events and stop the flusher thread."""
+        if self._thread is None:
+            return
+        self.flush(timeout)
+        self._stopping.set()
+        self._wake()
+        self._thread.join(timeout=1)
+
+    def _wake(self) -> None:
+        try:
+            self._queue.put_nowait(_WAKE)
+        except queue.Full:
+            pass  # The flusher has plenty to do already
+
+    def _ensure_started(self) -> None:
+        # Started on first event, so importing/building the orchestrator stays cheap
+        if self._thread is not None:
+            return
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="hustle-analytics-outbox",
+                    daemon=True,
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _next_batch(self) -> List[Dict[str, Any]]:
+        """Block for the first event, then collect more until full or the interval ends."""
+        try:
+            first = self._queue.get(timeout=self.flush_interval_s)
+        except queue.Empty:
+            return []
+        if first is _WAKE:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval_s
+        while len(batch) < self.batch_size:
+            # Don't wait for a full batch while someone is flushing
+            remaining = 0 if self._flushing else deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    event = self._queue.get_nowait()
+                else:
+                    event = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if event is _WAKE:
+                break
+            batch.append(event)
+
+        return batch
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            batch = self._next_batch()
+            if batch:
+                try:
+                    self._deliver(batch)
+                finally:
+                    self._done(len(batch))
+
+    def _done(self, count: int) -> None:
+        with self._drained:
+            self._pending -= count
+            self._drained.notify_all()
+
+    def _deliver(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            if self.send_batch(batch):
+                self.stats["sent"] += len(batch)
+                self.stats["batches"] += 1
+                return
+        except Exception as e:
+            logger.warning(f"Analytics batch delivery raised: {e}")
+
+        self.stats["dropped"] += len(batch)
+        logger.error(
+            f"Analytics outbox: dropping batch of {len(batch)} events after a failed delivery",
+            extra={"events": len(batch)}
+        )
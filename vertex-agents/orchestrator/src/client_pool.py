@@ -0,0 +1,279 @@
+"""
+Process-wide client pool for A2A calls.
+
+Sub-agent clients are expensive to build: each one resolves credentials and
+opens a new gRPC (HTTP/2) channel with its own TLS handshake. The pool builds
+each client once per process on first use and hands the same instance to
+every caller, so the channel and credentials stay warm across tool calls and
+requests. The clients are thread-safe and can be shared between workers.
+
+With HUSTLE_A2A_ENDPOINT set (e.g. http://127.0.0.1:8808, the local stand-in
+agents in loadtest/fake_agents.py), Agent Builder clients are replaced by
+plain HTTP clients with the same `execute_agent` interface, so the
+orchestrator runs without deployed Vertex agents.
+"""
+
+import asyncio
+import http.client
+import json
+import logging
+import os
+import select
+import socket
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+A2A_ENDPOINT = os.getenv("HUSTLE_A2A_ENDPOINT")
+
+# Keep idle channels to sub-agents alive between bursts of requests
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_receive_message_length", -1),
+]
+
+_clients: Dict[Tuple[str, ...], Any] = {}
+# Event-loop-bound clients: (*key, id(loop)) -> (loop, client). Holding the
+# loop keeps its id from being reused while the entry exists; entries of
+# closed loops are dropped whenever a new loop-bound client is created.
+_loop_clients: Dict[Tuple[Any, ...], Tuple[asyncio.AbstractEventLoop, Any]] = {}
+_lock = threading.Lock()
+
+
+def _get_or_create(key: Tuple[str, ...], factory: Callable[[], Any]) -> Any:
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = factory()
+            _clients[key] = client
+            logger.info(f"Client pool: created {key[0]} client", extra={"client": key})
+
+    return client
+
+
+def _get_or_create_for_loop(key: Tuple[str, ...], factory: Callable[[], Any]) -> Any:
+    """Like _get_or_create, with one client per running event loop."""
+    loop = asyncio.get_running_loop()
+    loop_key = (*key, id(loop))
+
+    entry = _loop_clients.get(loop_key)
+    if entry is not None and entry[0] is loop:
+        return entry[1]
+
+    with _lock:
+        entry = _loop_clients.get(loop_key)
+        if entry is None or entry[0] is not loop:
+            for stale_key in [k for k, (other, _) in _loop_clients.items() if other.is_closed()]:
+                del _loop_clients[stale_key]
+            entry = _loop_clients[loop_key] = (loop, factory())
+            logger.info(f"Client pool: created {key[0]} client", extra={"client": key})
+
+    return entry[1]
+
+
+class HttpAgentError(Exception):
+    """Non-200 response from an HTTP A2A endpoint"""
+
+    def __init__(self, status: int, body: str):
+        super().__init__(f"HTTP {status}: {body[:200]}")
+        self.status = status
+
+
+class HttpAgentResponse:
+    """Matches the `output` attribute of an Agent Builder response"""
+
+    def __init__(self, output: Any):
+        self.output = output
+
+
+def _request_body(input_text: str, session_id: Optional[str], parameters: Dict[str, Any]) -> bytes:
+    return json.dumps({
+        "input_text": input_text,
+        "session_id": session_id,
+        "parameters": parameters,
+    }, default=str).encode("utf-8")
+
+
+def _parse_response(status: int, body: bytes) -> HttpAgentResponse:
+    text = body.decode("utf-8")
+    if status != 200:
+        raise HttpAgentError(status, text)
+    return HttpAgentResponse(json.loads(text).get("output"))
+
+
+def _closed_by_peer(sock: socket.socket) -> bool:
+    """True if an idle socket is readable, i.e. the peer closed it (or sent junk)."""
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class HttpAgentClient:
+    """
+    Agent Builder client stand-in that POSTs to `{endpoint}/v1/{name}:execute`.
+
+    Keeps one keep-alive connection per thread. A connection the server has
+    closed is replaced before the request is written; failed requests are
+    not retried here (see resilience.py).
+    """
+
+    def __init__(self, endpoint: str):
+        parsed = urlparse(endpoint)
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.base_path = parsed.path.rstrip("/")
+        self._local = threading.local()
+
+    def execute_agent(
+        self,
+        name: str,
+        input_text: str,
+        session_id: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: float = 30,
+    ) -> HttpAgentResponse:
+        body = _request_body(input_text, session_id, parameters or {})
+        path = f"{self.base_path}/v1/{name}:execute"
+
+        # Never resent here: once bytes are written the agent may have acted
+        # on them, and only resilience knows whether the agent is idempotent
+        connection = self._connection(timeout)
+        try:
+            connection.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            return _parse_response(response.status, response.read())
+        except Exception:
+            connection.close()
+            self._local.connection = None
+            raise
+
+    def _connection(self, timeout: float) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and connection.sock is not None and _closed_by_peer(connection.sock):
+            # The server closed the idle keep-alive connection: reconnect
+            # before sending, instead of failing (or retrying) after
+            connection.close()
+            connection = None
+        if connection is None:
+            connection = self._local.connection = http.client.HTTPConnection(self.host, self.port)
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection
+
+
+class HttpAgentAsyncClient:
+    """asyncio counterpart of HttpAgentClient (one connection per call)"""
+
+    def __init__(self, endpoint: str):
+        parsed = urlparse(endpoint)
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.base_path = parsed.path.rstrip("/")
+
+    async def execute_agent(
+        self,
+        name: str,
+        input_text: str,
+        session_id: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: float = 30,
+    ) -> HttpAgentResponse:
+        body = _request_body(input_text, session_id, parameters or {})
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(
+                f"POST {self.base_path}/v1/{name}:execute HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode("ascii") + body
+            )
+            await writer.drain()
+
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                header, _, value = line.decode("latin-1").partition(":")
+                if header.strip().lower() == "content-length":
+                    length = int(value)
+            return _parse_response(status, await reader.readexactly(length))
+        finally:
+            writer.close()
+
+
+def get_agent_builder_client(region: str = "us-central1") -> Any:
+    """
+    Return the shared Vertex AI Agent Builder client for a region.
+
+    Credentials are resolved when the channel is first created, not at
+    import time. Returns an HttpAgentClient when HUSTLE_A2A_ENDPOINT is set.
+    """
+    if A2A_ENDPOINT:
+        return _get_or_create(("agent_builder_http", A2A_ENDPOINT), lambda: HttpAgentClient(A2A_ENDPOINT))
+
+    def factory() -> Any:
+        from google.cloud.aiplatform_v1 import AgentBuilderClient
+
+        host = f"{region}-aiplatform.googleapis.com"
+        transport_cls = AgentBuilderClient.get_transport_class("grpc")
+        channel = transport_cls.create_channel(host, options=GRPC_CHANNEL_OPTIONS)
+        return AgentBuilderClient(transport=transport_cls(host=host, channel=channel))
+
+    return _get_or_create(("agent_builder", region), factory)
+
+
+def get_agent_builder_async_client(region: str = "us-central1") -> Any:
+    """
+    Return the shared asyncio Agent Builder client for a region.
+
+    grpc.aio channels are bound to the event loop they are created on, so
+    there is one client per region per running loop; clients of closed loops
+    are released. Must be called from a coroutine. Returns an
+    HttpAgentAsyncClient when HUSTLE_A2A_ENDPOINT is set.
+    """
+    if A2A_ENDPOINT:
+        return _get_or_create(
+            ("agent_builder_http_async", A2A_ENDPOINT), lambda: HttpAgentAsyncClient(A2A_ENDPOINT)
+        )
+
+    def factory() -> Any:
+        from google.cloud.aiplatform_v1 import AgentBuilderAsyncClient
+
+        host = f"{region}-aiplatform.googleapis.com"
+        transport_cls = AgentBuilderAsyncClient.get_transport_class("grpc_asyncio")
+        channel = transport_cls.create_channel(host, options=GRPC_CHANNEL_OPTIONS)
+        return AgentBuilderAsyncClient(transport=transport_cls(host=host, channel=channel))
+
+    return _get_or_create_for_loop(("agent_builder_async", region), factory)
+
+
+def get_a2a_client(project_id: str, region: str = "us-central1") -> Any:
+    """Return the shared A2A SDK client for a project and region."""
+    def factory() -> Any:
+        from a2a.client import A2AClient
+
+        return A2AClient(project_id=project_id, region=region)
+
+    return _get_or_create(("a2a", project_id, region), factory)
+
+
+def reset_clients() -> None:
+    """Drop all pooled clients (e.g. after a fork or in tests)."""
+    with _lock:
+        _clients.clear()
+        _loop_clients.clear()
@@ -0,0 +1,269 @@
+"""
+In-process validation compiled from the agent-card.json intent schemas.
+
+Most of what the validation agent checks is schema and format rules (required
+fields, lengths, enums, email/date formats, numeric ranges, and the terms and
+parent/guardian consent flags at registration). Those are
+compiled once per process into plain Python checks that run in microseconds.
+Checks that need external state (duplicate email lookups, and whether the
+playerId or parent belongs to the requesting user) are still escalated to the
+remote validation agent (see REMOTE_CHECKS).
+
+Errors use the validation agent's output shape: {field, code, message}.
+Arrays of objects are validated item by item, with fields like games[3].goals.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+AGENT_CARD_PATH = Path(os.getenv(
+    "HUSTLE_AGENT_CARD",
+    Path(__file__).resolve().parent.parent / "config" / "agent-card.json"
+))
+
+# Checks that need external state stay with the validation agent
+REMOTE_CHECKS: Dict[str, List[str]] = {
+    "user_registration": ["duplicate_email"],
+    "player_creation": ["player_ownership"],
+    "game_logging": ["player_ownership"],
+    "game_logging_bulk": ["player_ownership"],
+}
+
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+Error = Dict[str, str]
+FieldCheck = Callable[[str, Any], Optional[Error]]
+
+
+def _error(field: str, code: str, message: str) -> Error:
+    return {"field": field, "code": code, "message": message}
+
+
+def _is_date(value: str) -> bool:
+    try:
+        date.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_uri(value: str) -> bool:
+    parsed = urlparse(value)
+    return bool(parsed.scheme and parsed.netloc)
+
+
+_FORMATS: Dict[str, Callable[[str], bool]] = {
+    "email": lambda value: bool(_EMAIL.match(value)),
+    "date": _is_date,
+    "uri": _is_uri,
+}
+
+_TYPES = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
+
+def _compile_property(schema: Dict[str, Any]) -> List[FieldCheck]:
+    """Turn one property schema into a list of checks (type check first)."""
+    checks: List[FieldCheck] = []
+
+    expected = schema.get("type")
+    if expected in _TYPES:
+        python_type = _TYPES[expected]
+
+        def check_type(field: str, value: Any) -> Optional[Error]:
+            # bool is an int subclass; JSON booleans are not numbers
+            if not isinstance(value, python_type) or (isinstance(value, bool) and expected != "boolean"):
+                return _error(field, "INVALID_TYPE", f"{field} must be a {expected}")
+            return None
+        checks.append(check_type)
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+        checks.append(lambda field, value: _error(
+            field, "TOO_SHORT", f"{field} must be at least {min_length} characters"
+        ) if len(value) < min_length else None)
+
+    if "maxLength" in schema:
+        max_length = schema["maxLength"]
+        checks.append(lambda field, value: _error(
+            field, "TOO_LONG", f"{field} must be at most {max_length} characters"
+        ) if len(value) > max_length else None)
+
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+        checks.append(lambda field, value: _error(
+            field, "INVALID_FORMAT", f"{field} has an invalid format"
+        ) if not pattern.search(value) else None)
+
+    if schema.get("format") in _FORMATS:
+        format_name = schema["format"]
+        is_valid = _FORMATS[format_name]
+        checks.append(lambda field, value: _error(
+            field, "INVALID_FORMAT", f"{field} must be a valid {format_name}"
+        ) if not is_valid(value) else None)
+
+    if "const" in schema:
+        # e.g. agreedToTerms / isParentGuardian must be true at registration
+        const = schema["const"]
+        checks.append(lambda field, value: _error(
+            field, "INVALID_VALUE", f"{field} must be {json.dumps(const)}"
+        ) if value != const else None)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+        checks.append(lambda field, value: _error(
+            field, "INVALID_VALUE", f"{field} must be one of: {', '.join(map(str, allowed))}"
+        ) if value not in allowed else None)
+
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+        checks.append(lambda field, value: _error(
+            field, "TOO_SHORT", f"{field} must have at least {min_items} items"
+        ) if len(value) < min_items else None)
+
+    if "maxItems" in schema:
+        max_items = schema["maxItems"]
+        checks.append(lambda field, value: _error(
+            field, "TOO_LONG", f"{field} must have at most {max_items} items"
+        ) if len(value) > max_items else None)
+
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+        checks.append(lambda field, value: _error(
+            field, "OUT_OF_RANGE", f"{field} must be at least {minimum}"
+        ) if value < minimum else None)
+
+    if "maximum" in schema:
+        maximum = schema["maximum"]
+        checks.append(lambda field, value: _error(
+            field, "OUT_OF_RANGE", f"{field} must be at most {maximum}"
+        ) if value > maximum else None)
+
+    return checks
+
+
+class IntentValidator:
+    """Compiled validator for one intent's input schema"""
+
+    def __init__(self, intent: str, schema: Dict[str, Any]):
+        self.intent = intent
+        self.required = list(schema.get("required", []))
+        self.fields = {
+            name: _compile_property(prop)
+            for name, prop in schema.get("properties", {}).items()
+        }
+        # Arrays of objects (bulk intents): every item is validated
+        self.items = {
+            name: IntentValidator(f"{intent}.{name}", prop["items"])
+            for name, prop in schema.get("properties", {}).items()
+            if prop.get("type") == "array" and prop.get("items", {}).get("type") == "object"
+        }
+
+    def validate(self, data: Any) -> List[Error]:
+        """
+        Validate request data against the schema.
+
+        Args:
+            data: Request data (the intent's `data` object)
+
+        Returns:
+            List of errors; empty if the data is valid
+        """
+        if not isinstance(data, dict):
+            return [_error("data", "INVALID_TYPE", "data must be an object")]
+
+        errors = [
+            _error(field, "REQUIRED", f"{field} is required")
+            for field in self.required
+            if data.get(field) in (None, "")
+        ]
+
+        for field, checks in self.fields.items():
+            value = data.get(field)
+            if value is None or (value == "" and field in self.required):
+                continue
+            for check in checks:
+                error = check(field, value)
+                if error:
+                    errors.append(error)
+                    break  # One error per field; later checks assume the type
+            else:
+                if field in self.items:
+                    errors.extend(self._validate_items(field, value))
+
+        return errors
+
+    def _validate_items(self, field: str, items: List[Any]) -> List[Error]:
+        """Item errors, with fields like games[3].goals."""
+        errors = []
+        for index, item in enumerate(items):
+            for error in self.items[field].validate(item):
+                item_field = f"{field}[{index}]"
+                if error["field"] != "data":
+                    item_field = f"{item_field}.{error['field']}"
+                errors.append(_error(item_field, error["code"], error["message"].replace(
+                    error["field"], item_field, 1
+                )))
+        return errors
+
+
+_validators: Optional[Dict[str, IntentValidator]] = None
+_lock = threading.Lock()
+
+
+def _load_validators() -> Dict[str, IntentValidator]:
+    global _validators
+
+    if _validators is None:
+        with _lock:
+            if _validators is None:
+                try:
+                    card = json.loads(AGENT_CARD_PATH.read_text())
+                    _validators = {
+                        intent["name"]: IntentValidator(intent["name"], intent["input_schema"])
+                        for intent in card.get("intents", [])
+                        if "input_schema" in intent
+                    }
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"Local validation disabled, cannot load agent card: {e}")
+                    _validators = {}
+
+    return _validators
+
+
+def validate_locally(intent: str, data: Any) -> Optional[List[Error]]:
+    """
+    Validate intent data in-process.
+
+    Args:
+        intent: Intent name from agent-card.json
+        data: Request data
+
+    Returns:
+        List of errors (empty if valid), or None if there is no local schema
+        for the intent and the validation agent must be used instead
+    """
+    validator = _load_validators().get(intent)
+    if validator is None:
+        return None
+    return validator.validate(data)
+
+
+def remote_checks(intent: str) -> List[str]:
+    """Checks for an intent that still need the validation agent."""
+    return REMOTE_CHECKS.get(intent, [])
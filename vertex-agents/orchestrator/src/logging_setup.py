@@ -0,0 +1,49 @@
+"""
+Deferred logging setup for the orchestrator.
+
+Building `cloud_logging.Client()` at import time costs a credentials lookup
+and client setup on every cold start, before a request has even arrived.
+Entry points call `ensure_logging()` instead, which attaches the handler once
+on first use.
+
+Backends (HUSTLE_LOG_BACKEND):
+- cloud (default): Google Cloud Logging handler
+- local: stdlib logging to stderr (local runs, benchmarks)
+"""
+
+import logging
+import os
+import threading
+
+LOG_BACKEND = os.getenv("HUSTLE_LOG_BACKEND", "cloud")
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_configured = False
+_lock = threading.Lock()
+
+
+def ensure_logging() -> None:
+    """Attach the configured logging backend (idempotent, thread-safe)."""
+    global _configured
+
+    if _configured:
+        return
+
+    with _lock:
+        if _configured:
+            return
+
+        if LOG_BACKEND == "cloud":
+            try:
+                from google.cloud import logging as cloud_logging
+
+                cloud_logging.Client().setup_logging()
+            except Exception as e:
+                logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+                logging.getLogger(__name__).warning(
+                    f"Cloud Logging unavailable, using local logging: {e}"
+                )
+        else:
+            logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+        _configured = True
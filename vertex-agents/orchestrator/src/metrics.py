@@ -0,0 +1,288 @@
+"""
+Low-overhead metrics for the orchestrator.
+
+Counters and latency histograms are sharded per thread: each worker thread
+updates only its own shard, so the hot path takes no lock (the registry lock
+is taken once per thread, when its shard is created). Reads sum all shards.
+Shards of threads that have exited are folded into one base shard on the
+next read or shard creation, so short-lived threads don't accumulate shards.
+
+Histograms use fixed Prometheus-style buckets and estimate quantiles (p50,
+p99) by interpolating within a bucket, which is accurate to the bucket width.
+
+Export with `REGISTRY.to_prometheus()` (text format 0.0.4) or
+`REGISTRY.to_openmetrics()`.
+"""
+
+import bisect
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Seconds; covers in-process steps (ms) up to sub-agent timeouts (30s)
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 15.0, 20.0, 30.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Sharded:
+    """Per-thread shards of label-keyed state"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str]):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, Dict[LabelValues, object]]] = []
+        # State of threads that have exited
+        self._base: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    def _shard(self) -> Dict[LabelValues, object]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            with self._lock:
+                self._fold_dead_shards()
+                self._shards.append((threading.current_thread(), shard))
+            self._local.shard = shard
+        return shard
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _all_shards(self) -> List[Dict[LabelValues, object]]:
+        with self._lock:
+            self._fold_dead_shards()
+            return [self._base] + [shard for _, shard in self._shards]
+
+    def _fold_dead_shards(self) -> None:
+        """Merge shards of exited threads into the base shard (lock held)."""
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+                continue
+            for key, value in shard.items():
+                # Replace, don't mutate: readers may be summing the base shard
+                self._base[key] = self._combine(self._base.get(key), value)
+        self._shards = live
+
+    def _combine(self, base: Optional[object], value: object) -> object:
+        raise NotImplementedError
+
+
+class Counter(_Sharded):
+    """Monotonic counter family"""
+
+    def _combine(self, base: Optional[float], value: float) -> float:
+        return (base or 0) + value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    def values(self) -> Dict[LabelValues, float]:
+        totals: Dict[LabelValues, float] = {}
+        for shard in self._all_shards():
+            for key, value in list(shard.items()):
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def value(self, **labels: str) -> float:
+        return self.values().get(self._key(labels), 0)
+
+    def total(self) -> float:
+        return sum(self.values().values())
+
+
+class _HistogramState:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * (buckets + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Sharded):
+    """Bucketed latency histogram family"""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def _combine(self, base: Optional[_HistogramState], value: _HistogramState) -> _HistogramState:
+        combined = _HistogramState(len(self.buckets))
+        for state in (base, value):
+            if state is None:
+                continue
+            for index, count in enumerate(state.counts):
+                combined.counts[index] += count
+            combined.sum += state.sum
+            combined.count += state.count
+        return combined
+
+    def observe(self, value: float, **labels: str) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        state = shard.get(key)
+        if state is None:
+            state = shard[key] = _HistogramState(len(self.buckets))
+        state.counts[bisect.bisect_left(self.buckets, value)] += 1
+        state.sum += value
+        state.count += 1
+
+    def merged(self) -> Dict[LabelValues, _HistogramState]:
+        merged: Dict[LabelValues, _HistogramState] = {}
+        for shard in self._all_shards():
+            for key, state in list(shard.items()):
+                merged[key] = self._combine(merged.get(key), state)
+        return merged
+
+    def quantile(self, q: float, **labels: str) -> Optional[float]:
+        """Estimate a quantile (0-1) for one label set, or None without samples."""
+        state = self.merged().get(self._key(labels))
+        if state is None or state.count == 0:
+            return None
+
+        rank = q * state.count
+        cumulative = 0
+        lower = 0.0
+        for index, count in enumerate(state.counts):
+            upper = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+            if count and cumulative + count >= rank:
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = upper
+        return self.buckets[-1]
+
+    def summary(self) -> Dict[LabelValues, Dict[str, float]]:
+        """count, mean, p50 and p99 (seconds) per label set."""
+        result = {}
+        for key, state in self.merged().items():
+            labels = dict(zip(self.label_names, key))
+            result[key] = {
+                "count": state.count,
+                "mean": state.sum / state.count if state.count else 0.0,
+                "p50": self.quantile(0.5, **labels),
+                "p99": self.quantile(0.99, **labels),
+            }
+        return result
+
+
+class MetricsRegistry:
+    """Named metric families with Prometheus / OpenMetrics export"""
+
+    def __init__(self, namespace: str = "hustle"):
+        self.namespace = namespace
+        self._metrics: Dict[str, _Sharded] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Sharded) -> _Sharded:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str, label_names: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(f"{self.namespace}_{name}", help_text, tuple(label_names)))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(
+            Histogram(f"{self.namespace}_{name}", help_text, tuple(label_names), buckets)
+        )
+
+    def _render(self, openmetrics: bool) -> str:
+        lines: List[str] = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        for metric in metrics:
+            if isinstance(metric, Counter):
+                # OpenMetrics names the family without the _total suffix
+                family = metric.name[:-len("_total")] if openmetrics and metric.name.endswith("_total") else metric.name
+                lines.append(f"# HELP {family} {metric.help}")
+                lines.append(f"# TYPE {family} counter")
+                for key, value in sorted(metric.values().items()):
+                    lines.append(f"{metric.name}{_format_labels(metric.label_names, key)} {_format_value(value)}")
+
+            elif isinstance(metric, Histogram):
+                lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} histogram")
+                if openmetrics:
+                    lines.append(f"# UNIT {metric.name} seconds")
+                for key, state in sorted(metric.merged().items()):
+                    cumulative = 0
+                    for index, count in enumerate(state.counts):
+                        cumulative += count
+                        bound = metric.buckets[index] if index < len(metric.buckets) else float("inf")
+                        le = f'le="{_format_value(bound)}"'
+                        lines.append(
+                            f"{metric.name}_bucket{_format_labels(metric.label_names, key, le)} {cumulative}"
+                        )
+                    labels = _format_labels(metric.label_names, key)
+                    lines.append(f"{metric.name}_sum{labels} {_format_value(state.sum)}")
+                    lines.append(f"{metric.name}_count{labels} {state.count}")
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        return self._render(openmetrics=False)
+
+    def to_openmetrics(self) -> str:
+        """OpenMetrics text format (application/openmetrics-text)."""
+        return self._render(openmetrics=True)
+
+
+# Process-wide registry and orchestrator metrics
+REGISTRY = MetricsRegistry()
+
+REQUESTS = REGISTRY.counter(
+    "requests_total", "Orchestrator requests by intent and outcome", ("intent", "outcome")
+)
+REQUEST_LATENCY = REGISTRY.histogram(
+    "request_duration_seconds", "Orchestrator request latency by intent", ("intent",)
+)
+AGENT_CALLS = REGISTRY.counter(
+    "agent_calls_total", "A2A sub-agent calls by agent and status", ("agent", "status")
+)
+AGENT_LATENCY = REGISTRY.histogram(
+    "agent_call_duration_seconds", "A2A sub-agent call latency by agent", ("agent",)
+)
+ADMISSION_REJECTIONS = REGISTRY.counter(
+    "admission_rejections_total", "Requests rejected before execution by intent and reason", ("intent", "reason")
+)
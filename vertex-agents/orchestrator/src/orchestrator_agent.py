@@ -6,21 +6,35 @@ This agent orchestrates all Hustle operations by coordinating sub-agents
 via the Agent-to-Agent (A2A) protocol.
 """
 
+import asyncio
+import functools
+import os
 import uuid
 import time
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from google.cloud import aiplatform
-from google.cloud import firestore
-from google.cloud import logging as cloud_logging
-
-
-# Configure logging
-logging_client = cloud_logging.Client()
-logging_client.setup_logging()
+from admission import get_admission_controller
+from analytics_outbox import FLUSH_BEFORE_RESPONSE, FLUSH_BEFORE_RESPONSE_TIMEOUT_S, AnalyticsOutbox
+from client_pool import A2A_ENDPOINT, get_agent_builder_async_client, get_agent_builder_client
+from local_validation import remote_checks, validate_locally
+from logging_setup import ensure_logging
+from metrics import ADMISSION_REJECTIONS, AGENT_CALLS, AGENT_LATENCY, REGISTRY, REQUESTS, REQUEST_LATENCY
+from resilience import async_call_with_resilience, call_with_resilience
+from response_shaping import get_debug_sink, redact, shape_response
+from singleflight import AsyncSingleFlight, IdempotencyStore, SingleFlight, request_key
+from tracing import ensure_tracing, mark_failed, span, trace_context
+from workflow import Workflow, WorkflowContext, WorkflowNode, WorkflowResult
+
+if TYPE_CHECKING:
+    from google.cloud import firestore
+
+
+# Logging handlers are attached on first use (see logging_setup), and the
+# Google Cloud SDKs are imported when the orchestrator is first built, so
+# importing this module stays cheap on cold start.
 logger = logging.getLogger(__name__)
 
 
@@ -42,14 +56,34 @@ class A2AClient:
     Implements session management, retry logic, and error handling.
     """
 
-    def __init__(self, project_id: str, region: str = "us-central1"):
+    def __init__(
+        self,
+        project_id: str,
+        region: str = "us-central1",
+        db: Optional["firestore.Client"] = None
+    ):
         self.project_id = project_id
         self.region = region
         self.session_id = None
-        self.db = firestore.Client()
+        self._db = db
+        self._db_lock = threading.Lock()
+
+        # Initialize Vertex AI (not used with a local HTTP endpoint)
+        if not A2A_ENDPOINT:
+            from google.cloud import aiplatform
 
-        # Initialize Vertex AI
-        aiplatform.init(project=project_id, location=region)
+            aiplatform.init(project=project_id, location=region)
+
+    @property
+    def db(self) -> "firestore.Client":
+        """Firestore client, created on first use."""
+        if self._db is None:
+            with self._db_lock:
+                if self._db is None:
+                    from google.cloud import firestore
+
+                    self._db = firestore.Client()
+        return self._db
 
     def send_task(
         self,
@@ -72,93 +106,442 @@ class A2AClient:
         Returns:
             Agent response with status and data
         """
-        # Create or reuse session ID
-        if session_id is None:
-            self.session_id = self.session_id or str(uuid.uuid4())
-        else:
-            self.session_id = session_id
+        with span("a2a.send_task", agent=agent_name, timeout_s=timeout) as current:
+            result = self._send_task(agent_name, message, context, session_id, timeout)
+
+            current.set_attribute("status", result["status"])
+            current.set_attribute("duration_ms", result["duration_ms"])
+            if result["status"] != "success":
+                mark_failed(current, result.get("error", "failed"))
+
+            return result
 
+    def _send_task(
+        self,
+        agent_name: str,
+        message: str,
+        context: Optional[Dict[str, Any]],
+        session_id: Optional[str],
+        timeout: int
+    ) -> Dict[str, Any]:
+        agent_endpoint, context, session_id = self._prepare(agent_name, message, context, session_id)
         start_time = time.time()
 
         try:
-            # Construct agent endpoint
-            agent_endpoint = (
-                f"projects/{self.project_id}/"
-                f"locations/{self.region}/"
-                f"agents/hustle-{agent_name}-agent"
+            # Call agent via Vertex AI API
+            # Note: Using Agent Builder API (pooled client, warm channel)
+            client = get_agent_builder_client(self.region)
+
+            # Send task (retries, hedging and circuit breaker per agent)
+            response = call_with_resilience(
+                agent_name,
+                lambda: client.execute_agent(
+                    name=agent_endpoint,
+                    input_text=message,
+                    session_id=session_id,
+                    parameters=context,
+                    timeout=timeout
+                )
             )
 
-            # Prepare payload
-            payload = {
-                "message": message,
-                "session_id": self.session_id,
-                "context": context or {},
-                "config": {
-                    "enable_memory_bank": True,
-                }
-            }
+            return self._succeeded(agent_name, start_time, response, session_id)
 
-            logger.info(
-                f"A2A: Sending task to {agent_name}",
-                extra={
-                    "agent": agent_name,
-                    "session_id": self.session_id,
-                    "payload": payload
-                }
-            )
+        except Exception as e:
+            return self._failed(agent_name, start_time, "failed", e)
 
-            # Call agent via Vertex AI API
-            # Note: Using Agent Builder API
-            from google.cloud.aiplatform_v1 import AgentBuilderClient
-
-            client = AgentBuilderClient()
-
-            # Send task
-            response = client.execute_agent(
-                name=agent_endpoint,
-                input_text=message,
-                session_id=self.session_id,
-                parameters=context or {},
-                timeout=timeout
-            )
+    def _prepare(
+        self,
+        agent_name: str,
+        message: str,
+        context: Optional[Dict[str, Any]],
+        session_id: Optional[str]
+    ) -> Tuple[str, Dict[str, Any], str]:
+        """Resolve endpoint, context and session for one call and log it."""
+        # Sub-agents continue the caller's trace from the payload
+        context = {**(context or {}), "trace_context": trace_context()}
+
+        # Use the caller's session, or this client's default session.
+        # The client is shared across requests, so a request's session is
+        # never stored on it.
+        if session_id is None:
+            self.session_id = self.session_id or str(uuid.uuid4())
+            session_id = self.session_id
 
-            duration_ms = int((time.time() - start_time) * 1000)
+        # Construct agent endpoint
+        agent_endpoint = (
+            f"projects/{self.project_id}/"
+            f"locations/{self.region}/"
+            f"agents/hustle-{agent_name}-agent"
+        )
 
-            logger.info(
-                f"A2A: Received response from {agent_name}",
-                extra={
-                    "agent": agent_name,
-                    "duration_ms": duration_ms,
-                    "status": "success"
-                }
+        # Prepare payload
+        payload = {
+            "message": message,
+            "session_id": session_id,
+            "context": context,
+            "config": {
+                "enable_memory_bank": True,
+            }
+        }
+
+        logger.info(
+            f"A2A: Sending task to {agent_name}",
+            extra={
+                "agent": agent_name,
+                "session_id": session_id
+            }
+        )
+        # Payloads carry user data (passwords at registration): debug only, redacted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"A2A: Payload for {agent_name}",
+                extra={"agent": agent_name, "payload": redact(payload)}
             )
 
-            return {
-                "status": "success",
+        return agent_endpoint, context, session_id
+
+    def _succeeded(
+        self,
+        agent_name: str,
+        start_time: float,
+        response: Any,
+        session_id: str
+    ) -> Dict[str, Any]:
+        duration = time.time() - start_time
+        duration_ms = int(duration * 1000)
+        AGENT_CALLS.inc(agent=agent_name, status="success")
+        AGENT_LATENCY.observe(duration, agent=agent_name)
+
+        logger.info(
+            f"A2A: Received response from {agent_name}",
+            extra={
                 "agent": agent_name,
-                "data": response.output,
                 "duration_ms": duration_ms,
-                "session_id": self.session_id
+                "status": "success"
             }
+        )
 
-        except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            logger.error(
-                f"A2A: Error calling {agent_name}",
-                extra={
-                    "agent": agent_name,
-                    "error": str(e),
-                    "duration_ms": duration_ms
-                }
-            )
+        return {
+            "status": "success",
+            "agent": agent_name,
+            "data": response.output,
+            "duration_ms": duration_ms,
+            "session_id": session_id
+        }
 
-            return {
-                "status": "failed",
+    def _failed(
+        self,
+        agent_name: str,
+        start_time: float,
+        status: str,
+        error: Exception
+    ) -> Dict[str, Any]:
+        duration = time.time() - start_time
+        duration_ms = int(duration * 1000)
+        AGENT_CALLS.inc(agent=agent_name, status=status)
+        AGENT_LATENCY.observe(duration, agent=agent_name)
+
+        logger.error(
+            f"A2A: Error calling {agent_name}",
+            extra={
                 "agent": agent_name,
-                "error": str(e),
+                "error": str(error) or type(error).__name__,
                 "duration_ms": duration_ms
             }
+        )
+
+        return {
+            "status": status,
+            "agent": agent_name,
+            "error": str(error) or type(error).__name__,
+            "duration_ms": duration_ms
+        }
+
+
+class AsyncA2AClient(A2AClient):
+    """
+    A2A client for the asyncio path (HustleOrchestrator.execute_async).
+
+    Calls are awaited on the running event loop through the pooled
+    AgentBuilderAsyncClient, so concurrent requests and workflow fan-out
+    need no threads. Each call gets its own asyncio timeout; a call that
+    times out returns status "timeout".
+    """
+
+    async def send_task(
+        self,
+        agent_name: str,
+        message: str,
+        context: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+        timeout: int = 30
+    ) -> Dict[str, Any]:
+        """Async counterpart of A2AClient.send_task (same response shape)."""
+        with span("a2a.send_task", agent=agent_name, timeout_s=timeout, mode="async") as current:
+            result = await self._send_task(agent_name, message, context, session_id, timeout)
+
+            current.set_attribute("status", result["status"])
+            current.set_attribute("duration_ms", result["duration_ms"])
+            if result["status"] != "success":
+                mark_failed(current, result.get("error", "failed"))
+
+            return result
+
+    async def _send_task(
+        self,
+        agent_name: str,
+        message: str,
+        context: Optional[Dict[str, Any]],
+        session_id: Optional[str],
+        timeout: int
+    ) -> Dict[str, Any]:
+        agent_endpoint, context, session_id = self._prepare(agent_name, message, context, session_id)
+        start_time = time.time()
+
+        try:
+            client = get_agent_builder_async_client(self.region)
+
+            response = await async_call_with_resilience(
+                agent_name,
+                lambda: asyncio.wait_for(
+                    client.execute_agent(
+                        name=agent_endpoint,
+                        input_text=message,
+                        session_id=session_id,
+                        parameters=context,
+                        timeout=timeout
+                    ),
+                    timeout
+                )
+            )
+
+            return self._succeeded(agent_name, start_time, response, session_id)
+
+        except asyncio.TimeoutError as e:
+            return self._failed(agent_name, start_time, "timeout", e)
+        except Exception as e:
+            return self._failed(agent_name, start_time, "failed", e)
+
+
+# ============================================================================
+# INTENT WORKFLOWS
+# ============================================================================
+
+def _require_success(node: str, code: str, default_message: str):
+    """Stop the workflow when a sub-agent call itself failed."""
+    def check(result: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        if result["status"] != "success":
+            return [{
+                "agent": node,
+                "code": code,
+                "message": result.get("error", default_message)
+            }]
+        return None
+    return check
+
+
+def _require_valid(result: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Stop the workflow when the validation agent rejected the data."""
+    if not result.get("data", {}).get("valid", False):
+        return result.get("data", {}).get("errors", [])
+    return None
+
+
+def _require_valid_registration(result: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    errors = _require_success("validation", "VALIDATION_FAILED", "Validation failed")(result)
+    return errors if errors is not None else _require_valid(result)
+
+
+def _escalated_checks(intent: str):
+    """
+    Remote validation is skipped only when local validation covered the
+    intent and it has no REMOTE_CHECKS.
+
+    Otherwise the agent is asked for the external-state checks only (e.g.
+    duplicate email, player ownership), or for full validation if local
+    validation was unavailable.
+    """
+    def validated_locally(ctx: WorkflowContext) -> bool:
+        return ctx.results.get("local_validation", {}).get("status") == "success"
+
+    def skip_if(ctx: WorkflowContext) -> bool:
+        return validated_locally(ctx) and not remote_checks(intent)
+
+    def context(ctx: WorkflowContext) -> Dict[str, Any]:
+        return {"checks": remote_checks(intent)} if validated_locally(ctx) else {}
+
+    return skip_if, context
+
+
+_registration_skip, _registration_checks = _escalated_checks("user_registration")
+_player_skip, _player_checks = _escalated_checks("player_creation")
+_game_skip, _game_checks = _escalated_checks("game_logging")
+_bulk_skip, _bulk_checks = _escalated_checks("game_logging_bulk")
+
+
+def _created(ctx: WorkflowContext, field: str) -> Optional[str]:
+    return ctx.results["creation"].get("data", {}).get(field)
+
+
+USER_REGISTRATION_WORKFLOW = Workflow("user_registration", [
+    WorkflowNode(
+        name="validation",
+        agent="validation",
+        message="Validate user registration data",
+        build_context=lambda ctx: {
+            "intent": "user_registration",
+            "data": ctx.data,
+            **_registration_checks(ctx)
+        },
+        timeout=10,
+        check=_require_valid_registration,
+        skip_if=_registration_skip,
+    ),
+    WorkflowNode(
+        name="creation",
+        agent="user-creation",
+        message="Create new user account",
+        build_context=lambda ctx: {"intent": "user_registration", "data": ctx.data},
+        timeout=15,
+        depends_on=("validation",),
+        check=_require_success("creation", "CREATION_FAILED", "User creation failed"),
+    ),
+    WorkflowNode(
+        name="onboarding",
+        agent="onboarding",
+        message="Send welcome email and verification token",
+        build_context=lambda ctx: {
+            "userId": _created(ctx, "userId"),
+            "email": ctx.data["email"],
+            "firstName": ctx.data["firstName"]
+        },
+        timeout=20,
+        depends_on=("creation",),
+    ),
+])
+
+PLAYER_CREATION_WORKFLOW = Workflow("player_creation", [
+    WorkflowNode(
+        name="validation",
+        agent="validation",
+        message="Validate player creation data",
+        build_context=lambda ctx: {
+            "intent": "player_creation",
+            "data": ctx.data,
+            "userId": ctx.user_id,
+            **_player_checks(ctx)
+        },
+        timeout=10,
+        check=_require_valid,
+        skip_if=_player_skip,
+    ),
+    WorkflowNode(
+        name="creation",
+        agent="user-creation",
+        message="Create new player profile",
+        build_context=lambda ctx: {
+            "intent": "player_creation",
+            "data": ctx.data,
+            "userId": ctx.user_id
+        },
+        timeout=15,
+        depends_on=("validation",),
+        check=_require_success("creation", "CREATION_FAILED", "Player creation failed"),
+    ),
+])
+
+GAME_LOGGING_WORKFLOW = Workflow("game_logging", [
+    WorkflowNode(
+        name="validation",
+        agent="validation",
+        message="Validate game data",
+        build_context=lambda ctx: {
+            "intent": "game_logging",
+            "data": ctx.data,
+            "userId": ctx.user_id,
+            **_game_checks(ctx)
+        },
+        timeout=10,
+        check=_require_valid,
+        skip_if=_game_skip,
+    ),
+    WorkflowNode(
+        name="creation",
+        agent="user-creation",
+        message="Create new game record",
+        build_context=lambda ctx: {
+            "intent": "game_logging",
+            "data": ctx.data,
+            "userId": ctx.user_id
+        },
+        timeout=15,
+        depends_on=("validation",),
+        check=_require_success("creation", "CREATION_FAILED", "Game creation failed"),
+    ),
+])
+
+# Bulk game ingestion: one user-creation call writes a batch of games
+GAME_BATCH_SIZE = int(os.getenv("HUSTLE_GAME_BATCH_SIZE", "100"))
+GAME_BATCH_CONCURRENCY = int(os.getenv("HUSTLE_GAME_BATCH_CONCURRENCY", "4"))
+
+
+def _game_batch_count(games: List[Dict[str, Any]]) -> int:
+    return (len(games) + GAME_BATCH_SIZE - 1) // GAME_BATCH_SIZE
+
+
+def _game_batch(games: List[Dict[str, Any]], index: int) -> List[Dict[str, Any]]:
+    start = index * GAME_BATCH_SIZE
+    return games[start:start + GAME_BATCH_SIZE]
+
+
+@functools.lru_cache(maxsize=64)
+def game_logging_bulk_workflow(batch_count: int) -> Workflow:
+    """
+    Bulk game workflow for a request with batch_count batches.
+
+    Remote validation (the player ownership check once local validation
+    passed) gates every batch. Batch i also waits for batch i - GAME_BATCH_CONCURRENCY, which caps
+    the batches in flight per request. A failed batch does not stop the others.
+    """
+    nodes = [
+        WorkflowNode(
+            name="validation",
+            agent="validation",
+            message="Validate game data",
+            build_context=lambda ctx: {
+                "intent": "game_logging_bulk",
+                "data": ctx.data,
+                "userId": ctx.user_id,
+                **_bulk_checks(ctx)
+            },
+            timeout=10,
+            check=_require_valid,
+            skip_if=_bulk_skip,
+        )
+    ]
+
+    for index in range(batch_count):
+        depends_on: Tuple[str, ...] = ("validation",)
+        if index >= GAME_BATCH_CONCURRENCY:
+            depends_on += (f"batch-{index - GAME_BATCH_CONCURRENCY}",)
+
+        nodes.append(WorkflowNode(
+            name=f"batch-{index}",
+            agent="user-creation",
+            message=f"Create game records (batch {index + 1} of {batch_count})",
+            build_context=lambda ctx, index=index: {
+                "intent": "game_logging_bulk",
+                "data": {"games": _game_batch(ctx.data["games"], index)},
+                "userId": ctx.user_id
+            },
+            timeout=30,
+            depends_on=depends_on,
+        ))
+
+    return Workflow("game_logging_bulk", nodes)
+
+
+_INTENTS = ("user_registration", "player_creation", "game_logging", "game_logging_bulk")
 
 
 class HustleOrchestrator:
@@ -170,16 +553,55 @@ class HustleOrchestrator:
     """
 
     def __init__(self, project_id: str = "hustleapp-production"):
+        ensure_logging()
+        ensure_tracing()
+
         self.project_id = project_id
         self.a2a_client = A2AClient(project_id)
-        self.db = firestore.Client()
-
-        # Performance tracking
-        self.metrics = {
-            "total_requests": 0,
-            "successful_requests": 0,
-            "failed_requests": 0,
-            "avg_execution_time": 0
+
+        # Analytics events are queued and sent in batches off the request path
+        self.analytics = AnalyticsOutbox(self._send_analytics_batch)
+
+        # Bounded concurrency and per-user rate limits (shared per process)
+        self.admission = get_admission_controller()
+
+        # Duplicate submissions share one execution / replay a recent outcome
+        self.single_flight = SingleFlight()
+        self.async_single_flight = AsyncSingleFlight()
+        self.idempotency = IdempotencyStore()
+
+        # Full agent_execution traces (sampled); clients get compact ones
+        self.debug_sink = get_debug_sink()
+
+        # Event-loop client for execute_async (gRPC channel built on first use)
+        self.async_a2a_client = AsyncA2AClient(project_id)
+
+    @property
+    def db(self) -> "firestore.Client":
+        """Firestore client (shared with the A2A client), created on first use."""
+        return self.a2a_client.db
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Request totals from the metrics registry (see metrics.py).
+
+        successful_requests counts requests handled without an orchestration
+        error, including rejected (validation failed) ones.
+        """
+        outcomes: Dict[str, float] = {}
+        for (_, outcome), value in REQUESTS.values().items():
+            outcomes[outcome] = outcomes.get(outcome, 0) + value
+
+        latencies = REQUEST_LATENCY.merged().values()
+        count = sum(state.count for state in latencies)
+        total_seconds = sum(state.sum for state in latencies)
+
+        return {
+            "total_requests": int(sum(outcomes.values())),
+            "successful_requests": int(outcomes.get("success", 0) + outcomes.get("rejected", 0)),
+            "failed_requests": int(outcomes.get("error", 0)),
+            "avg_execution_time": int(total_seconds / count * 1000) if count else 0
         }
 
     def execute(
@@ -197,21 +619,145 @@ class HustleOrchestrator:
             auth: Authentication context (userId, etc.)
 
         Returns:
-            Standardized response with agent execution details
+            Standardized response with compact agent execution details
+            (see response_shaping.py)
         """
-        request_id = str(uuid.uuid4())
-        session_id = str(uuid.uuid4())
-        start_time = time.time()
+        with span(
+            "orchestrator.execute",
+            intent=intent,
+            user_id=auth.get("uid") if auth else None
+        ) as current:
+            rejection = self._admit(intent, auth, current)
+            if rejection is not None:
+                return rejection
+
+            try:
+                key = request_key(intent, data, auth)
+
+                replay = self._replay(intent, key, current)
+                if replay is not None:
+                    return shape_response(replay)
+
+                def run() -> Dict[str, Any]:
+                    result = self._execute(intent, data, auth)
+                    if result.get("success"):
+                        self.idempotency.put(key, result)
+                    return result
+
+                result, shared = self.single_flight.do(key, run)
+                return shape_response(self._coalesced(intent, key, current, result, shared))
+            finally:
+                self.admission.release()
+
+    async def execute_async(
+        self,
+        intent: str,
+        data: Dict[str, Any],
+        auth: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Asyncio entry point: same behavior and response as `execute`.
 
-        logger.info(
-            f"Orchestrator: Received intent {intent}",
+        Sub-agent calls are awaited on the running event loop (AsyncA2AClient),
+        so one Cloud Run instance can serve many concurrent requests without
+        a thread per in-flight call.
+        """
+        with span(
+            "orchestrator.execute",
+            intent=intent,
+            user_id=auth.get("uid") if auth else None,
+            mode="async"
+        ) as current:
+            rejection = self._admit(intent, auth, current)
+            if rejection is not None:
+                return rejection
+
+            try:
+                key = request_key(intent, data, auth)
+
+                replay = self._replay(intent, key, current)
+                if replay is not None:
+                    return shape_response(replay)
+
+                async def run() -> Dict[str, Any]:
+                    result = await self._execute_async(intent, data, auth)
+                    if result.get("success"):
+                        self.idempotency.put(key, result)
+                    return result
+
+                result, shared = await self.async_single_flight.do(key, run)
+                return shape_response(self._coalesced(intent, key, current, result, shared))
+            finally:
+                self.admission.release()
+
+    def _admit(
+        self,
+        intent: str,
+        auth: Optional[Dict[str, Any]],
+        current: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Admission control (see admission.py); returns the rejection response, if any."""
+        error = self.admission.admit(intent, auth.get("uid") if auth else None)
+        if error is None:
+            return None
+
+        # Unknown intents come from callers: keep label cardinality bounded
+        ADMISSION_REJECTIONS.inc(
+            intent=intent if intent in _INTENTS else "unknown", reason=error["code"]
+        )
+        current.set_attribute("admission", error["code"])
+        logger.warning(
+            f"Orchestrator: Rejected {intent} ({error['code']})",
             extra={
                 "intent": intent,
-                "request_id": request_id,
-                "user_id": auth.get("uid") if auth else None
+                "code": error["code"],
+                "retry_after_ms": error["retryAfterMs"]
             }
         )
 
+        return {
+            "success": False,
+            "errors": [error],
+            "agent_execution": {}
+        }
+
+    def _replay(self, intent: str, key: str, current: Any) -> Optional[Dict[str, Any]]:
+        replay = self.idempotency.get(key)
+        if replay is not None:
+            current.set_attribute("coalesced", "replay")
+            logger.info(
+                f"Orchestrator: Replaying recent {intent} outcome",
+                extra={"intent": intent, "idempotency_key": key}
+            )
+        return replay
+
+    def _coalesced(
+        self,
+        intent: str,
+        key: str,
+        current: Any,
+        result: Dict[str, Any],
+        shared: bool
+    ) -> Dict[str, Any]:
+        if shared:
+            current.set_attribute("coalesced", "in_flight")
+            logger.info(
+                f"Orchestrator: Coalesced duplicate {intent} request",
+                extra={"intent": intent, "idempotency_key": key}
+            )
+
+        current.set_attribute("success", bool(result.get("success")))
+        return result
+
+    def _execute(
+        self,
+        intent: str,
+        data: Dict[str, Any],
+        auth: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Run one intent (called once per coalesced request)."""
+        request_id, session_id, start_time = self._received(intent, auth)
+
         try:
             # Route to appropriate handler
             if intent == "user_registration":
@@ -220,50 +766,118 @@ class HustleOrchestrator:
                 result = self._handle_player_creation(data, auth, session_id)
             elif intent == "game_logging":
                 result = self._handle_game_logging(data, auth, session_id)
+            elif intent == "game_logging_bulk":
+                result = self._handle_game_logging_bulk(data, auth, session_id)
             else:
                 raise ValueError(f"Unknown intent: {intent}")
 
-            # Track metrics
-            duration_ms = int((time.time() - start_time) * 1000)
-            self.metrics["total_requests"] += 1
-            self.metrics["successful_requests"] += 1
+            return self._completed(intent, request_id, start_time, result)
 
-            logger.info(
-                f"Orchestrator: Completed {intent}",
-                extra={
-                    "intent": intent,
-                    "request_id": request_id,
-                    "duration_ms": duration_ms,
-                    "success": result.get("success")
-                }
-            )
+        except Exception as e:
+            return self._failed(intent, request_id, start_time, e)
 
-            return result
+    async def _execute_async(
+        self,
+        intent: str,
+        data: Dict[str, Any],
+        auth: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of `_execute`."""
+        request_id, session_id, start_time = self._received(intent, auth)
+
+        try:
+            if intent == "user_registration":
+                result = await self._handle_user_registration_async(data, session_id)
+            elif intent == "player_creation":
+                result = await self._handle_player_creation_async(data, auth, session_id)
+            elif intent == "game_logging":
+                result = await self._handle_game_logging_async(data, auth, session_id)
+            elif intent == "game_logging_bulk":
+                result = await self._handle_game_logging_bulk_async(data, auth, session_id)
+            else:
+                raise ValueError(f"Unknown intent: {intent}")
+
+            return self._completed(intent, request_id, start_time, result)
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            self.metrics["total_requests"] += 1
-            self.metrics["failed_requests"] += 1
-
-            logger.error(
-                f"Orchestrator: Error processing {intent}",
-                extra={
-                    "intent": intent,
-                    "request_id": request_id,
-                    "error": str(e),
-                    "duration_ms": duration_ms
-                }
-            )
+            return self._failed(intent, request_id, start_time, e)
 
-            return {
-                "success": False,
-                "errors": [{
-                    "agent": "orchestrator",
-                    "code": "ORCHESTRATION_ERROR",
-                    "message": str(e)
-                }],
-                "agent_execution": {}
+    def _received(self, intent: str, auth: Optional[Dict[str, Any]]) -> Tuple[str, str, float]:
+        request_id = str(uuid.uuid4())
+        session_id = str(uuid.uuid4())
+
+        logger.info(
+            f"Orchestrator: Received intent {intent}",
+            extra={
+                "intent": intent,
+                "request_id": request_id,
+                "user_id": auth.get("uid") if auth else None
             }
+        )
+
+        return request_id, session_id, time.time()
+
+    def _completed(
+        self,
+        intent: str,
+        request_id: str,
+        start_time: float,
+        result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # Track metrics
+        duration = time.time() - start_time
+        duration_ms = int(duration * 1000)
+        REQUESTS.inc(intent=intent, outcome="success" if result.get("success") else "rejected")
+        REQUEST_LATENCY.observe(duration, intent=intent)
+
+        logger.info(
+            f"Orchestrator: Completed {intent}",
+            extra={
+                "intent": intent,
+                "request_id": request_id,
+                "duration_ms": duration_ms,
+                "success": result.get("success")
+            }
+        )
+        self.debug_sink.record(intent, request_id, result, duration_ms)
+
+        return result
+
+    def _failed(
+        self,
+        intent: str,
+        request_id: str,
+        start_time: float,
+        error: Exception
+    ) -> Dict[str, Any]:
+        duration = time.time() - start_time
+        duration_ms = int(duration * 1000)
+        # Unknown intents come from callers: keep label cardinality bounded
+        intent_label = intent if intent in _INTENTS else "unknown"
+        REQUESTS.inc(intent=intent_label, outcome="error")
+        REQUEST_LATENCY.observe(duration, intent=intent_label)
+
+        logger.error(
+            f"Orchestrator: Error processing {intent}",
+            extra={
+                "intent": intent,
+                "request_id": request_id,
+                "error": str(error),
+                "duration_ms": duration_ms
+            }
+        )
+
+        result = {
+            "success": False,
+            "errors": [{
+                "agent": "orchestrator",
+                "code": "ORCHESTRATION_ERROR",
+                "message": str(error)
+            }],
+            "agent_execution": {}
+        }
+        self.debug_sink.record(intent, request_id, result, duration_ms)
+        return result
 
     def _handle_user_registration(
         self,
@@ -273,106 +887,56 @@ class HustleOrchestrator:
         """
         Handle user registration flow.
 
-        Workflow:
-        1. Validation Agent (sequential)
-        2. User Creation Agent (sequential)
-        3. Onboarding + Analytics Agents (parallel)
-        """
-        agent_results = {}
-
-        # Step 1: Validation (sequential)
-        validation_result = self.a2a_client.send_task(
-            agent_name="validation",
-            message="Validate user registration data",
-            context={
-                "intent": "user_registration",
-                "data": data
-            },
-            session_id=session_id,
-            timeout=10
-        )
-
-        agent_results["validation"] = validation_result
+        Workflow (USER_REGISTRATION_WORKFLOW):
+        1. Local schema validation, then the Validation Agent for the
+           duplicate email check only
+        2. User Creation Agent
+        3. Onboarding Agent
 
-        if validation_result["status"] != "success":
-            return {
-                "success": False,
-                "errors": [{
-                    "agent": "validation",
-                    "code": "VALIDATION_FAILED",
-                    "message": validation_result.get("error", "Validation failed")
-                }],
-                "agent_execution": agent_results
-            }
+        The analytics event is queued on the outbox, not awaited.
+        """
+        ctx, rejection = self._prepare("user_registration", data, None, session_id)
+        if rejection:
+            return rejection
 
-        # Check if validation actually passed
-        if not validation_result.get("data", {}).get("valid", False):
-            return {
-                "success": False,
-                "errors": validation_result.get("data", {}).get("errors", []),
-                "agent_execution": agent_results
-            }
+        run = USER_REGISTRATION_WORKFLOW.run(self.a2a_client.send_task, ctx)
+        return self._registration_result(data, session_id, run)
 
-        # Step 2: User Creation (sequential)
-        creation_result = self.a2a_client.send_task(
-            agent_name="user-creation",
-            message="Create new user account",
-            context={
-                "intent": "user_registration",
-                "data": data
-            },
-            session_id=session_id,
-            timeout=15
-        )
+    async def _handle_user_registration_async(
+        self,
+        data: Dict[str, Any],
+        session_id: str
+    ) -> Dict[str, Any]:
+        """Handle user registration flow on the event loop."""
+        ctx, rejection = self._prepare("user_registration", data, None, session_id)
+        if rejection:
+            return rejection
 
-        agent_results["creation"] = creation_result
+        run = await USER_REGISTRATION_WORKFLOW.run_async(self.async_a2a_client.send_task, ctx)
+        return self._registration_result(data, session_id, run)
 
-        if creation_result["status"] != "success":
+    def _registration_result(
+        self,
+        data: Dict[str, Any],
+        session_id: str,
+        run: WorkflowResult
+    ) -> Dict[str, Any]:
+        if not run.success:
             return {
                 "success": False,
-                "errors": [{
-                    "agent": "creation",
-                    "code": "CREATION_FAILED",
-                    "message": creation_result.get("error", "User creation failed")
-                }],
-                "agent_execution": agent_results
+                "errors": run.errors,
+                "agent_execution": run.agent_execution
             }
 
-        user_id = creation_result.get("data", {}).get("userId")
-
-        # Step 3: Onboarding + Analytics (parallel)
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            # Submit onboarding task
-            onboarding_future = executor.submit(
-                self.a2a_client.send_task,
-                agent_name="onboarding",
-                message="Send welcome email and verification token",
-                context={
-                    "userId": user_id,
-                    "email": data["email"],
-                    "firstName": data["firstName"]
-                },
-                session_id=session_id,
-                timeout=20
-            )
-
-            # Submit analytics task
-            analytics_future = executor.submit(
-                self.a2a_client.send_task,
-                agent_name="analytics",
-                message="Track user registration event",
-                context={
-                    "event": "user_registration",
-                    "userId": user_id,
-                    "metadata": {"email": data["email"]}
-                },
-                session_id=session_id,
-                timeout=10
-            )
+        user_id = run.results["creation"].get("data", {}).get("userId")
 
-            # Wait for completion
-            agent_results["onboarding"] = onboarding_future.result()
-            agent_results["analytics"] = analytics_future.result()
+        agent_execution = run.agent_execution
+        agent_execution["analytics"] = self._track_event(
+            "user_registration",
+            user_id=user_id,
+            metadata={"email": data["email"]},
+            sessionId=session_id
+        )
 
         # Aggregate results
         return {
@@ -380,10 +944,10 @@ class HustleOrchestrator:
             "data": {
                 "userId": user_id,
                 "email": data["email"],
-                "emailVerificationSent": agent_results["onboarding"].get("data", {}).get("emailSent", False)
+                "emailVerificationSent": run.results["onboarding"].get("data", {}).get("emailSent", False)
             },
             "message": "Account created successfully. Please check your email to verify your account.",
-            "agent_execution": agent_results
+            "agent_execution": agent_execution
         }
 
     def _handle_player_creation(
@@ -392,84 +956,332 @@ class HustleOrchestrator:
         auth: Dict[str, Any],
         session_id: str
     ) -> Dict[str, Any]:
-        """Handle player creation flow."""
-        agent_results = {}
-        user_id = auth.get("uid")
-
-        # Step 1: Validation
-        validation_result = self.a2a_client.send_task(
-            agent_name="validation",
-            message="Validate player creation data",
-            context={
-                "intent": "player_creation",
-                "data": data,
-                "userId": user_id
-            },
-            session_id=session_id,
-            timeout=10
-        )
+        """
+        Handle player creation flow.
+
+        Workflow (PLAYER_CREATION_WORKFLOW):
+        1. Local schema validation (Validation Agent only if unavailable)
+        2. User Creation Agent
 
-        agent_results["validation"] = validation_result
+        The analytics event is queued on the outbox, not awaited.
+        """
+        ctx, rejection = self._prepare("player_creation", data, auth, session_id)
+        if rejection:
+            return rejection
 
-        if not validation_result.get("data", {}).get("valid", False):
+        run = PLAYER_CREATION_WORKFLOW.run(self.a2a_client.send_task, ctx)
+        return self._player_result(data, auth, session_id, run)
+
+    async def _handle_player_creation_async(
+        self,
+        data: Dict[str, Any],
+        auth: Dict[str, Any],
+        session_id: str
+    ) -> Dict[str, Any]:
+        """Handle player creation flow on the event loop."""
+        ctx, rejection = self._prepare("player_creation", data, auth, session_id)
+        if rejection:
+            return rejection
+
+        run = await PLAYER_CREATION_WORKFLOW.run_async(self.async_a2a_client.send_task, ctx)
+        return self._player_result(data, auth, session_id, run)
+
+    def _player_result(
+        self,
+        data: Dict[str, Any],
+        auth: Dict[str, Any],
+        session_id: str,
+        run: WorkflowResult
+    ) -> Dict[str, Any]:
+        if not run.success:
             return {
                 "success": False,
-                "errors": validation_result.get("data", {}).get("errors", []),
-                "agent_execution": agent_results
+                "errors": run.errors,
+                "agent_execution": run.agent_execution
             }
 
-        # Step 2: Player Creation
-        creation_result = self.a2a_client.send_task(
-            agent_name="user-creation",
-            message="Create new player profile",
-            context={
-                "intent": "player_creation",
-                "data": data,
-                "userId": user_id
+        player_id = run.results["creation"].get("data", {}).get("playerId")
+
+        agent_execution = run.agent_execution
+        agent_execution["analytics"] = self._track_event(
+            "player_creation",
+            user_id=auth.get("uid"),
+            metadata={"position": data.get("position")},
+            playerId=player_id,
+            sessionId=session_id
+        )
+
+        return {
+            "success": True,
+            "data": {
+                "playerId": player_id,
+                "name": data["name"]
             },
+            "agent_execution": agent_execution
+        }
+
+    def _prepare(
+        self,
+        intent: str,
+        data: Dict[str, Any],
+        auth: Optional[Dict[str, Any]],
+        session_id: str
+    ) -> Tuple[Optional[WorkflowContext], Optional[Dict[str, Any]]]:
+        """
+        Validate locally and build the workflow context.
+
+        Returns:
+            (context, None) to run the workflow, or (None, rejection response)
+        """
+        local_result = self._validate_locally(intent, data)
+        if local_result["status"] == "failed":
+            return None, {
+                "success": False,
+                "errors": local_result["data"]["errors"],
+                "agent_execution": {"local_validation": local_result}
+            }
+
+        return WorkflowContext(
+            data=data,
+            auth=auth,
             session_id=session_id,
-            timeout=15
-        )
+            results={"local_validation": local_result}
+        ), None
+
+    def _validate_locally(self, intent: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the agent-card schema checks in-process, shaped like an agent result."""
+        start_time = time.perf_counter()
+        errors = validate_locally(intent, data)
+        duration_ms = round((time.perf_counter() - start_time) * 1000, 3)
+
+        if errors is None:
+            return {"status": "unavailable", "agent": "local_validation"}
 
-        agent_results["creation"] = creation_result
+        return {
+            "status": "failed" if errors else "success",
+            "agent": "local_validation",
+            "data": {"valid": not errors, "errors": errors},
+            "duration_ms": duration_ms
+        }
 
-        player_id = creation_result.get("data", {}).get("playerId")
+    def _track_event(
+        self,
+        event: str,
+        user_id: Optional[str],
+        metadata: Dict[str, Any],
+        **fields: Any
+    ) -> Dict[str, Any]:
+        """Queue an analytics event and return its agent_execution entry."""
+        queued = self.analytics.enqueue(event, user_id=user_id, metadata=metadata, **fields)
+        return {"status": "queued" if queued else "dropped", "agent": "analytics"}
 
-        # Step 3: Analytics (async)
-        analytics_result = self.a2a_client.send_task(
+    def _send_analytics_batch(self, events: List[Dict[str, Any]]) -> bool:
+        """Deliver a batch of queued analytics events in one A2A call."""
+        result = self.a2a_client.send_task(
             agent_name="analytics",
-            message="Track player creation event",
-            context={
-                "event": "player_creation",
-                "userId": user_id,
-                "playerId": player_id,
-                "metadata": {"position": data.get("position")}
-            },
-            session_id=session_id,
+            message=f"Track {len(events)} analytics events",
+            context={"events": events},
             timeout=10
         )
+        return result["status"] == "success"
+
+    def _handle_game_logging(
+        self,
+        data: Dict[str, Any],
+        auth: Dict[str, Any],
+        session_id: str
+    ) -> Dict[str, Any]:
+        """
+        Handle game logging flow.
+
+        Workflow (GAME_LOGGING_WORKFLOW):
+        1. Local schema validation (Validation Agent only if unavailable)
+        2. User Creation Agent (game record)
+
+        The analytics event is queued on the outbox, not awaited.
+        """
+        ctx, rejection = self._prepare("game_logging", data, auth, session_id)
+        if rejection:
+            return rejection
 
-        agent_results["analytics"] = analytics_result
+        run = GAME_LOGGING_WORKFLOW.run(self.a2a_client.send_task, ctx)
+        return self._game_result(data, auth, session_id, run)
+
+    async def _handle_game_logging_async(
+        self,
+        data: Dict[str, Any],
+        auth: Dict[str, Any],
+        session_id: str
+    ) -> Dict[str, Any]:
+        """Handle game logging flow on the event loop."""
+        ctx, rejection = self._prepare("game_logging", data, auth, session_id)
+        if rejection:
+            return rejection
+
+        run = await GAME_LOGGING_WORKFLOW.run_async(self.async_a2a_client.send_task, ctx)
+        return self._game_result(data, auth, session_id, run)
+
+    def _game_result(
+        self,
+        data: Dict[str, Any],
+        auth: Dict[str, Any],
+        session_id: str,
+        run: WorkflowResult
+    ) -> Dict[str, Any]:
+        if not run.success:
+            return {
+                "success": False,
+                "errors": run.errors,
+                "agent_execution": run.agent_execution
+            }
+
+        game_id = run.results["creation"].get("data", {}).get("gameId")
+
+        agent_execution = run.agent_execution
+        agent_execution["analytics"] = self._track_event(
+            "game_logging",
+            user_id=auth.get("uid") if auth else None,
+            metadata={"gameId": game_id},
+            playerId=data["playerId"],
+            sessionId=session_id
+        )
 
         return {
             "success": True,
             "data": {
-                "playerId": player_id,
-                "name": data["name"]
+                "gameId": game_id,
+                "playerId": data["playerId"]
             },
-            "agent_execution": agent_results
+            "agent_execution": agent_execution
         }
 
-    def _handle_game_logging(
+    def _handle_game_logging_bulk(
+        self,
+        data: Dict[str, Any],
+        auth: Dict[str, Any],
+        session_id: str
+    ) -> Dict[str, Any]:
+        """
+        Handle bulk game ingestion (e.g. a tournament weekend in one request).
+
+        Every game is validated before anything is written, so one invalid
+        game rejects the whole upload. Games are then written in batches of
+        GAME_BATCH_SIZE per User Creation Agent call (see
+        game_logging_bulk_workflow), and one analytics event is queued for
+        the whole upload.
+        """
+        ctx, rejection = self._prepare("game_logging_bulk", data, auth, session_id)
+        if rejection:
+            return rejection
+
+        workflow = game_logging_bulk_workflow(_game_batch_count(data["games"]))
+        run = workflow.run(self.a2a_client.send_task, ctx)
+        return self._bulk_game_result(data, auth, session_id, run)
+
+    async def _handle_game_logging_bulk_async(
         self,
         data: Dict[str, Any],
         auth: Dict[str, Any],
         session_id: str
     ) -> Dict[str, Any]:
-        """Handle game logging flow."""
-        # Similar structure to player_creation
-        # Implementation follows same pattern
-        pass
+        """Handle bulk game ingestion on the event loop."""
+        ctx, rejection = self._prepare("game_logging_bulk", data, auth, session_id)
+        if rejection:
+            return rejection
+
+        workflow = game_logging_bulk_workflow(_game_batch_count(data["games"]))
+        run = await workflow.run_async(self.async_a2a_client.send_task, ctx)
+        return self._bulk_game_result(data, auth, session_id, run)
+
+    def _bulk_game_result(
+        self,
+        data: Dict[str, Any],
+        auth: Dict[str, Any],
+        session_id: str,
+        run: WorkflowResult
+    ) -> Dict[str, Any]:
+        """
+        Collect game IDs in input order.
+
+        A failed batch leaves None for its games and adds an error naming the
+        games[start:end] slice to resend; other batches are still reported.
+        """
+        if not run.success:
+            return {
+                "success": False,
+                "errors": run.errors,
+                "agent_execution": run.agent_execution
+            }
+
+        games = data["games"]
+        game_ids: List[Optional[str]] = [None] * len(games)
+        errors = []
+
+        for index in range(_game_batch_count(games)):
+            start = index * GAME_BATCH_SIZE
+            batch = _game_batch(games, index)
+            result = run.results[f"batch-{index}"]
+            ids = result.get("data", {}).get("gameIds") if result["status"] == "success" else None
+
+            if isinstance(ids, list) and len(ids) == len(batch):
+                game_ids[start:start + len(batch)] = ids
+            else:
+                errors.append({
+                    "agent": f"batch-{index}",
+                    "field": f"games[{start}:{start + len(batch)}]",
+                    "code": "CREATION_FAILED",
+                    "message": result.get("error", "Game batch creation failed")
+                })
+
+        created = [game for game, game_id in zip(games, game_ids) if game_id]
+
+        agent_execution = run.agent_execution
+        if created:
+            agent_execution["analytics"] = self._track_event(
+                "game_logging_bulk",
+                user_id=auth.get("uid") if auth else None,
+                metadata={
+                    "games": len(created),
+                    "players": len({game["playerId"] for game in created}),
+                    "batches": _game_batch_count(games)
+                },
+                sessionId=session_id
+            )
+
+        response = {
+            "success": not errors,
+            "data": {
+                "gameIds": game_ids,
+                "created": len(created),
+                "failed": len(games) - len(created)
+            },
+            "agent_execution": agent_execution
+        }
+        if errors:
+            response["errors"] = errors
+        return response
+
+
+# One orchestrator per worker process: Firestore clients, Vertex AI init and
+# metrics are created once and reused by every request
+_orchestrator: Optional[HustleOrchestrator] = None
+_orchestrator_lock = threading.Lock()
+
+
+def get_orchestrator(project_id: str = "hustleapp-production") -> HustleOrchestrator:
+    """
+    Return the process-wide HustleOrchestrator, creating it on first use.
+
+    Call this at worker startup to move the cold work out of the first request.
+    """
+    global _orchestrator
+
+    if _orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                _orchestrator = HustleOrchestrator(project_id=project_id)
+
+    return _orchestrator
 
 
 # Main entry point for Cloud Functions / Cloud Run
@@ -479,10 +1291,58 @@ def handle_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
 
     Called by Cloud Functions or Cloud Run.
     """
-    orchestrator = HustleOrchestrator(project_id="hustleapp-production")
+    ensure_logging()
+    orchestrator = get_orchestrator(project_id="hustleapp-production")
+
+    intent = request_data.get("intent")
+    data = request_data.get("data")
+    auth = request_data.get("auth")
+
+    response = orchestrator.execute(intent=intent, data=data, auth=auth)
+
+    # Request-billed runtimes give the outbox thread no CPU after we return
+    if FLUSH_BEFORE_RESPONSE:
+        orchestrator.analytics.flush(FLUSH_BEFORE_RESPONSE_TIMEOUT_S)
+
+    return response
+
+
+async def handle_request_async(request_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Async entry point for ASGI servers (one event loop per worker).
+
+    Same request and response shape as handle_request.
+    """
+    ensure_logging()
+    orchestrator = get_orchestrator(project_id="hustleapp-production")
 
     intent = request_data.get("intent")
     data = request_data.get("data")
     auth = request_data.get("auth")
 
-    return orchestrator.execute(intent=intent, data=data, auth=auth)
+    response = await orchestrator.execute_async(intent=intent, data=data, auth=auth)
+
+    if FLUSH_BEFORE_RESPONSE:
+        await asyncio.get_running_loop().run_in_executor(
+            None, orchestrator.analytics.flush, FLUSH_BEFORE_RESPONSE_TIMEOUT_S
+        )
+
+    return response
+
+
+def handle_metrics_request(accept: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Metrics scrape endpoint for Cloud Run.
+
+    Args:
+        accept: Request Accept header; OpenMetrics is served if requested
+
+    Returns:
+        (body, content_type)
+    """
+    if accept and "application/openmetrics-text" in accept:
+        return (
+            REGISTRY.to_openmetrics(),
+            "application/openmetrics-text; version=1.0.0; charset=utf-8"
+        )
+    return REGISTRY.to_prometheus(), "text/plain; version=0.0.4; charset=utf-8"
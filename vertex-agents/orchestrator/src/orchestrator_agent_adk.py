@@ -6,26 +6,48 @@ This is the ADK SDK implementation that will replace the custom implementation
 in orchestrator_agent.py. Uses google-adk package for simplified agent development.
 """
 
+import asyncio
+import os
 import uuid
 import time
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Coroutine, Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 
-from google.adk import Agent, Runner
-from google.adk.tools import FunctionTool
-from google.adk.sessions import InMemorySessionService
-from google.genai.types import Content, Part
-from a2a.client import A2AClient
-from google.cloud import firestore
-from google.cloud import logging as cloud_logging
-
-
-# Configure logging
-logging_client = cloud_logging.Client()
-logging_client.setup_logging()
+from admission import INTENT_LANES, get_admission_controller
+from analytics_outbox import FLUSH_BEFORE_RESPONSE, FLUSH_BEFORE_RESPONSE_TIMEOUT_S, AnalyticsOutbox
+from client_pool import get_a2a_client
+from local_validation import validate_locally
+from logging_setup import ensure_logging
+from metrics import ADMISSION_REJECTIONS, AGENT_CALLS, AGENT_LATENCY
+from resilience import call_with_resilience
+from response_shaping import get_debug_sink, shape_response
+from tracing import ensure_tracing, mark_failed, span, trace_context
+
+try:
+    from tools.adk_docs_crawler.docs_index import load_search_tool
+except ImportError:
+    try:  # orchestrator/src deployed on its own, with docs_index.py copied in
+        from docs_index import load_search_tool
+    except ImportError:
+        load_search_tool = None
+
+if TYPE_CHECKING:
+    from google.adk import Agent, Runner
+    from google.adk.sessions import BaseSessionService
+
+
+# Logging handlers are attached on first use (see logging_setup), and ADK is
+# imported when the agent is first built, so importing this module stays
+# cheap on cold start.
 logger = logging.getLogger(__name__)
 
+# direct: known intents run their fixed tool sequence without the LLM
+# llm: every intent is turned into a prompt for the ADK agent
+EXECUTION_MODE = os.getenv("HUSTLE_ADK_EXECUTION_MODE", "direct")
+
 
 @dataclass
 class AgentResponse:
@@ -58,11 +80,31 @@ def send_task_to_agent(
     Returns:
         Dict with status, agent name, data/error, duration_ms, session_id
     """
+    with span("a2a.send_task", agent=agent_name, timeout_s=timeout) as current:
+        result = _send_task_to_agent(agent_name, message, context, session_id, timeout)
+
+        current.set_attribute("status", result["status"])
+        current.set_attribute("duration_ms", result["duration_ms"])
+        if result["status"] != "success":
+            mark_failed(current, result.get("error", "failed"))
+
+        return result
+
+
+def _send_task_to_agent(
+    agent_name: str,
+    message: str,
+    context: Optional[Dict[str, Any]],
+    session_id: Optional[str],
+    timeout: int
+) -> Dict[str, Any]:
+    # Sub-agents continue the caller's trace from the payload
+    context = {**(context or {}), "trace_context": trace_context()}
     start_time = time.time()
 
     try:
-        # Initialize A2A client
-        a2a_client = A2AClient(
+        # Shared A2A client (built once per process)
+        a2a_client = get_a2a_client(
             project_id="hustleapp-production",
             region="us-central1"
         )
@@ -80,16 +122,22 @@ def send_task_to_agent(
             }
         )
 
-        # Send task via A2A SDK
-        response = a2a_client.send_task(
-            agent_name=f"hustle-{agent_name}-agent",
-            message=message,
-            context=context or {},
-            session_id=session_id,
-            timeout=timeout
+        # Send task via A2A SDK (retries, hedging and circuit breaker per agent)
+        response = call_with_resilience(
+            agent_name,
+            lambda: a2a_client.send_task(
+                agent_name=f"hustle-{agent_name}-agent",
+                message=message,
+                context=context or {},
+                session_id=session_id,
+                timeout=timeout
+            )
         )
 
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration = time.time() - start_time
+        duration_ms = int(duration * 1000)
+        AGENT_CALLS.inc(agent=agent_name, status="success")
+        AGENT_LATENCY.observe(duration, agent=agent_name)
 
         logger.info(
             f"A2A Tool: Received response from {agent_name}",
@@ -109,7 +157,10 @@ def send_task_to_agent(
         }
 
     except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration = time.time() - start_time
+        duration_ms = int(duration * 1000)
+        AGENT_CALLS.inc(agent=agent_name, status="failed")
+        AGENT_LATENCY.observe(duration, agent=agent_name)
 
         logger.error(
             f"A2A Tool: Error calling {agent_name}",
@@ -279,31 +330,529 @@ def track_analytics_event(
     )
 
 
-# Create ADK Agent with wrapped tools
-hustle_orchestrator = Agent(
-    name="hustle_operations_manager",
-    description="""
-    Hustle Operations Manager - Main Orchestrator
+# ============================================================================
+# DIRECT EXECUTION
+# ============================================================================
+# Known intents have fixed steps, so the tools above are called in order
+# without model turns. The LLM is reserved for free-form requests.
+# Analytics events are queued on an outbox and sent in batches off the
+# request path, as in orchestrator_agent.py.
+
+_analytics: Optional[AnalyticsOutbox] = None
+_analytics_lock = threading.Lock()
+
+
+def _send_analytics_batch(events: List[Dict[str, Any]]) -> bool:
+    """Deliver a batch of queued analytics events in one A2A call."""
+    result = send_task_to_agent(
+        agent_name="analytics",
+        message=f"Track {len(events)} analytics events",
+        context={"events": events},
+        timeout=10
+    )
+    return result["status"] == "success"
+
+
+def get_analytics_outbox() -> AnalyticsOutbox:
+    """Return the process-wide analytics outbox, creating it on first use."""
+    global _analytics
+
+    if _analytics is None:
+        with _analytics_lock:
+            if _analytics is None:
+                _analytics = AnalyticsOutbox(_send_analytics_batch)
+
+    return _analytics
+
+
+def _track_event(
+    event: str,
+    user_id: Optional[str],
+    metadata: Dict[str, Any],
+    **fields: Any
+) -> Dict[str, Any]:
+    """Queue an analytics event and return its agent_execution entry."""
+    queued = get_analytics_outbox().enqueue(event, user_id=user_id, metadata=metadata, **fields)
+    return {"status": "queued" if queued else "dropped", "agent": "analytics"}
+
 
-    Coordinates all Hustle operations by routing requests to appropriate
-    sub-agents and aggregating their responses. Handles user registration,
-    player creation, game logging, and other core operations.
+class _StepFailed(Exception):
+    """A step's result ends the intent with errors"""
 
-    Uses Agent-to-Agent (A2A) protocol to communicate with sub-agents:
-    - Validation Agent: Data validation
-    - User Creation Agent: Account/player creation
-    - Onboarding Agent: Welcome emails, verification
-    - Analytics Agent: Event tracking
-    """,
-    tools=[
+    def __init__(self, errors: List[Dict[str, Any]]):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def _result_data(result: Dict[str, Any]) -> Dict[str, Any]:
+    data = result.get("data")
+    return data if isinstance(data, dict) else {}
+
+
+def _require_success(result: Dict[str, Any], step: str, code: str, message: str) -> Dict[str, Any]:
+    if result["status"] != "success":
+        raise _StepFailed([{
+            "agent": step,
+            "code": code,
+            "message": result.get("error", message)
+        }])
+    return _result_data(result)
+
+
+def _require_valid(result: Dict[str, Any]) -> None:
+    data = _require_success(result, "validation", "VALIDATION_FAILED", "Validation failed")
+    if not data.get("valid", False):
+        raise _StepFailed(data.get("errors", []))
+
+
+def _run_user_registration(
+    data: Dict[str, Any],
+    auth: Optional[Dict[str, Any]],
+    session_id: str,
+    steps: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Validate → create account → onboarding email (analytics queued)."""
+    account = {
+        "email": data["email"],
+        "password": data["password"],
+        "first_name": data["firstName"],
+        "last_name": data["lastName"],
+        "agreed_to_terms": data.get("agreedToTerms", False),
+        "is_parent_guardian": data.get("isParentGuardian", False),
+        "session_id": session_id
+    }
+
+    steps["validation"] = validate_user_registration(**account)
+    _require_valid(steps["validation"])
+
+    steps["creation"] = create_user_account(**account)
+    user_id = _require_success(
+        steps["creation"], "creation", "CREATION_FAILED", "User creation failed"
+    ).get("userId")
+
+    steps["analytics"] = _track_event(
+        "user_registration",
+        user_id=user_id,
+        metadata={"email": data["email"]},
+        sessionId=session_id
+    )
+    steps["onboarding"] = send_onboarding_email(
+        user_id=user_id,
+        email=data["email"],
+        first_name=data["firstName"],
+        session_id=session_id
+    )
+
+    return {
+        "userId": user_id,
+        "email": data["email"],
+        "emailVerificationSent": _result_data(steps["onboarding"]).get("emailSent", False)
+    }
+
+
+def _validate_and_create(
+    intent: str,
+    noun: str,
+    id_field: str,
+    data: Dict[str, Any],
+    user_id: Optional[str],
+    session_id: str,
+    steps: Dict[str, Any]
+) -> Optional[str]:
+    """Validate → create a player profile or game record; returns its ID."""
+    context = {"intent": intent, "data": data, "userId": user_id}
+
+    steps["validation"] = send_task_to_agent(
+        agent_name="validation",
+        message=f"Validate {noun} data",
+        context=context,
+        session_id=session_id,
+        timeout=10
+    )
+    _require_valid(steps["validation"])
+
+    steps["creation"] = send_task_to_agent(
+        agent_name="user-creation",
+        message=f"Create new {noun}",
+        context=context,
+        session_id=session_id,
+        timeout=15
+    )
+    return _require_success(
+        steps["creation"], "creation", "CREATION_FAILED", f"{noun.capitalize()} creation failed"
+    ).get(id_field)
+
+
+def _run_player_creation(
+    data: Dict[str, Any],
+    auth: Optional[Dict[str, Any]],
+    session_id: str,
+    steps: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Validate → create player profile (analytics queued)."""
+    user_id = auth.get("uid") if auth else None
+    player_id = _validate_and_create(
+        "player_creation", "player profile", "playerId", data, user_id, session_id, steps
+    )
+
+    steps["analytics"] = _track_event(
+        "player_creation",
+        user_id=user_id,
+        metadata={"position": data.get("position")},
+        playerId=player_id,
+        sessionId=session_id
+    )
+
+    return {"playerId": player_id, "name": data["name"]}
+
+
+def _run_game_logging(
+    data: Dict[str, Any],
+    auth: Optional[Dict[str, Any]],
+    session_id: str,
+    steps: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Validate → create game record (analytics queued)."""
+    user_id = auth.get("uid") if auth else None
+    game_id = _validate_and_create(
+        "game_logging", "game record", "gameId", data, user_id, session_id, steps
+    )
+
+    steps["analytics"] = _track_event(
+        "game_logging",
+        user_id=user_id,
+        metadata={"gameId": game_id},
+        playerId=data["playerId"],
+        sessionId=session_id
+    )
+
+    return {"gameId": game_id, "playerId": data["playerId"]}
+
+
+_DIRECT_INTENTS = {
+    "user_registration": _run_user_registration,
+    "player_creation": _run_player_creation,
+    "game_logging": _run_game_logging,
+}
+
+
+def _execute_direct(
+    intent: str,
+    data: Dict[str, Any],
+    auth: Optional[Dict[str, Any]],
+    request_id: str,
+    session_id: str
+) -> Dict[str, Any]:
+    """Run a known intent's tool sequence without the LLM."""
+    steps: Dict[str, Any] = {}
+
+    with span("orchestrator.execute", intent=intent, mode="direct") as current:
+        try:
+            result_data = _DIRECT_INTENTS[intent](data, auth, session_id, steps)
+        except _StepFailed as e:
+            current.set_attribute("success", False)
+            return {
+                "success": False,
+                "errors": e.errors,
+                "session_id": session_id,
+                "agent_execution": steps
+            }
+        current.set_attribute("success", True)
+
+    logger.info(
+        f"ADK Orchestrator: Completed {intent} (direct)",
+        extra={
+            "intent": intent,
+            "request_id": request_id,
+            "session_id": session_id
+        }
+    )
+
+    return {
+        "success": True,
+        "data": result_data,
+        "session_id": session_id,
+        "agent_execution": steps
+    }
+
+
+_orchestrator_agent: Optional["Agent"] = None
+_orchestrator_agent_lock = threading.Lock()
+
+
+def _build_orchestrator_agent() -> "Agent":
+    """Create the ADK Agent with wrapped tools."""
+    from google.adk import Agent
+    from google.adk.tools import FunctionTool
+
+    tools = [
         FunctionTool(send_task_to_agent),
         FunctionTool(validate_user_registration),
         FunctionTool(create_user_account),
         FunctionTool(send_onboarding_email),
         FunctionTool(track_analytics_event)
-    ],
-    model="gemini-2.0-flash-exp"  # Specify Gemini 2.0 Flash for orchestration
-)
+    ]
+    # Map the docs index now, while the agent is built, not on first use
+    search_adk_docs = load_search_tool() if load_search_tool else None
+    if load_search_tool is None:
+        logger.warning("⚠️  search_adk_docs disabled: docs_index is not importable")
+    if search_adk_docs is not None:
+        tools.append(FunctionTool(search_adk_docs))
+
+    return Agent(
+        name="hustle_operations_manager",
+        description="""
+        Hustle Operations Manager - Main Orchestrator
+
+        Coordinates all Hustle operations by routing requests to appropriate
+        sub-agents and aggregating their responses. Handles user registration,
+        player creation, game logging, and other core operations.
+
+        Uses Agent-to-Agent (A2A) protocol to communicate with sub-agents:
+        - Validation Agent: Data validation
+        - User Creation Agent: Account/player creation
+        - Onboarding Agent: Welcome emails, verification
+        - Analytics Agent: Event tracking
+
+        Answers "how do I..." questions about Google ADK from the local docs
+        index (search_adk_docs), citing the passages it returns.
+        """,
+        tools=tools,
+        model="gemini-2.0-flash-exp"  # Specify Gemini 2.0 Flash for orchestration
+    )
+
+
+def get_orchestrator_agent() -> "Agent":
+    """Return the process-wide orchestrator Agent, building it on first use."""
+    global _orchestrator_agent
+
+    if _orchestrator_agent is None:
+        with _orchestrator_agent_lock:
+            if _orchestrator_agent is None:
+                _orchestrator_agent = _build_orchestrator_agent()
+
+    return _orchestrator_agent
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `orchestrator_agent_adk.hustle_orchestrator` working, built lazily
+    if name == "hustle_orchestrator":
+        return get_orchestrator_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ============================================================================
+# RUNNER AND SESSIONS
+# ============================================================================
+
+APP_NAME = "hustle_operations_manager"
+
+# Matches a2a.session_management.session_ttl in config/agent.yaml
+ADK_SESSION_TTL_SECONDS = float(os.getenv("HUSTLE_ADK_SESSION_TTL_SECONDS", "3600"))
+ADK_MAX_SESSIONS = int(os.getenv("HUSTLE_ADK_MAX_SESSIONS", "1000"))
+
+
+class SessionLRU:
+    """
+    Bounds the sessions kept by the runner's InMemorySessionService.
+
+    Records when each (user_id, session_id) was last used. Sessions idle
+    longer than the TTL, and the least recently used ones beyond max_sessions,
+    are returned for deletion. A session with a run in progress (acquired and
+    not yet released) is never evicted, so the store can briefly hold more
+    than max_sessions under load.
+    """
+
+    def __init__(self, max_sessions: int = ADK_MAX_SESSIONS, ttl_seconds: float = ADK_SESSION_TTL_SECONDS):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._last_used: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._active: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, user_id: str, session_id: str) -> List[Tuple[str, str]]:
+        """
+        Mark a session as used by a run. Each call must be paired with release().
+
+        Returns:
+            (user_id, session_id) of sessions to delete, including this one if
+            it had expired and no other run is using it (so the caller starts
+            it fresh)
+        """
+        now = time.monotonic()
+        key = (user_id, session_id)
+        evicted = []
+
+        with self._lock:
+            last_used = self._last_used.pop(key, None)
+            if last_used is not None and now - last_used > self.ttl_seconds and key not in self._active:
+                evicted.append(key)
+
+            # Oldest first: stop at the first live entry once within bounds
+            excess = len(self._last_used) + 1 - self.max_sessions
+            stale = []
+            for oldest, oldest_used in self._last_used.items():
+                if excess <= 0 and now - oldest_used <= self.ttl_seconds:
+                    break
+                if oldest in self._active:
+                    continue
+                stale.append(oldest)
+                excess -= 1
+
+            for oldest in stale:
+                del self._last_used[oldest]
+            evicted.extend(stale)
+
+            self._last_used[key] = now
+            self._active[key] = self._active.get(key, 0) + 1
+
+        return evicted
+
+    def release(self, user_id: str, session_id: str) -> None:
+        """End a run started with acquire(); the session becomes evictable."""
+        key = (user_id, session_id)
+
+        with self._lock:
+            count = self._active.get(key, 0) - 1
+            if count > 0:
+                self._active[key] = count
+            else:
+                self._active.pop(key, None)
+            if key in self._last_used:
+                # Idle time counts from the end of the run
+                self._last_used[key] = time.monotonic()
+                self._last_used.move_to_end(key)
+
+    def __len__(self) -> int:
+        return len(self._last_used)
+
+
+_runner: Optional["Runner"] = None
+_runner_lock = threading.Lock()
+_sessions = SessionLRU()
+
+
+def get_runner() -> "Runner":
+    """Return the process-wide ADK Runner, building it on first use."""
+    global _runner
+
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                from google.adk import Runner
+                from google.adk.sessions import InMemorySessionService
+
+                _runner = Runner(
+                    app_name=APP_NAME,
+                    agent=get_orchestrator_agent(),
+                    session_service=InMemorySessionService()
+                )
+
+    return _runner
+
+
+async def _ensure_session(
+    session_service: "BaseSessionService",
+    user_id: str,
+    session_id: str
+) -> None:
+    """
+    Get or create the session, deleting evicted ones first.
+
+    The session is acquired in _sessions; the caller releases it when the run
+    ends.
+    """
+    for evicted_user_id, evicted_session_id in _sessions.acquire(user_id, session_id):
+        await session_service.delete_session(
+            app_name=APP_NAME, user_id=evicted_user_id, session_id=evicted_session_id
+        )
+
+    session = await session_service.get_session(
+        app_name=APP_NAME, user_id=user_id, session_id=session_id
+    )
+    if session is None:
+        await session_service.create_session(
+            app_name=APP_NAME, user_id=user_id, session_id=session_id
+        )
+
+
+async def _run_agent(prompt: str, user_id: str, session_id: str) -> str:
+    """Run one agent turn in the caller's session and return its text."""
+    from google.genai.types import Content, Part
+
+    runner = get_runner()
+
+    try:
+        await _ensure_session(runner.session_service, user_id, session_id)
+
+        # Create Content object from prompt
+        user_message = Content(
+            role="user",
+            parts=[Part(text=prompt)]
+        )
+
+        # Collect response from events
+        response_text = ""
+        async for event in runner.run_async(
+            user_id=user_id,
+            session_id=session_id,
+            new_message=user_message
+        ):
+            if hasattr(event, 'content') and event.content:
+                for part in event.content.parts:
+                    if hasattr(part, 'text') and part.text:
+                        response_text += part.text
+    finally:
+        _sessions.release(user_id, session_id)
+
+    return response_text
+
+
+_agent_loop: Optional[asyncio.AbstractEventLoop] = None
+_agent_loop_lock = threading.Lock()
+
+
+def _get_agent_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop all agent turns run on, starting it on first use.
+
+    One long-lived loop on its own thread: the Runner and its session service
+    are only ever used from that loop, and long LLM turns never occupy the
+    workflow executor's threads.
+    """
+    global _agent_loop
+
+    if _agent_loop is None:
+        with _agent_loop_lock:
+            if _agent_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="hustle-adk-agent-loop", daemon=True
+                ).start()
+                _agent_loop = loop
+
+    return _agent_loop
+
+
+def _run_on_agent_loop(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine on the agent loop and wait for its result.
+
+    The coroutine runs in a copy of the caller's contextvars (trace spans).
+
+    Raises:
+        RuntimeError: If called from the agent loop itself (it would deadlock)
+    """
+    loop = _get_agent_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        coro.close()
+        raise RuntimeError("Agent turns can't be waited for on the agent loop itself")
+
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
 
 
 # Main entry point for Cloud Functions / Cloud Run
@@ -311,20 +860,30 @@ def handle_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Main entry point for handling requests using ADK Runner.
 
-    Called by Cloud Functions or Cloud Run.
+    Called by Cloud Functions or Cloud Run. Known intents run their tool
+    sequence directly (HUSTLE_ADK_EXECUTION_MODE=direct, default); the
+    "free_form" intent, or every intent in llm mode, goes through the agent
+    on a shared Runner. Agent sessions are kept per process (see SessionLRU),
+    so a follow-up request that sends back `session_id` continues the same
+    conversation.
 
     Args:
-        request_data: Request payload with intent, data, auth
+        request_data: Request payload with intent, data, auth and an optional
+            session_id from a previous response
 
     Returns:
         Agent execution result
     """
+    ensure_logging()
+    ensure_tracing()
+
     intent = request_data.get("intent")
     data = request_data.get("data")
     auth = request_data.get("auth")
 
     request_id = str(uuid.uuid4())
-    session_id = str(uuid.uuid4())
+    # Follow-up requests pass the session_id from the previous response
+    session_id = request_data.get("session_id") or str(uuid.uuid4())
 
     logger.info(
         f"ADK Orchestrator: Received intent {intent}",
@@ -335,8 +894,38 @@ def handle_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
         }
     )
 
-    # Construct natural language prompt for ADK agent
-    if intent == "user_registration":
+    # Bounded concurrency and per-user rate limits (see admission.py)
+    admission = get_admission_controller()
+    rejection = admission.admit(intent, auth.get("uid") if auth else None)
+    if rejection is not None:
+        ADMISSION_REJECTIONS.inc(
+            intent=intent if intent in INTENT_LANES else "unknown", reason=rejection["code"]
+        )
+        logger.warning(
+            f"ADK Orchestrator: Rejected {intent} ({rejection['code']})",
+            extra={"intent": intent, "request_id": request_id, "code": rejection["code"]}
+        )
+        return {"success": False, "errors": [rejection], "session_id": session_id}
+
+    try:
+        result = _dispatch(intent, data, auth, request_id, session_id)
+    finally:
+        admission.release()
+
+    # Request-billed runtimes give the outbox thread no CPU after we return
+    if FLUSH_BEFORE_RESPONSE:
+        get_analytics_outbox().flush(FLUSH_BEFORE_RESPONSE_TIMEOUT_S)
+
+    # Full trace to the sampled debug sink; the client gets compact agent_execution
+    get_debug_sink().record(intent, request_id, result)
+    return shape_response(result)
+
+
+def _agent_prompt(intent: str, data: Dict[str, Any], auth: Optional[Dict[str, Any]]) -> str:
+    """Natural language prompt for the ADK agent (intent is in _AGENT_INTENTS)."""
+    if intent == "free_form":
+        prompt = data["message"]
+    elif intent == "user_registration":
         prompt = f"""
         Process user registration for:
         - Email: {data['email']}
@@ -378,6 +967,46 @@ def handle_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
         Return success status and game ID.
         """
     else:
+        raise ValueError(f"Unknown intent: {intent}")
+
+    return prompt
+
+
+# Intents the agent path builds a prompt for
+_AGENT_INTENTS = ("free_form", "user_registration", "player_creation", "game_logging")
+
+
+def _dispatch(
+    intent: str,
+    data: Dict[str, Any],
+    auth: Optional[Dict[str, Any]],
+    request_id: str,
+    session_id: str
+) -> Dict[str, Any]:
+    """Run a known intent directly, or one agent turn."""
+    if EXECUTION_MODE == "direct" and intent in _DIRECT_INTENTS:
+        try:
+            return _execute_direct(intent, data, auth, request_id, session_id)
+        except Exception as e:
+            logger.error(
+                f"ADK Orchestrator: Error processing {intent}",
+                extra={
+                    "intent": intent,
+                    "request_id": request_id,
+                    "error": str(e)
+                }
+            )
+
+            return {
+                "success": False,
+                "errors": [{
+                    "agent": "orchestrator",
+                    "code": "ORCHESTRATION_ERROR",
+                    "message": str(e)
+                }]
+            }
+
+    if intent not in _AGENT_INTENTS:
         return {
             "success": False,
             "errors": [{
@@ -387,36 +1016,22 @@ def handle_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
             }]
         }
 
-    try:
-        # Execute agent using ADK Runner with session service
-        session_service = InMemorySessionService()
-        runner = Runner(
-            app_name="hustle_operations_manager",
-            agent=hustle_orchestrator,
-            session_service=session_service
-        )
-
-        # Create Content object from prompt
-        user_message = Content(
-            role="user",
-            parts=[Part(text=prompt)]
-        )
-
-        # Run agent and collect events
-        events = runner.run(
-            user_id="system",  # System user for Cloud Functions
-            session_id=session_id,
-            new_message=user_message
-        )
+    # Schema errors (e.g. free_form without a message) come back as
+    # validation errors instead of failing while the prompt is built
+    errors = validate_locally(intent, data)
+    if errors:
+        return {"success": False, "errors": errors, "session_id": session_id}
 
-        # Collect response from events
-        response_text = ""
-        for event in events:
-            # Extract response from events
-            if hasattr(event, 'content') and event.content:
-                for part in event.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        response_text += part.text
+    try:
+        prompt = _agent_prompt(intent, data, auth)
+
+        # One turn on the shared runner, on the agent loop thread, so callers
+        # with a running loop work too
+        response_text = _run_on_agent_loop(_run_agent(
+            prompt,
+            user_id=auth.get("uid") if auth else "system",  # System user for Cloud Functions
+            session_id=session_id
+        ))
 
         logger.info(
             f"ADK Orchestrator: Completed {intent}",
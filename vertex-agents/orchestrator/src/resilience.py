@@ -0,0 +1,445 @@
+"""
+Resilience layer for A2A calls: retries, hedging and circuit breakers.
+
+`call_with_resilience(agent_name, attempt)` wraps one sub-agent call
+(`async_call_with_resilience` for coroutines, sharing the same state):
+
+- Retries: up to the agent's `retries` from config/agent.yaml, with full-jitter
+  exponential backoff from `performance.retry_policy`. Retries also draw from
+  a per-agent retry budget (a token bucket refilled by successful calls), so
+  a struggling agent sees at most ~RETRY_BUDGET_RATIO extra load instead of
+  3x. Non-idempotent agents (user-creation, onboarding, analytics) are only
+  retried when the request never left the process (NOT_SENT_ERRORS, also
+  when wrapped by gRPC/api_core as UNAVAILABLE "failed to connect"): after a
+  timeout the agent may already have created the account, sent the email or
+  recorded the analytics batch.
+- Hedging: for idempotent agents, if an attempt runs past the agent's
+  observed p95 latency, a second identical request is sent and the first
+  success wins. This bounds tail latency without doubling normal traffic.
+- Circuit breakers: after CIRCUIT_FAILURE_THRESHOLD consecutive failures an
+  agent's circuit opens and calls fail fast with CircuitOpenError for
+  CIRCUIT_RESET_TIMEOUT_S. Then a single probe call decides whether it closes
+  again.
+
+State is per process and shared by every request.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import re
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AgentPolicy:
+    """Retry/hedging policy for one sub-agent"""
+    max_attempts: int
+    # Safe to hedge and to retry after any error (duplicates have no side effects)
+    idempotent: bool
+
+
+# Mirrors sub_agents in config/agent.yaml (retries = max attempts)
+AGENT_POLICIES: Dict[str, AgentPolicy] = {
+    "validation": AgentPolicy(max_attempts=3, idempotent=True),
+    "user-creation": AgentPolicy(max_attempts=3, idempotent=False),
+    "onboarding": AgentPolicy(max_attempts=2, idempotent=False),
+    # A resent batch would record every event in it twice
+    "analytics": AgentPolicy(max_attempts=2, idempotent=False),
+}
+DEFAULT_POLICY = AgentPolicy(max_attempts=1, idempotent=False)
+
+# Matches performance.retry_policy / execution_timeout in config/agent.yaml
+INITIAL_DELAY_MS = 1000
+BACKOFF_MULTIPLIER = 2
+MAX_DELAY_MS = 8000
+EXECUTION_TIMEOUT_S = 30
+
+RETRY_BUDGET_RATIO = float(os.getenv("HUSTLE_RETRY_BUDGET_RATIO", "0.2"))
+RETRY_BUDGET_MAX_TOKENS = 10
+
+HEDGING_ENABLED = os.getenv("HUSTLE_HEDGING", "true").lower() == "true"
+HEDGE_MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("HUSTLE_CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT_S = float(os.getenv("HUSTLE_CIRCUIT_RESET_TIMEOUT_S", "30"))
+
+# Failures that happen before a request is sent (connection refused, DNS);
+# the only ones a non-idempotent agent is retried after
+NOT_SENT_ERRORS = (ConnectionRefusedError, socket.gaierror)
+
+# The same failures as reported by gRPC (UNAVAILABLE), usually wrapped by
+# api_core as ServiceUnavailable: no connection was ever established
+GRPC_NOT_SENT_DETAILS = re.compile(
+    r"failed to connect to all addresses|errors resolving|DNS resolution failed",
+    re.IGNORECASE,
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an agent whose circuit is open"""
+
+
+class RetryBudget:
+    """Token bucket: each call deposits RETRY_BUDGET_RATIO tokens, each retry costs one."""
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, max_tokens: float = RETRY_BUDGET_MAX_TOKENS):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed → open → half-open)"""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout_s: float = CIRCUIT_RESET_TIMEOUT_S,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout_s:
+                self.state = "half_open"
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """End a call that neither succeeded nor failed (e.g. it was cancelled)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies with a cached p95"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._p95: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            if len(self._samples) % 10 == 0:
+                self._p95 = None  # Recomputed lazily
+
+    def p95(self) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < HEDGE_MIN_SAMPLES:
+                return None
+            if self._p95 is None:
+                ordered = sorted(self._samples)
+                self._p95 = ordered[int(len(ordered) * 0.95) - 1]
+            return self._p95
+
+
+class _AgentState:
+    def __init__(self, policy: AgentPolicy):
+        self.policy = policy
+        self.budget = RetryBudget()
+        self.breaker = CircuitBreaker()
+        self.latency = LatencyTracker()
+
+
+_states: Dict[str, _AgentState] = {}
+_states_lock = threading.Lock()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _state(agent_name: str) -> _AgentState:
+    state = _states.get(agent_name)
+    if state is None:
+        with _states_lock:
+            state = _states.setdefault(
+                agent_name, _AgentState(AGENT_POLICIES.get(agent_name, DEFAULT_POLICY))
+            )
+    return state
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    # Separate from the workflow pool so hedges never wait behind the nodes
+    # that are waiting on them
+    global _hedge_executor
+
+    if _hedge_executor is None:
+        with _states_lock:
+            if _hedge_executor is None:
+                _hedge_executor = ThreadPoolExecutor(
+                    max_workers=int(os.getenv("HUSTLE_HEDGE_MAX_WORKERS", "32")),
+                    thread_name_prefix="hustle-hedge",
+                )
+    return _hedge_executor
+
+
+def _backoff_seconds(retry: int) -> float:
+    """Full jitter: uniform in [0, min(max, initial * multiplier^retry)]."""
+    ceiling_ms = min(MAX_DELAY_MS, INITIAL_DELAY_MS * BACKOFF_MULTIPLIER ** retry)
+    return random.uniform(0, ceiling_ms) / 1000
+
+
+def _hedged(state: _AgentState, agent_name: str, attempt: Callable[[], Any]) -> Any:
+    """Run attempt; if it outlives p95, race a second copy and take the first success."""
+    hedge_after = state.latency.p95()
+    if not (HEDGING_ENABLED and state.policy.idempotent and hedge_after):
+        return attempt()
+
+    executor = _get_hedge_executor()
+    pending = {executor.submit(attempt)}
+    done, _ = wait(pending, timeout=hedge_after)
+    if not done:
+        logger.info(
+            f"Resilience: hedging {agent_name} after {hedge_after * 1000:.0f}ms",
+            extra={"agent": agent_name, "hedge_after_ms": int(hedge_after * 1000)}
+        )
+        pending.add(executor.submit(attempt))
+
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+    raise error
+
+
+def _grpc_unavailable_detail(error: BaseException) -> Optional[str]:
+    """Details of a gRPC UNAVAILABLE error (grpc.RpcError or api_core), else None."""
+    code = getattr(error, "grpc_status_code", None)  # api_core GoogleAPICallError
+    if code is not None:
+        return str(error) if getattr(code, "name", None) == "UNAVAILABLE" else None
+
+    if callable(getattr(error, "code", None)) and callable(getattr(error, "details", None)):
+        try:  # grpc.RpcError
+            code = error.code()
+        except Exception:
+            return None
+        if getattr(code, "name", None) != "UNAVAILABLE":
+            return None
+        return error.details() or ""
+    return None
+
+
+def _was_not_sent(error: BaseException) -> bool:
+    """
+    True if the request never reached the agent (see NOT_SENT_ERRORS).
+
+    Follows the exception chain, since client libraries wrap socket errors:
+    api_core raises ServiceUnavailable from the grpc.RpcError, whose details
+    name the connect or DNS failure.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, NOT_SENT_ERRORS):
+            return True
+        detail = _grpc_unavailable_detail(error)
+        if detail is not None and GRPC_NOT_SENT_DETAILS.search(detail):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _should_retry(
+    state: _AgentState,
+    agent_name: str,
+    attempt_number: int,
+    start_time: float,
+    delay_s: float,
+    error: Exception,
+) -> bool:
+    """
+    Retry if attempts, the execution deadline and the retry budget allow.
+
+    Non-idempotent agents are only retried if the request was never sent.
+    """
+    if not (state.policy.idempotent or _was_not_sent(error)):
+        if attempt_number < state.policy.max_attempts:
+            logger.warning(
+                f"Resilience: not retrying {agent_name}, the request may have been processed",
+                extra={"agent": agent_name, "attempt": attempt_number, "error": str(error)}
+            )
+        return False
+
+    elapsed_s = time.monotonic() - start_time
+    if not (
+        attempt_number < state.policy.max_attempts
+        and elapsed_s + delay_s < EXECUTION_TIMEOUT_S
+        and state.budget.try_withdraw()
+    ):
+        return False
+
+    logger.warning(
+        f"Resilience: retrying {agent_name} (attempt {attempt_number + 1}) in {delay_s:.2f}s",
+        extra={"agent": agent_name, "attempt": attempt_number + 1, "error": str(error)}
+    )
+    return True
+
+
+def call_with_resilience(agent_name: str, attempt: Callable[[], Any]) -> Any:
+    """
+    Call a sub-agent with retries, hedging and a circuit breaker.
+
+    Args:
+        agent_name: Sub-agent name (validation, user-creation, ...)
+        attempt: Makes one request; raises on failure
+
+    Returns:
+        The first successful attempt's result
+
+    Raises:
+        CircuitOpenError: If the agent's circuit is open
+        Exception: The last attempt's error once retries are exhausted
+    """
+    state = _state(agent_name)
+    state.budget.deposit()
+    start_time = time.monotonic()
+
+    for attempt_number in range(1, state.policy.max_attempts + 1):
+        if not state.breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {agent_name}, failing fast")
+
+        attempt_start = time.monotonic()
+        try:
+            result = _hedged(state, agent_name, attempt)
+        except Exception as e:
+            state.breaker.record_failure()
+            delay_s = _backoff_seconds(attempt_number - 1)
+            if not _should_retry(state, agent_name, attempt_number, start_time, delay_s, e):
+                raise
+            time.sleep(delay_s)
+            continue
+        except BaseException:
+            # Interrupted: a half-open probe must not stay in flight forever
+            state.breaker.release_probe()
+            raise
+
+        state.breaker.record_success()
+        state.latency.record(time.monotonic() - attempt_start)
+        return result
+
+
+async def _hedged_async(
+    state: _AgentState,
+    agent_name: str,
+    attempt: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Async hedging: the losing request is cancelled."""
+    hedge_after = state.latency.p95()
+    if not (HEDGING_ENABLED and state.policy.idempotent and hedge_after):
+        return await attempt()
+
+    pending = {asyncio.ensure_future(attempt())}
+    done, _ = await asyncio.wait(pending, timeout=hedge_after)
+    if not done:
+        logger.info(
+            f"Resilience: hedging {agent_name} after {hedge_after * 1000:.0f}ms",
+            extra={"agent": agent_name, "hedge_after_ms": int(hedge_after * 1000)}
+        )
+        pending.add(asyncio.ensure_future(attempt()))
+
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+    raise error
+
+
+async def async_call_with_resilience(
+    agent_name: str,
+    attempt: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Async counterpart of call_with_resilience (same per-agent state).
+
+    Args:
+        agent_name: Sub-agent name (validation, user-creation, ...)
+        attempt: Returns a new awaitable for one request; raises on failure
+    """
+    state = _state(agent_name)
+    state.budget.deposit()
+    start_time = time.monotonic()
+
+    for attempt_number in range(1, state.policy.max_attempts + 1):
+        if not state.breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {agent_name}, failing fast")
+
+        attempt_start = time.monotonic()
+        try:
+            result = await _hedged_async(state, agent_name, attempt)
+        except Exception as e:
+            state.breaker.record_failure()
+            delay_s = _backoff_seconds(attempt_number - 1)
+            if not _should_retry(state, agent_name, attempt_number, start_time, delay_s, e):
+                raise
+            await asyncio.sleep(delay_s)
+            continue
+        except BaseException:
+            # Cancelled: a half-open probe must not stay in flight forever
+            state.breaker.release_probe()
+            raise
+
+        state.breaker.record_success()
+        state.latency.record(time.monotonic() - attempt_start)
+        return result
+
+
+def circuit_states() -> Dict[str, str]:
+    """Current circuit state per agent (for health checks)."""
+    return {name: state.breaker.state for name, state in _states.items()}
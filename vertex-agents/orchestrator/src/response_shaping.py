@@ -0,0 +1,154 @@
+"""
+Response shaping and debug traces for the orchestrator.
+
+`agent_execution` used to carry every sub-agent's full result (output
+payload, session id) back to the client. Under load that made responses
+several times larger than the data the client uses, and the same payloads
+were logged on every A2A call. This module separates the two audiences:
+
+- Clients get compact responses: each `agent_execution` entry keeps only
+  status, agent, duration_ms and error (HUSTLE_RESPONSE_DETAIL=compact,
+  default; `full` restores the old shape).
+- Full traces go to a sampled debug sink: every failed request and
+  HUSTLE_DEBUG_TRACE_SAMPLE_RATE of successful ones are logged on the
+  `debug_traces` logger and kept in a small in-memory ring buffer.
+- Anything logged or stored goes through `redact`, which masks passwords,
+  tokens and other secrets by key name.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+RESPONSE_DETAIL = os.getenv("HUSTLE_RESPONSE_DETAIL", "compact")
+DEBUG_TRACE_SAMPLE_RATE = float(os.getenv("HUSTLE_DEBUG_TRACE_SAMPLE_RATE", "0.01"))
+DEBUG_TRACE_BUFFER_SIZE = int(os.getenv("HUSTLE_DEBUG_TRACE_BUFFER_SIZE", "100"))
+
+REDACTED = "[REDACTED]"
+
+# Lower-cased key fragments whose values are never logged
+SENSITIVE_KEYS = ("password", "secret", "token", "authorization", "apikey", "api_key", "credential")
+
+# agent_execution fields returned to clients in compact mode
+COMPACT_FIELDS = ("status", "agent", "duration_ms", "error")
+
+trace_logger = logging.getLogger("debug_traces")
+
+
+def _is_sensitive(key: str) -> bool:
+    key = key.lower()
+    return any(fragment in key for fragment in SENSITIVE_KEYS)
+
+
+def redact(value: Any) -> Any:
+    """
+    Copy of value with secrets masked, for logs and debug traces.
+
+    Dict values are replaced with "[REDACTED]" when their key contains a
+    SENSITIVE_KEYS fragment (password, confirmPassword, tokenId, ...).
+    """
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if isinstance(key, str) and _is_sensitive(key) else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return value
+
+
+def compact_execution(agent_execution: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """agent_execution with only COMPACT_FIELDS per entry."""
+    return {
+        name: {field: entry[field] for field in COMPACT_FIELDS if field in entry}
+        for name, entry in agent_execution.items()
+    }
+
+
+def shape_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Client-facing copy of an orchestrator result.
+
+    The result itself is not modified: it may be shared with coalesced
+    requests or held in the idempotency store.
+    """
+    if RESPONSE_DETAIL == "full" or "agent_execution" not in result:
+        return result
+    return {**result, "agent_execution": compact_execution(result["agent_execution"])}
+
+
+class DebugTraceSink:
+    """Sampled store of full, redacted request traces"""
+
+    def __init__(
+        self,
+        sample_rate: float = DEBUG_TRACE_SAMPLE_RATE,
+        buffer_size: int = DEBUG_TRACE_BUFFER_SIZE,
+    ):
+        self.sample_rate = sample_rate
+        self._traces: deque = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        intent: str,
+        request_id: str,
+        result: Dict[str, Any],
+        duration_ms: Optional[int] = None,
+    ) -> bool:
+        """
+        Store the full trace of a finished request if it is sampled.
+
+        Failed requests are always kept; successful ones with probability
+        sample_rate.
+
+        Returns:
+            True if the trace was stored
+        """
+        if result.get("success") and random.random() >= self.sample_rate:
+            return False
+
+        trace = {
+            "intent": intent,
+            "request_id": request_id,
+            "timestamp": time.time(),
+            "duration_ms": duration_ms,
+            "success": bool(result.get("success")),
+            "errors": redact(result.get("errors")),
+            "agent_execution": redact(result.get("agent_execution", {})),
+        }
+
+        with self._lock:
+            self._traces.append(trace)
+
+        trace_logger.info(
+            f"Debug trace for {intent} ({request_id})",
+            extra={"intent": intent, "request_id": request_id, "trace": trace}
+        )
+        return True
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Most recent traces, newest last."""
+        with self._lock:
+            traces = list(self._traces)
+        return traces[-limit:] if limit else traces
+
+
+_sink: Optional[DebugTraceSink] = None
+_sink_lock = threading.Lock()
+
+
+def get_debug_sink() -> DebugTraceSink:
+    """Return the process-wide DebugTraceSink, creating it on first use."""
+    global _sink
+
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = DebugTraceSink()
+
+    return _sink
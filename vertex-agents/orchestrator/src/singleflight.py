@@ -0,0 +1,183 @@
+"""
+Request coalescing for the orchestrator.
+
+Duplicate submissions (double-clicked forms, client retries) should not each
+run the full validation → creation chain. Two layers handle this:
+
+- SingleFlight: concurrent requests with the same key share one in-flight
+  execution; followers block until the leader finishes and get its result.
+  AsyncSingleFlight does the same for coroutines on one event loop.
+- IdempotencyStore: successful outcomes are kept for
+  HUSTLE_IDEMPOTENCY_TTL_SECONDS, so a retry shortly after completion gets
+  the cached outcome instead of creating a second account.
+
+Keys are a SHA-256 of the intent, the caller's uid and the normalized payload.
+Failures are never cached, so a failed request can always be retried.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("HUSTLE_IDEMPOTENCY_TTL_SECONDS", "300"))
+IDEMPOTENCY_MAX_ENTRIES = int(os.getenv("HUSTLE_IDEMPOTENCY_MAX_ENTRIES", "10000"))
+
+# Compared case-insensitively
+_CASE_INSENSITIVE_FIELDS = {"email"}
+
+
+def _normalize(value: Any, field: Optional[str] = None) -> Any:
+    if isinstance(value, dict):
+        return {key: _normalize(item, key) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    if isinstance(value, str):
+        value = value.strip()
+        return value.lower() if field in _CASE_INSENSITIVE_FIELDS else value
+    return value
+
+
+def request_key(intent: str, data: Any, auth: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build the coalescing key for a request.
+
+    Args:
+        intent: Intent name
+        data: Request data
+        auth: Authentication context (uid scopes the key to the caller)
+
+    Returns:
+        Hex SHA-256 of intent, uid and normalized payload
+    """
+    canonical = json.dumps(
+        {
+            "intent": intent,
+            "uid": auth.get("uid") if auth else None,
+            "data": _normalize(data),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs at most one execution per key at a time"""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn, or wait for the in-flight run with the same key.
+
+        Returns:
+            (result, shared): shared is True for followers, which receive a
+            deep copy of the leader's result
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result), True
+
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines (use from a single event loop)"""
+
+    def __init__(self):
+        self._calls: Dict[str, "asyncio.Future"] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await fn(), or the in-flight call with the same key.
+
+        Returns:
+            (result, shared) as for SingleFlight.do
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            # shield: a cancelled follower must not cancel the leader's result
+            result = await asyncio.shield(future)
+            return copy.deepcopy(result), True
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result, False
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when there are no followers
+            raise
+        finally:
+            del self._calls[key]
+
+
+class IdempotencyStore:
+    """Bounded TTL cache of successful outcomes"""
+
+    def __init__(
+        self,
+        ttl_seconds: int = IDEMPOTENCY_TTL_SECONDS,
+        max_entries: int = IDEMPOTENCY_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the stored outcome, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, outcome = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(outcome)
+
+    def put(self, key: str, outcome: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(outcome))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
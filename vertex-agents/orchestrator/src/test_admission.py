@@ -0,0 +1,108 @@
+"""Unit tests for admission (run: pytest test_admission.py)"""
+
+import pytest
+
+import admission
+from admission import AdmissionController, TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(admission.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_token_bucket_allows_burst_then_reports_wait():
+    bucket = TokenBucket(rate=2, burst=3, now=0.0)
+
+    assert [bucket.try_take(0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.try_take(0.0) == pytest.approx(0.5)
+    assert bucket.try_take(0.5) == 0.0
+
+
+def test_global_limit_rejects_with_overloaded(clock):
+    controller = AdmissionController(max_concurrent=2, rate_per_second=0)
+
+    assert controller.admit("user_registration", None) is None
+    assert controller.admit("user_registration", None) is None
+    rejection = controller.admit("user_registration", None)
+
+    assert rejection["code"] == "OVERLOADED"
+    assert rejection["agent"] == "orchestrator"
+    assert rejection["retryAfterMs"] == admission.OVERLOADED_RETRY_AFTER_MS
+
+
+def test_release_frees_a_slot(clock):
+    controller = AdmissionController(max_concurrent=1, rate_per_second=0)
+    controller.admit("user_registration", None)
+    controller.release()
+
+    assert controller.admit("user_registration", None) is None
+    assert controller.in_flight == 1
+
+
+def test_lower_lanes_are_shed_first(clock):
+    controller = AdmissionController(max_concurrent=10, rate_per_second=0)
+    for _ in range(5):
+        assert controller.admit("game_logging_bulk", None) is None
+
+    # Bulk lane is at its 50% share; standard and critical still have room
+    assert controller.admit("free_form", None)["code"] == "OVERLOADED"
+    for _ in range(3):
+        assert controller.admit("game_logging", None) is None
+    assert controller.admit("player_creation", None)["code"] == "OVERLOADED"
+    assert controller.admit("user_registration", None) is None
+
+
+def test_unknown_intent_uses_the_default_lane(clock):
+    controller = AdmissionController(max_concurrent=10, rate_per_second=0)
+    for _ in range(8):
+        assert controller.admit("no_such_intent", None) is None
+
+    assert controller.admit("no_such_intent", None)["code"] == "OVERLOADED"
+    assert controller.lane_limit("no_such_lane") == 8
+
+
+def test_lane_limit_is_at_least_one():
+    assert AdmissionController(max_concurrent=1).lane_limit("bulk") == 1
+
+
+def test_rate_limit_is_per_user(clock):
+    controller = AdmissionController(max_concurrent=100, rate_per_second=1, burst=2)
+
+    assert controller.admit("game_logging", "user-1") is None
+    assert controller.admit("game_logging", "user-1") is None
+    rejection = controller.admit("game_logging", "user-1")
+
+    assert rejection["code"] == "RATE_LIMITED"
+    assert rejection["retryAfterMs"] == 1001
+    assert controller.admit("game_logging", "user-2") is None
+
+    clock[0] += 1
+    assert controller.admit("game_logging", "user-1") is None
+
+
+def test_rate_limited_requests_do_not_take_a_slot(clock):
+    controller = AdmissionController(max_concurrent=100, rate_per_second=1, burst=1)
+    controller.admit("game_logging", "user-1")
+    controller.admit("game_logging", "user-1")
+
+    assert controller.in_flight == 1
+
+
+def test_unauthenticated_requests_are_not_rate_limited(clock):
+    controller = AdmissionController(max_concurrent=100, rate_per_second=1, burst=1)
+
+    assert all(controller.admit("user_registration", None) is None for _ in range(5))
+
+
+def test_least_recent_users_are_forgotten(clock):
+    controller = AdmissionController(max_concurrent=100, rate_per_second=1, burst=1, max_users=2)
+    controller.admit("game_logging", "user-1")
+    controller.admit("game_logging", "user-2")
+    controller.admit("game_logging", "user-3")
+
+    # user-1's bucket was dropped, so it starts full again
+    assert controller.admit("game_logging", "user-1") is None
+    assert controller.admit("game_logging", "user-3")["code"] == "RATE_LIMITED"
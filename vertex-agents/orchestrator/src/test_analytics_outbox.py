@@ -0,0 +1,131 @@
+"""Unit tests for analytics_outbox (run: pytest test_analytics_outbox.py)"""
+
+import threading
+import time
+
+from analytics_outbox import AnalyticsOutbox
+
+
+class RecordingSender:
+    """send_batch stand-in; can fail or block until released"""
+
+    def __init__(self, succeed=True, block=False):
+        self.batches = []
+        self.succeed = succeed
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def __call__(self, batch):
+        self.release.wait(5)
+        self.batches.append(batch)
+        return self.succeed
+
+
+def test_enqueue_returns_before_delivery_and_flush_waits_for_it():
+    sender = RecordingSender(block=True)
+    outbox = AnalyticsOutbox(sender, flush_interval_ms=10)
+
+    assert outbox.enqueue("user_registration", user_id="u1", metadata={"source": "web"})
+    assert sender.batches == []
+
+    threading.Timer(0.1, sender.release.set).start()
+    assert outbox.flush(timeout=5)
+
+    [[event]] = sender.batches
+    assert event["event"] == "user_registration"
+    assert event["userId"] == "u1"
+    assert event["metadata"] == {"source": "web"}
+    assert outbox.stats["sent"] == 1
+    outbox.close()
+
+
+def test_flush_waits_for_a_batch_already_taken_off_the_queue():
+    sender = RecordingSender(block=True)
+    outbox = AnalyticsOutbox(sender, flush_interval_ms=10)
+    outbox.enqueue("player_creation")
+
+    # The flusher holds the event in a batch: the queue is empty but it isn't sent
+    deadline = time.monotonic() + 5
+    while not outbox._queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+    assert not outbox.flush(timeout=0.1)
+
+    sender.release.set()
+    assert outbox.flush(timeout=5)
+    outbox.close()
+
+
+def test_flush_sends_a_partial_batch_without_waiting_for_the_interval():
+    sender = RecordingSender()
+    outbox = AnalyticsOutbox(sender, batch_size=50, flush_interval_ms=60_000)
+
+    for i in range(3):
+        outbox.enqueue("game_logging", gameId=f"g{i}")
+
+    start = time.monotonic()
+    assert outbox.flush(timeout=5)
+
+    assert time.monotonic() - start < 1
+    assert sum(len(batch) for batch in sender.batches) == 3
+    outbox.close()
+
+
+def test_events_are_batched():
+    sender = RecordingSender(block=True)
+    outbox = AnalyticsOutbox(sender, batch_size=10, flush_interval_ms=50)
+
+    for i in range(25):
+        outbox.enqueue("game_logging", gameId=f"g{i}")
+    sender.release.set()
+    assert outbox.flush(timeout=5)
+
+    assert sum(len(batch) for batch in sender.batches) == 25
+    assert max(len(batch) for batch in sender.batches) <= 10
+    outbox.close()
+
+
+def test_failed_batch_is_sent_once_then_dropped():
+    sender = RecordingSender(succeed=False)
+    outbox = AnalyticsOutbox(sender, flush_interval_ms=10)
+
+    outbox.enqueue("user_registration")
+    assert outbox.flush(timeout=5)
+
+    # send_task already retries; the outbox must not multiply them
+    assert len(sender.batches) == 1
+    assert outbox.stats["dropped"] == 1
+    assert "retries" not in outbox.stats
+    outbox.close()
+
+
+def test_raising_sender_drops_the_batch():
+    def send_batch(batch):
+        raise ConnectionError("analytics agent down")
+
+    outbox = AnalyticsOutbox(send_batch, flush_interval_ms=10)
+    outbox.enqueue("user_registration")
+
+    assert outbox.flush(timeout=5)
+    assert outbox.stats["dropped"] == 1
+    outbox.close()
+
+
+def test_full_queue_drops_without_blocking():
+    sender = RecordingSender(block=True)
+    outbox = AnalyticsOutbox(sender, batch_size=1, flush_interval_ms=10, max_queue_size=1)
+
+    results = [outbox.enqueue("game_logging") for _ in range(5)]
+
+    assert not all(results)
+    assert outbox.stats["dropped"] >= 1
+    sender.release.set()
+    assert outbox.flush(timeout=5)
+    outbox.close()
+
+
+def test_flush_without_events_returns_immediately():
+    outbox = AnalyticsOutbox(RecordingSender())
+
+    assert outbox.flush(timeout=0)
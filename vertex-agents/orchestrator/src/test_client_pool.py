@@ -0,0 +1,150 @@
+"""Unit tests for client_pool (run: pytest test_client_pool.py)"""
+
+import asyncio
+import gc
+import http.client
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import client_pool
+from client_pool import HttpAgentClient, _get_or_create_for_loop, reset_clients
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    reset_clients()
+    yield
+    reset_clients()
+
+
+def _loop_client():
+    return _get_or_create_for_loop(("agent_builder_async", "us-central1"), object)
+
+
+def test_one_client_per_loop_is_reused():
+    async def scenario():
+        first = _loop_client()
+        second = await asyncio.ensure_future(asyncio.sleep(0, result=_loop_client()))
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first is second
+
+
+def test_new_loop_never_gets_a_client_bound_to_a_closed_loop():
+    clients = []
+    for _ in range(5):
+        async def scenario():
+            clients.append(_loop_client())
+        asyncio.run(scenario())
+        gc.collect()  # Freed loops' ids may be reused by the next loop
+
+    assert len({id(client) for client in clients}) == 5
+
+
+def test_closed_loops_are_released():
+    for _ in range(10):
+        async def scenario():
+            _loop_client()
+        asyncio.run(scenario())
+
+    async def scenario():
+        _loop_client()
+    asyncio.run(scenario())
+
+    # Only the last loop's entry survives, and it is closed too by now
+    assert len(client_pool._loop_clients) == 1
+
+
+def test_loops_on_other_threads_get_their_own_client():
+    async def scenario():
+        return _loop_client()
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(asyncio.run(scenario())))
+    thread.start()
+    thread.join()
+
+    assert asyncio.run(scenario()) is not results[0]
+
+
+def test_outside_a_running_loop_raises():
+    with pytest.raises(RuntimeError):
+        _loop_client()
+
+
+class AgentServer(ThreadingHTTPServer):
+    """Local A2A endpoint counting POSTs; can drop keep-alive or in-flight requests"""
+
+    def __init__(self, close_after_response=False, drop_requests=0):
+        self.posts = 0
+        self.close_after_response = close_after_response
+        self.drop_requests = drop_requests
+        super().__init__(("127.0.0.1", 0), _AgentHandler)
+
+
+class _AgentHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.posts += 1
+        if self.server.drop_requests:
+            # Processed, but the connection dies before the response
+            self.server.drop_requests -= 1
+            self.close_connection = True
+            return
+
+        body = json.dumps({"output": {"ok": True}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Keep-alive is advertised, but the server closes the idle connection
+        self.close_connection = self.server.close_after_response
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(**kwargs):
+        server = AgentServer(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return HttpAgentClient(f"http://127.0.0.1:{server.server_port}"), server
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_connection_closed_by_the_server_is_replaced_before_sending(serve):
+    client, server = serve(close_after_response=True)
+
+    assert client.execute_agent("validation", "check").output == {"ok": True}
+    time.sleep(0.1)  # Let the server close the idle connection
+    assert client.execute_agent("validation", "check").output == {"ok": True}
+    assert server.posts == 2
+
+
+def test_request_lost_after_sending_is_not_resent(serve):
+    client, server = serve(drop_requests=1)
+
+    with pytest.raises(http.client.RemoteDisconnected):
+        client.execute_agent("user-creation", "create")
+
+    # The agent may have acted on it: resending is left to resilience
+    assert server.posts == 1
+    assert client.execute_agent("user-creation", "create").output == {"ok": True}
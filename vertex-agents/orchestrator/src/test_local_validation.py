@@ -0,0 +1,110 @@
+"""Unit tests for local_validation (run: pytest test_local_validation.py)"""
+
+import pytest
+
+from local_validation import IntentValidator, remote_checks, validate_locally
+
+REGISTRATION = {
+    "firstName": "Jane",
+    "lastName": "Parent",
+    "email": "jane@example.com",
+    "password": "correct-horse",
+    "agreedToTerms": True,
+    "isParentGuardian": True,
+}
+
+
+def _codes(errors):
+    return {error["field"]: error["code"] for error in errors}
+
+
+def test_valid_registration_passes():
+    assert validate_locally("user_registration", REGISTRATION) == []
+
+
+@pytest.mark.parametrize("field", ["agreedToTerms", "isParentGuardian"])
+def test_registration_requires_consent(field):
+    missing = {key: value for key, value in REGISTRATION.items() if key != field}
+    declined = {**REGISTRATION, field: False}
+
+    assert _codes(validate_locally("user_registration", missing)) == {field: "REQUIRED"}
+    assert validate_locally("user_registration", declined) == [{
+        "field": field,
+        "code": "INVALID_VALUE",
+        "message": f"{field} must be true",
+    }]
+
+
+def test_consent_flags_must_be_booleans():
+    errors = validate_locally("user_registration", {**REGISTRATION, "agreedToTerms": "yes"})
+
+    assert _codes(errors) == {"agreedToTerms": "INVALID_TYPE"}
+
+
+@pytest.mark.parametrize("changes, expected", [
+    ({"email": "not-an-email"}, {"email": "INVALID_FORMAT"}),
+    ({"password": "short"}, {"password": "TOO_SHORT"}),
+    ({"phone": "12-34"}, {"phone": "INVALID_FORMAT"}),
+    ({"firstName": ""}, {"firstName": "REQUIRED"}),
+    ({"lastName": 42}, {"lastName": "INVALID_TYPE"}),
+])
+def test_registration_schema_errors(changes, expected):
+    assert _codes(validate_locally("user_registration", {**REGISTRATION, **changes})) == expected
+
+
+def test_player_creation_enum_and_date():
+    errors = validate_locally("player_creation", {
+        "name": "Emma",
+        "birthday": "2012-13-01",
+        "position": "Striker",
+        "teamClub": "Riverside FC",
+    })
+
+    assert _codes(errors) == {"birthday": "INVALID_FORMAT", "position": "INVALID_VALUE"}
+
+
+def test_array_items_are_validated_with_indexed_fields():
+    validator = IntentValidator("bulk", {
+        "type": "object",
+        "properties": {
+            "games": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"goals": {"type": "integer", "minimum": 0}},
+                    "required": ["goals"],
+                },
+            },
+        },
+    })
+
+    errors = validator.validate({"games": [{"goals": 1}, {"goals": -1}, {}]})
+
+    assert errors == [
+        {"field": "games[1].goals", "code": "OUT_OF_RANGE", "message": "games[1].goals must be at least 0"},
+        {"field": "games[2].goals", "code": "REQUIRED", "message": "games[2].goals is required"},
+    ]
+
+
+def test_booleans_are_not_numbers():
+    validator = IntentValidator("intent", {"properties": {"goals": {"type": "integer"}}})
+
+    assert _codes(validator.validate({"goals": True})) == {"goals": "INVALID_TYPE"}
+
+
+def test_non_object_data_is_rejected():
+    assert _codes(validate_locally("user_registration", ["not", "a", "dict"])) == {"data": "INVALID_TYPE"}
+
+
+def test_unknown_intent_falls_back_to_the_agent():
+    assert validate_locally("no_such_intent", {}) is None
+
+
+def test_duplicate_email_is_still_checked_remotely():
+    assert "duplicate_email" in remote_checks("user_registration")
+
+
+@pytest.mark.parametrize("intent", ["player_creation", "game_logging", "game_logging_bulk"])
+def test_player_ownership_is_still_checked_remotely(intent):
+    # Local schema checks cannot tell whether the playerId belongs to the user
+    assert "player_ownership" in remote_checks(intent)
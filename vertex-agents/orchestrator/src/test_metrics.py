@@ -0,0 +1,99 @@
+"""Unit tests for metrics (run: pytest test_metrics.py)"""
+
+import threading
+
+import pytest
+
+from metrics import MetricsRegistry
+
+
+def _run_in_threads(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_counter_sums_all_threads():
+    counter = MetricsRegistry("test").counter("calls_total", "Calls", ("agent",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc(agent="validation")
+
+    _run_in_threads(8, work)
+    counter.inc(agent="analytics")
+
+    assert counter.value(agent="validation") == 8000
+    assert counter.value(agent="analytics") == 1
+    assert counter.total() == 8001
+
+
+def test_exited_threads_are_folded_into_the_base_shard():
+    registry = MetricsRegistry("test")
+    counter = registry.counter("calls_total", "Calls", ("agent",))
+    histogram = registry.histogram("latency_seconds", "Latency", ("agent",))
+
+    def work():
+        counter.inc(agent="validation")
+        histogram.observe(0.02, agent="validation")
+
+    # One short-lived thread per request must not leave one shard each
+    for _ in range(50):
+        _run_in_threads(1, work)
+
+    assert counter.value(agent="validation") == 50
+    assert histogram.merged()[("validation",)].count == 50
+    assert len(counter._shards) == 0
+    assert len(histogram._shards) == 0
+
+    # The current thread's shard is kept and still counted
+    counter.inc(agent="validation")
+    assert len(counter._shards) == 1
+    assert counter.value(agent="validation") == 51
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = MetricsRegistry("test").histogram("latency_seconds", "Latency", buckets=(0.1, 0.2, 0.4))
+
+    for _ in range(50):
+        histogram.observe(0.05)
+    for _ in range(50):
+        histogram.observe(0.3)
+
+    assert histogram.quantile(0.5) == pytest.approx(0.1)
+    assert histogram.quantile(0.75) == pytest.approx(0.3)
+    assert histogram.summary()[()]["mean"] == pytest.approx(0.175)
+
+
+def test_quantile_without_samples_is_none():
+    histogram = MetricsRegistry("test").histogram("latency_seconds", "Latency", ("agent",))
+
+    assert histogram.quantile(0.99, agent="validation") is None
+
+
+def test_prometheus_export():
+    registry = MetricsRegistry("test")
+    registry.counter("requests_total", "Requests", ("intent",)).inc(intent='say "hi"')
+    registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0)).observe(0.5)
+
+    text = registry.to_prometheus()
+
+    assert '# TYPE test_requests_total counter' in text
+    assert 'test_requests_total{intent="say \\"hi\\""} 1' in text
+    assert 'test_latency_seconds_bucket{le="0.1"} 0' in text
+    assert 'test_latency_seconds_bucket{le="1"} 1' in text
+    assert 'test_latency_seconds_bucket{le="+Inf"} 1' in text
+    assert 'test_latency_seconds_count 1' in text
+
+
+def test_openmetrics_export():
+    registry = MetricsRegistry("test")
+    registry.counter("requests_total", "Requests").inc()
+
+    text = registry.to_openmetrics()
+
+    assert "# TYPE test_requests counter" in text
+    assert "test_requests_total 1" in text
+    assert text.endswith("# EOF\n")
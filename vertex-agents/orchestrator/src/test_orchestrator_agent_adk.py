@@ -0,0 +1,207 @@
+"""Unit tests for orchestrator_agent_adk (run: pytest test_orchestrator_agent_adk.py)"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import orchestrator_agent_adk as adk
+from analytics_outbox import AnalyticsOutbox
+
+
+class FakeAgents:
+    """send_task_to_agent stand-in returning canned sub-agent results"""
+
+    OUTPUTS = {
+        "validation": {"valid": True, "errors": []},
+        "user-creation": {"userId": "user-1", "playerId": "player-1", "gameId": "game-1"},
+        "onboarding": {"emailSent": True},
+    }
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, agent_name, message, context=None, session_id=None, timeout=30):
+        self.calls.append(agent_name)
+        return {"status": "success", "agent": agent_name, "data": self.OUTPUTS.get(agent_name, {})}
+
+
+@pytest.fixture
+def agents(monkeypatch):
+    fake = FakeAgents()
+    monkeypatch.setattr(adk, "send_task_to_agent", fake)
+    return fake
+
+
+@pytest.fixture
+def outbox(monkeypatch):
+    batches = []
+    outbox = AnalyticsOutbox(lambda batch: batches.append(batch) or True, flush_interval_ms=10)
+    outbox.batches = batches
+    monkeypatch.setattr(adk, "_analytics", outbox)
+    yield outbox
+    outbox.close()
+
+
+REGISTRATION = {
+    "firstName": "Jane",
+    "lastName": "Parent",
+    "email": "jane@example.com",
+    "password": "correct-horse",
+    "agreedToTerms": True,
+    "isParentGuardian": True,
+}
+
+
+@pytest.mark.parametrize("intent, data, auth, event", [
+    ("user_registration", REGISTRATION, None, "user_registration"),
+    ("player_creation", {"name": "Emma", "position": "Forward"}, {"uid": "user-1"}, "player_creation"),
+    ("game_logging", {"playerId": "player-1"}, {"uid": "user-1"}, "game_logging"),
+])
+def test_direct_path_queues_analytics(agents, outbox, intent, data, auth, event):
+    result = adk._execute_direct(intent, data, auth, "req-1", "session-1")
+
+    assert result["success"]
+    assert result["agent_execution"]["analytics"] == {"status": "queued", "agent": "analytics"}
+    # The request thread never calls the analytics agent itself
+    assert "analytics" not in agents.calls
+
+    assert outbox.flush(timeout=5)
+    [[queued]] = outbox.batches
+    assert queued["event"] == event
+    assert queued["sessionId"] == "session-1"
+
+
+def test_session_lru_evicts_least_recently_used():
+    sessions = adk.SessionLRU(max_sessions=2, ttl_seconds=3600)
+    for session_id in ("s1", "s2"):
+        sessions.acquire("user-1", session_id)
+        sessions.release("user-1", session_id)
+
+    assert sessions.acquire("user-1", "s3") == [("user-1", "s1")]
+    assert len(sessions) == 2
+
+
+def test_session_lru_keeps_sessions_with_an_active_run():
+    sessions = adk.SessionLRU(max_sessions=2, ttl_seconds=3600)
+    sessions.acquire("user-1", "s1")  # Still running
+    sessions.acquire("user-1", "s2")
+    sessions.release("user-1", "s2")
+
+    assert sessions.acquire("user-1", "s3") == [("user-1", "s2")]
+
+    sessions.release("user-1", "s1")
+    sessions.release("user-1", "s3")
+    assert sessions.acquire("user-1", "s4") == [("user-1", "s1")]
+
+
+def test_session_lru_expires_idle_sessions_not_running_ones(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(adk.time, "monotonic", lambda: now[0])
+    sessions = adk.SessionLRU(max_sessions=10, ttl_seconds=60)
+    sessions.acquire("user-1", "running")
+    sessions.acquire("user-1", "idle")
+    sessions.release("user-1", "idle")
+
+    now[0] += 61
+    assert sessions.acquire("user-1", "idle") == [("user-1", "idle")]
+    assert sessions.acquire("user-1", "other") == []
+    assert len(sessions) == 3
+
+
+def test_agent_turn_works_inside_a_running_loop(monkeypatch):
+    async def fake_run_agent(prompt, user_id, session_id):
+        await asyncio.sleep(0)
+        return f"{user_id}:{prompt}"
+
+    monkeypatch.setattr(adk, "_run_agent", fake_run_agent)
+
+    async def caller():
+        # A bare asyncio.run here would raise RuntimeError
+        return adk._dispatch("free_form", {"message": "hi"}, {"uid": "user-1"}, "req-1", "session-1")
+
+    result = asyncio.run(caller())
+
+    assert result == {"success": True, "data": {"response": "user-1:hi"}, "session_id": "session-1"}
+
+
+def test_agent_turns_share_one_loop_off_the_workflow_executor(monkeypatch):
+    loops, threads = set(), set()
+    active = [0, 0]  # current, peak
+
+    async def fake_run_agent(prompt, user_id, session_id):
+        loops.add(asyncio.get_running_loop())
+        threads.add(threading.current_thread().name)
+        active[0] += 1
+        active[1] = max(active)
+        await asyncio.sleep(0.05)
+        active[0] -= 1
+        return prompt
+
+    monkeypatch.setattr(adk, "_run_agent", fake_run_agent)
+
+    def dispatch(i):
+        return adk._dispatch("free_form", {"message": f"m{i}"}, {"uid": "user-1"}, f"req-{i}", f"s{i}")
+
+    with ThreadPoolExecutor(max_workers=4) as callers:
+        results = list(callers.map(dispatch, range(4)))
+
+    assert [result["data"]["response"] for result in results] == ["m0", "m1", "m2", "m3"]
+    assert len(loops) == 1
+    assert threads == {"hustle-adk-agent-loop"}
+    assert active[1] > 1  # Turns overlap on the loop
+
+
+def test_waiting_for_a_turn_on_the_agent_loop_raises():
+    async def on_agent_loop():
+        adk._run_on_agent_loop(asyncio.sleep(0))
+
+    future = asyncio.run_coroutine_threadsafe(on_agent_loop(), adk._get_agent_loop())
+    with pytest.raises(RuntimeError):
+        future.result(timeout=5)
+
+
+def _tool_names(agent):
+    return [tool.name for tool in agent.tools]
+
+
+def test_docs_tool_is_added_when_the_index_loads(monkeypatch):
+    def search_adk_docs(query: str, top_k: int = 3) -> dict:
+        return {"status": "success", "results": []}
+
+    monkeypatch.setattr(adk, "load_search_tool", lambda: search_adk_docs)
+
+    assert "search_adk_docs" in _tool_names(adk._build_orchestrator_agent())
+
+
+def test_agent_builds_without_the_docs_tool(monkeypatch, caplog):
+    monkeypatch.setattr(adk, "load_search_tool", None)
+
+    assert "search_adk_docs" not in _tool_names(adk._build_orchestrator_agent())
+    assert "search_adk_docs disabled" in caplog.text
+
+
+@pytest.mark.parametrize("data", [None, {}, {"message": ""}])
+def test_free_form_without_a_message_is_a_validation_error(data):
+    result = adk._dispatch("free_form", data, {"uid": "user-1"}, "req-1", "session-1")
+
+    assert result["success"] is False
+    assert result["errors"][0]["code"] in ("REQUIRED", "INVALID_TYPE")
+    assert result["session_id"] == "session-1"
+
+
+def test_bad_data_without_local_validation_is_a_structured_error(monkeypatch):
+    # No readable agent card: the prompt build fails inside the error handling
+    monkeypatch.setattr(adk, "validate_locally", lambda intent, data: None)
+
+    result = adk._dispatch("free_form", {}, {"uid": "user-1"}, "req-1", "session-1")
+
+    assert result["success"] is False
+    assert result["errors"][0]["code"] == "ORCHESTRATION_ERROR"
+
+
+def test_unknown_intent_on_the_agent_path():
+    result = adk._dispatch("no_such_intent", {}, {"uid": "user-1"}, "req-1", "session-1")
+
+    assert result["errors"][0]["code"] == "UNKNOWN_INTENT"
@@ -0,0 +1,275 @@
+"""Unit tests for resilience (run: pytest test_resilience.py)"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import resilience
+from resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    async_call_with_resilience,
+    call_with_resilience,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(resilience, "_states", {})
+    monkeypatch.setattr(resilience, "_backoff_seconds", lambda retry: 0)
+
+
+class FlakyAgent:
+    """Fails with the given errors in order, then succeeds"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def test_idempotent_agent_is_retried():
+    attempt = FlakyAgent(TimeoutError("slow"), TimeoutError("slow"))
+
+    assert call_with_resilience("validation", attempt) == "ok"
+    assert attempt.calls == 3
+
+
+def test_retries_stop_at_max_attempts():
+    attempt = FlakyAgent(*[TimeoutError("slow")] * 5)
+
+    with pytest.raises(TimeoutError):
+        call_with_resilience("validation", attempt)
+    assert attempt.calls == 3
+
+
+@pytest.mark.parametrize("agent_name", ["user-creation", "onboarding", "analytics"])
+def test_non_idempotent_agent_is_not_retried_after_a_timeout(agent_name):
+    # The agent may have created the account before the response was lost
+    attempt = FlakyAgent(TimeoutError("deadline exceeded"))
+
+    with pytest.raises(TimeoutError):
+        call_with_resilience(agent_name, attempt)
+    assert attempt.calls == 1
+
+
+def test_non_idempotent_agent_is_retried_when_the_request_was_never_sent():
+    attempt = FlakyAgent(ConnectionRefusedError("refused"))
+
+    assert call_with_resilience("user-creation", attempt) == "ok"
+    assert attempt.calls == 2
+
+
+def test_unknown_agents_get_a_single_attempt():
+    attempt = FlakyAgent(ConnectionRefusedError("refused"))
+
+    with pytest.raises(ConnectionRefusedError):
+        call_with_resilience("not-configured", attempt)
+    assert attempt.calls == 1
+
+
+def test_async_follows_the_same_retry_rules():
+    timeout = FlakyAgent(TimeoutError("slow"))
+    refused = FlakyAgent(ConnectionRefusedError("refused"))
+
+    async def run(agent_name, flaky):
+        async def attempt():
+            return flaky()
+        return await async_call_with_resilience(agent_name, attempt)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(run("user-creation", timeout))
+    assert asyncio.run(run("user-creation", refused)) == "ok"
+    assert (timeout.calls, refused.calls) == (1, 2)
+
+
+def test_retry_budget_limits_retries():
+    budget = RetryBudget(ratio=0.5, max_tokens=1)
+
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_withdraw()
+
+
+def test_circuit_opens_then_lets_one_probe_through():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_s=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()  # The probe
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_open_circuit_fails_fast():
+    attempt = FlakyAgent()
+    resilience._state("validation").breaker.state = "open"
+    resilience._state("validation").breaker._opened_at = time.monotonic()
+
+    with pytest.raises(CircuitOpenError):
+        call_with_resilience("validation", attempt)
+    assert attempt.calls == 0
+
+
+def _seed_latency(agent_name, seconds):
+    for _ in range(resilience.HEDGE_MIN_SAMPLES):
+        resilience._state(agent_name).latency.record(seconds)
+
+
+def test_slow_idempotent_call_is_hedged():
+    _seed_latency("validation", 0.01)
+    calls = []
+    first_released = threading.Event()
+
+    def attempt():
+        calls.append(threading.current_thread().name)
+        if len(calls) == 1:
+            first_released.wait(2)  # The first request hangs
+            return "first"
+        return "hedge"
+
+    assert call_with_resilience("validation", attempt) == "hedge"
+    assert len(calls) == 2
+    first_released.set()
+
+
+@pytest.mark.parametrize("agent_name", ["user-creation", "analytics"])
+def test_non_idempotent_call_is_never_hedged(agent_name):
+    _seed_latency(agent_name, 0.01)
+    calls = []
+
+    def attempt():
+        calls.append(1)
+        time.sleep(0.05)
+        return "created"
+
+    assert call_with_resilience(agent_name, attempt) == "created"
+    assert len(calls) == 1
+
+
+def test_async_hedge_cancels_the_loser():
+    _seed_latency("validation", 0.01)
+    cancelled = []
+
+    async def run():
+        count = 0
+
+        async def attempt():
+            nonlocal count
+            count += 1
+            if count == 1:
+                try:
+                    await asyncio.sleep(2)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+                return "first"
+            return "hedge"
+
+        result = await async_call_with_resilience("validation", attempt)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == "hedge"
+    assert cancelled == [True]
+
+
+def _half_open(agent_name):
+    breaker = resilience._state(agent_name).breaker
+    breaker.state = "open"
+    breaker._opened_at = time.monotonic() - breaker.reset_timeout_s
+    return breaker
+
+
+def test_cancelled_half_open_probe_is_released():
+    breaker = _half_open("validation")
+
+    async def run():
+        task = asyncio.ensure_future(async_call_with_resilience("validation", lambda: asyncio.sleep(10)))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    # The next call probes instead of failing fast forever
+    assert call_with_resilience("validation", lambda: "ok") == "ok"
+    assert breaker.state == "closed"
+
+
+def test_interrupted_half_open_probe_is_released():
+    class Interrupted(BaseException):
+        pass
+
+    breaker = _half_open("validation")
+
+    with pytest.raises(Interrupted):
+        call_with_resilience("validation", FlakyAgent(Interrupted()))
+
+    assert breaker.allow()
+
+
+def _grpc_error(target):
+    """The error a real gRPC call to target raises, wrapped by api_core"""
+    import grpc
+    from google.api_core import grpc_helpers
+
+    channel = grpc.insecure_channel(target)
+    call = grpc_helpers.wrap_errors(channel.unary_unary(
+        "/hustle.Agent/Execute", request_serializer=bytes, response_deserializer=bytes,
+    ))
+    try:
+        call(b"", timeout=5)
+    except Exception as e:
+        return e
+    finally:
+        channel.close()
+
+
+@pytest.mark.parametrize("target", ["127.0.0.1:1", "no-such-agent.invalid:443"])
+def test_wrapped_grpc_connect_failures_count_as_not_sent(target):
+    error = _grpc_error(target)
+    attempt = FlakyAgent(error)
+
+    assert type(error).__name__ == "ServiceUnavailable"
+    assert call_with_resilience("user-creation", attempt) == "ok"
+    assert attempt.calls == 2
+
+
+def test_other_unavailable_errors_may_have_been_processed():
+    from google.api_core.exceptions import DeadlineExceeded, ServiceUnavailable
+
+    for error in (ServiceUnavailable("Socket closed"), DeadlineExceeded("Deadline Exceeded")):
+        attempt = FlakyAgent(error)
+        with pytest.raises(type(error)):
+            call_with_resilience("user-creation", attempt)
+        assert attempt.calls == 1
+
+
+def test_not_sent_error_found_through_the_cause_chain():
+    try:
+        try:
+            raise ConnectionRefusedError("refused")
+        except ConnectionRefusedError as e:
+            raise RuntimeError("agent call failed") from e
+    except RuntimeError as e:
+        attempt = FlakyAgent(e)
+
+    assert call_with_resilience("onboarding", attempt) == "ok"
@@ -0,0 +1,92 @@
+"""Unit tests for response_shaping (run: pytest test_response_shaping.py)"""
+
+import response_shaping
+from response_shaping import REDACTED, DebugTraceSink, redact, shape_response
+
+RESULT = {
+    "success": True,
+    "data": {"userId": "user-1"},
+    "agent_execution": {
+        "validation": {"status": "success", "agent": "validation", "duration_ms": 12, "output": {"valid": True}},
+        "user_creation": {
+            "status": "failed",
+            "agent": "user-creation",
+            "duration_ms": 30,
+            "error": "timeout",
+            "session_id": "session-1",
+        },
+    },
+}
+
+
+def test_redact_masks_sensitive_keys_at_any_depth():
+    value = {
+        "email": "jane@example.com",
+        "password": "correct-horse",
+        "nested": [{"confirmPassword": "x", "idToken": "y", "name": "Emma"}],
+        "Authorization": "Bearer abc",
+    }
+
+    assert redact(value) == {
+        "email": "jane@example.com",
+        "password": REDACTED,
+        "nested": [{"confirmPassword": REDACTED, "idToken": REDACTED, "name": "Emma"}],
+        "Authorization": REDACTED,
+    }
+    assert value["password"] == "correct-horse"
+
+
+def test_compact_response_keeps_only_client_fields(monkeypatch):
+    monkeypatch.setattr(response_shaping, "RESPONSE_DETAIL", "compact")
+
+    shaped = shape_response(RESULT)
+
+    assert shaped["data"] == RESULT["data"]
+    assert shaped["agent_execution"] == {
+        "validation": {"status": "success", "agent": "validation", "duration_ms": 12},
+        "user_creation": {"status": "failed", "agent": "user-creation", "duration_ms": 30, "error": "timeout"},
+    }
+    # The shared result is left intact
+    assert "output" in RESULT["agent_execution"]["validation"]
+
+
+def test_full_response_detail_returns_the_result(monkeypatch):
+    monkeypatch.setattr(response_shaping, "RESPONSE_DETAIL", "full")
+
+    assert shape_response(RESULT) is RESULT
+
+
+def test_results_without_agent_execution_are_unchanged():
+    result = {"success": False, "errors": [{"agent": "orchestrator", "code": "OVERLOADED"}]}
+
+    assert shape_response(result) is result
+
+
+def test_failures_are_always_traced():
+    sink = DebugTraceSink(sample_rate=0)
+
+    assert not sink.record("user_registration", "req-1", RESULT)
+    assert sink.record("user_registration", "req-2", {**RESULT, "success": False})
+    assert [trace["request_id"] for trace in sink.recent()] == ["req-2"]
+
+
+def test_traces_are_redacted():
+    sink = DebugTraceSink(sample_rate=1)
+    result = {
+        "success": True,
+        "agent_execution": {"user_creation": {"status": "success", "output": {"password": "correct-horse"}}},
+    }
+
+    sink.record("user_registration", "req-1", result)
+
+    trace = sink.recent()[0]
+    assert trace["agent_execution"]["user_creation"]["output"] == {"password": REDACTED}
+
+
+def test_trace_buffer_keeps_the_most_recent():
+    sink = DebugTraceSink(sample_rate=1, buffer_size=2)
+    for request_id in ("req-1", "req-2", "req-3"):
+        sink.record("game_logging", request_id, RESULT)
+
+    assert [trace["request_id"] for trace in sink.recent()] == ["req-2", "req-3"]
+    assert [trace["request_id"] for trace in sink.recent(limit=1)] == ["req-3"]
@@ -0,0 +1,135 @@
+"""Unit tests for singleflight (run: pytest test_singleflight.py)"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import singleflight
+from singleflight import AsyncSingleFlight, IdempotencyStore, SingleFlight, request_key
+
+
+def test_request_key_normalizes_the_payload():
+    key = request_key("user_registration", {"email": "Jane@Example.com ", "firstName": "Jane"})
+
+    assert key == request_key("user_registration", {"firstName": " Jane", "email": "jane@example.com"})
+    # Only email is case-insensitive
+    assert key != request_key("user_registration", {"email": "jane@example.com", "firstName": "jane"})
+
+
+def test_request_key_is_scoped_to_intent_and_caller():
+    data = {"name": "Emma"}
+
+    assert request_key("player_creation", data, {"uid": "a"}) != request_key("player_creation", data, {"uid": "b"})
+    assert request_key("player_creation", data) != request_key("game_logging", data)
+
+
+def test_concurrent_duplicates_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def create_account():
+        calls.append(1)
+        release.wait(5)
+        return {"userId": "user-1"}
+
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(flight.do, "key", create_account) for _ in range(4)]
+        time.sleep(0.1)  # Let the followers join the leader's call
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert all(result == {"userId": "user-1"} for result, _ in results)
+    # Followers get copies, so one caller can't mutate another's response
+    assert len({id(result) for result, _ in results}) == 4
+
+
+def test_leader_error_is_raised_to_followers_and_not_kept():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise RuntimeError("creation failed")
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, "key", failing)
+        while "key" not in flight._calls:
+            pass
+        follower = pool.submit(flight.do, "key", failing)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError):
+                future.result()
+
+    assert flight.do("key", lambda: "retried") == ("retried", False)
+
+
+def test_async_duplicates_share_one_execution():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def create_account():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"userId": "user-1"}
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("key", create_account) for _ in range(3)))
+
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert [shared for _, shared in results] == [False, True, True]
+
+
+def test_async_cancelled_follower_does_not_cancel_the_leader():
+    flight = AsyncSingleFlight()
+
+    async def create_account():
+        await asyncio.sleep(0.02)
+        return "created"
+
+    async def scenario():
+        leader = asyncio.ensure_future(flight.do("key", create_account))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", create_account))
+        await asyncio.sleep(0)
+        follower.cancel()
+        return await leader
+
+    assert asyncio.run(scenario()) == ("created", False)
+
+
+def test_idempotency_store_replays_copies_until_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(singleflight.time, "monotonic", lambda: now[0])
+    store = IdempotencyStore(ttl_seconds=10)
+    outcome = {"success": True, "data": {"userId": "user-1"}}
+
+    store.put("key", outcome)
+    outcome["data"]["userId"] = "mutated"
+    replay = store.get("key")
+
+    assert replay == {"success": True, "data": {"userId": "user-1"}}
+    replay["success"] = False
+    assert store.get("key")["success"]
+
+    now[0] += 11
+    assert store.get("key") is None
+
+
+def test_idempotency_store_evicts_least_recently_used():
+    store = IdempotencyStore(max_entries=2)
+    store.put("a", 1)
+    store.put("b", 2)
+    store.get("a")
+    store.put("c", 3)
+
+    assert store.get("b") is None
+    assert (store.get("a"), store.get("c")) == (1, 3)
@@ -0,0 +1,149 @@
+"""Unit tests for workflow (run: pytest test_workflow.py)"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from workflow import Workflow, WorkflowContext, WorkflowNode
+
+
+def _node(name, depends_on=(), critical=True, **kwargs):
+    return WorkflowNode(
+        name=name,
+        agent=f"{name}-agent",
+        message=name,
+        build_context=lambda ctx: dict(ctx.data),
+        depends_on=depends_on,
+        critical=critical,
+        **kwargs,
+    )
+
+
+def _registration(**overrides):
+    nodes = {
+        "validation": _node("validation"),
+        "creation": _node("creation", ("validation",)),
+        "onboarding": _node("onboarding", ("creation",)),
+        "analytics": _node("analytics", ("creation",), critical=False),
+    }
+    nodes.update(overrides)
+    return Workflow("user_registration", list(nodes.values()))
+
+
+def _ctx():
+    return WorkflowContext(data={"email": "a@b.c"}, auth={"uid": "u1"}, session_id="s1")
+
+
+class RecordingSendTask:
+    """send_task stand-in recording call order, optionally blocking one agent"""
+
+    def __init__(self, block_agent=None):
+        self.calls = []
+        self.release = threading.Event()
+        self.block_agent = block_agent
+        self._lock = threading.Lock()
+
+    def __call__(self, agent_name, message, context, session_id, timeout):
+        with self._lock:
+            self.calls.append(agent_name)
+        if agent_name == self.block_agent:
+            self.release.wait(5)
+        return {"status": "success", "agent": agent_name}
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError, match="unknown node"):
+        Workflow("intent", [_node("a", ("missing",))])
+
+
+def test_cycle_is_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        Workflow("intent", [_node("a", ("b",)), _node("b", ("a",))])
+
+
+def test_nodes_run_after_their_dependencies():
+    send_task = RecordingSendTask()
+
+    result = _registration().run(send_task, _ctx(), ThreadPoolExecutor(4))
+
+    assert result.success
+    assert send_task.calls[:2] == ["validation-agent", "creation-agent"]
+    assert set(result.results) >= {"validation", "creation", "onboarding"}
+
+
+def test_response_does_not_wait_for_non_critical_nodes():
+    send_task = RecordingSendTask(block_agent="analytics-agent")
+    ctx = _ctx()
+
+    result = _registration().run(send_task, ctx, ThreadPoolExecutor(4))
+
+    assert result.success
+    assert result.pending == ["analytics"]
+    assert result.agent_execution["analytics"] == {"status": "pending", "agent": "analytics"}
+
+    send_task.release.set()
+    deadline = time.time() + 5
+    while "analytics" not in ctx.results and time.time() < deadline:
+        time.sleep(0.01)
+    assert ctx.results["analytics"]["status"] == "success"
+
+
+def test_failed_check_stops_the_workflow():
+    errors = [{"agent": "validation", "code": "INVALID", "message": "bad email"}]
+    workflow = _registration(validation=_node("validation", check=lambda result: errors))
+    send_task = RecordingSendTask()
+
+    result = workflow.run(send_task, _ctx(), ThreadPoolExecutor(4))
+
+    assert not result.success
+    assert result.errors == errors
+    assert send_task.calls == ["validation-agent"]
+
+
+def test_skipped_nodes_unblock_their_dependents():
+    workflow = _registration(validation=_node("validation", skip_if=lambda ctx: True))
+    send_task = RecordingSendTask()
+
+    result = workflow.run(send_task, _ctx(), ThreadPoolExecutor(4))
+
+    assert result.results["validation"] == {"status": "skipped", "agent": "validation-agent"}
+    assert "validation-agent" not in send_task.calls
+    assert "creation" in result.results
+
+
+def test_nodes_see_the_callers_contextvars():
+    request_id = contextvars.ContextVar("request_id", default=None)
+    seen = []
+
+    def send_task(agent_name, message, context, session_id, timeout):
+        seen.append(request_id.get())
+        return {"status": "success", "agent": agent_name}
+
+    request_id.set("req-1")
+    _registration(analytics=_node("analytics", ("creation",))).run(send_task, _ctx(), ThreadPoolExecutor(4))
+
+    assert seen == ["req-1"] * 4
+
+
+def test_run_async_matches_run():
+    calls = []
+
+    async def send_task(agent_name, message, context, session_id, timeout):
+        calls.append(agent_name)
+        return {"status": "success", "agent": agent_name}
+
+    async def scenario():
+        ctx = _ctx()
+        result = await _registration().run_async(send_task, ctx)
+        await asyncio.sleep(0)  # Let the background analytics node finish
+        return result, ctx
+
+    result, ctx = asyncio.run(scenario())
+
+    assert result.success
+    assert calls[:2] == ["validation-agent", "creation-agent"]
+    assert "analytics" in ctx.results
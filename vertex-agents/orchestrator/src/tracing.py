@@ -0,0 +1,154 @@
+"""
+OpenTelemetry tracing for the orchestrator.
+
+Spans tie one request's hops into a single timeline:
+
+    orchestrator.execute
+    └── workflow.run
+        ├── workflow.node validation ── a2a.send_task validation
+        ├── workflow.node creation   ── a2a.send_task user-creation
+        └── workflow.node onboarding ── a2a.send_task onboarding
+
+The W3C trace context (`traceparent`) is injected into every A2A payload
+under `trace_context`, so sub-agents can continue the trace. Workflow nodes
+run on pool threads with a copy of the caller's context (see workflow.py), so
+their spans nest under the request.
+
+Exporters (HUSTLE_TRACE_EXPORTER):
+- gcp (default): Cloud Trace, batched
+- none: spans are created but not exported
+For tests, `enable_in_memory_exporter()` captures finished spans in memory.
+
+OpenTelemetry is imported on first use. If it is not installed, spans are
+no-ops.
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACE_EXPORTER = os.getenv("HUSTLE_TRACE_EXPORTER", "gcp")
+TRACER_NAME = "hustle.orchestrator"
+
+_tracer_provider: Any = None
+_configured = False
+_lock = threading.Lock()
+
+
+class _NoopSpan:
+    """Stands in for a span when OpenTelemetry is unavailable"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def set_status(self, status: Any) -> None:
+        pass
+
+
+def ensure_tracing() -> None:
+    """Configure the span exporter once per process (idempotent, thread-safe)."""
+    global _tracer_provider, _configured
+
+    if _configured:
+        return
+
+    with _lock:
+        if _configured:
+            return
+
+        if TRACE_EXPORTER == "gcp":
+            try:
+                from opentelemetry.exporter.cloud_trace import CloudTraceSpanExporter
+                from opentelemetry.sdk.trace import TracerProvider
+                from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+                provider = TracerProvider()
+                provider.add_span_processor(BatchSpanProcessor(CloudTraceSpanExporter()))
+                _tracer_provider = provider
+            except Exception as e:
+                logger.warning(f"Cloud Trace unavailable, spans will not be exported: {e}")
+
+        _configured = True
+
+
+def enable_in_memory_exporter() -> Any:
+    """
+    Capture finished spans in memory (for tests and local profiling).
+
+    Returns:
+        InMemorySpanExporter; call `get_finished_spans()` to read spans
+    """
+    global _tracer_provider, _configured
+
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    with _lock:
+        _tracer_provider = provider
+        _configured = True
+
+    return exporter
+
+
+def _get_tracer() -> Optional[Any]:
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+
+    if _tracer_provider is not None:
+        return _tracer_provider.get_tracer(TRACER_NAME)
+    return trace.get_tracer(TRACER_NAME)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """
+    Start a span as the current span; exceptions are recorded on it.
+
+    Args:
+        name: Span name (orchestrator.execute, a2a.send_task, ...)
+        **attributes: Span attributes (None values are skipped)
+    """
+    tracer = _get_tracer()
+    if tracer is None:
+        yield _NoopSpan()
+        return
+
+    with tracer.start_as_current_span(
+        name,
+        attributes={key: value for key, value in attributes.items() if value is not None},
+    ) as current:
+        yield current
+
+
+def mark_failed(current: Any, message: str) -> None:
+    """Set ERROR status on a span for failures that do not raise."""
+    try:
+        from opentelemetry.trace import Status, StatusCode
+    except ImportError:
+        return
+    current.set_status(Status(StatusCode.ERROR, message))
+
+
+def trace_context() -> Dict[str, str]:
+    """W3C trace context headers for the current span (empty if none)."""
+    carrier: Dict[str, str] = {}
+    try:
+        from opentelemetry import propagate
+    except ImportError:
+        return carrier
+    propagate.inject(carrier)
+    return carrier
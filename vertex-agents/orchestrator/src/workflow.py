@@ -0,0 +1,388 @@
+"""
+Declarative DAG workflows for HustleOrchestrator intents.
+
+Each intent is a small graph of sub-agent calls, e.g. user registration:
+
+    validation → creation → {onboarding, analytics}
+
+Nodes run on one shared thread pool as soon as their dependencies succeed, so
+independent nodes run concurrently. `Workflow.run` returns as soon as every
+critical node has finished; non-critical nodes (analytics) keep running in
+the background. Response latency is the critical path, not the sum of all hops.
+
+Each node runs in a copy of the caller's contextvars, so trace spans (and any
+other context) follow the request onto pool threads.
+
+`Workflow.run_async` runs the same DAG on an event loop, with one task per
+node instead of a pool thread.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Shared by all requests in the process (A2A calls are I/O bound)
+WORKFLOW_MAX_WORKERS = int(os.getenv("HUSTLE_WORKFLOW_MAX_WORKERS", "16"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Strong references to background node tasks of async runs
+_background_tasks: Set["asyncio.Task"] = set()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide workflow executor, creating it on first use."""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=WORKFLOW_MAX_WORKERS,
+                    thread_name_prefix="hustle-workflow",
+                )
+
+    return _executor
+
+
+@dataclass
+class WorkflowContext:
+    """Request data shared by all nodes of one workflow run"""
+    data: Dict[str, Any]
+    auth: Optional[Dict[str, Any]]
+    session_id: str
+    results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def user_id(self) -> Optional[str]:
+        return self.auth.get("uid") if self.auth else None
+
+
+@dataclass
+class WorkflowNode:
+    """One sub-agent call in an intent workflow"""
+    name: str  # Key in agent_execution
+    agent: str  # Sub-agent name for A2AClient.send_task
+    message: str
+    build_context: Callable[[WorkflowContext], Dict[str, Any]]
+    timeout: int = 30
+    depends_on: Tuple[str, ...] = ()
+    critical: bool = True  # The response waits for critical nodes only
+    # Returns errors to stop the workflow, or None to continue
+    check: Optional[Callable[[Dict[str, Any]], Optional[List[Dict[str, Any]]]]] = None
+    # Returns True to skip the call (recorded as "skipped", check not run)
+    skip_if: Optional[Callable[[WorkflowContext], bool]] = None
+
+
+@dataclass
+class WorkflowResult:
+    """Outcome of a workflow run at the time the response is built"""
+    results: Dict[str, Dict[str, Any]]
+    errors: Optional[List[Dict[str, Any]]] = None
+    pending: List[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return self.errors is None
+
+    @property
+    def agent_execution(self) -> Dict[str, Dict[str, Any]]:
+        execution = dict(self.results)
+        for name in self.pending:
+            execution[name] = {"status": "pending", "agent": name}
+        return execution
+
+
+class Workflow:
+    """A validated DAG of WorkflowNodes for one intent"""
+
+    def __init__(self, intent: str, nodes: List[WorkflowNode]):
+        self.intent = intent
+        self.nodes = {node.name: node for node in nodes}
+
+        for node in nodes:
+            for dependency in node.depends_on:
+                if dependency not in self.nodes:
+                    raise ValueError(f"{intent}: node {node.name} depends on unknown node {dependency}")
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        visited: Dict[str, str] = {}
+
+        def visit(name: str) -> None:
+            if visited.get(name) == "done":
+                return
+            if visited.get(name) == "visiting":
+                raise ValueError(f"{self.intent}: workflow has a cycle at node {name}")
+            visited[name] = "visiting"
+            for dependency in self.nodes[name].depends_on:
+                visit(dependency)
+            visited[name] = "done"
+
+        for name in self.nodes:
+            visit(name)
+
+    def run(
+        self,
+        send_task: Callable[..., Dict[str, Any]],
+        ctx: WorkflowContext,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> WorkflowResult:
+        """
+        Execute the workflow until every critical node has finished.
+
+        Args:
+            send_task: A2AClient.send_task (or compatible callable).
+            ctx: Request context; node results are stored in ctx.results.
+            executor: Thread pool for node calls (defaults to the shared one).
+
+        Returns:
+            WorkflowResult with completed results, errors if a node's check
+            failed, and the names of non-critical nodes still running.
+        """
+        with span("workflow.run", intent=self.intent) as current:
+            result = self._run(send_task, ctx, executor or get_executor())
+            current.set_attribute("success", result.success)
+            current.set_attribute("pending", ",".join(result.pending))
+            return result
+
+    def _run(
+        self,
+        send_task: Callable[..., Dict[str, Any]],
+        ctx: WorkflowContext,
+        executor: ThreadPoolExecutor,
+    ) -> WorkflowResult:
+        futures: Dict[Future, str] = {}
+        submitted = set()
+
+        def submit_ready() -> None:
+            for node in self._take_ready(ctx, submitted):
+                run_in_context = contextvars.copy_context().run
+                futures[executor.submit(run_in_context, self._call, node, send_task, ctx)] = node.name
+
+        def critical_done() -> bool:
+            return all(
+                name in ctx.results for name, node in self.nodes.items() if node.critical
+            )
+
+        submit_ready()
+        while futures and not critical_done():
+            done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = futures.pop(future)
+                result = future.result()
+                ctx.results[name] = result
+
+                node = self.nodes[name]
+                errors = node.check(result) if node.check else None
+                if errors is not None:
+                    return WorkflowResult(results=dict(ctx.results), errors=errors)
+
+            submit_ready()
+
+        # Critical path finished: leave the rest to run in the background
+        pending = [name for name in self.nodes if name not in ctx.results]
+        background = _BackgroundRun(self, send_task, ctx, executor, submitted)
+        for future, name in futures.items():
+            background.watch(name, future)
+
+        if pending:
+            logger.info(
+                f"Workflow {self.intent}: responding before {', '.join(pending)}",
+                extra={"intent": self.intent, "pending": pending}
+            )
+
+        return WorkflowResult(results=dict(ctx.results), pending=pending)
+
+    async def run_async(
+        self,
+        send_task: Callable[..., Awaitable[Dict[str, Any]]],
+        ctx: WorkflowContext,
+    ) -> WorkflowResult:
+        """
+        Execute the workflow on the running event loop (see `run`).
+
+        Args:
+            send_task: AsyncA2AClient.send_task (or compatible coroutine function).
+            ctx: Request context; node results are stored in ctx.results.
+        """
+        with span("workflow.run", intent=self.intent, mode="async") as current:
+            result = await self._run_async(send_task, ctx)
+            current.set_attribute("success", result.success)
+            current.set_attribute("pending", ",".join(result.pending))
+            return result
+
+    async def _run_async(
+        self,
+        send_task: Callable[..., Awaitable[Dict[str, Any]]],
+        ctx: WorkflowContext,
+    ) -> WorkflowResult:
+        tasks: Dict[asyncio.Task, str] = {}
+        submitted = set()
+
+        def submit_ready() -> None:
+            for node in self._take_ready(ctx, submitted):
+                tasks[asyncio.ensure_future(self._call_async(node, send_task, ctx))] = node.name
+
+        def critical_done() -> bool:
+            return all(
+                name in ctx.results for name, node in self.nodes.items() if node.critical
+            )
+
+        submit_ready()
+        while tasks and not critical_done():
+            done, _ = await asyncio.wait(list(tasks), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = tasks.pop(task)
+                result = task.result()
+                ctx.results[name] = result
+
+                node = self.nodes[name]
+                errors = node.check(result) if node.check else None
+                if errors is not None:
+                    return WorkflowResult(results=dict(ctx.results), errors=errors)
+
+            submit_ready()
+
+        # Critical path finished: leave the rest to run in the background
+        pending = [name for name in self.nodes if name not in ctx.results]
+        if tasks:
+            background = asyncio.ensure_future(
+                self._finish_async(tasks, send_task, ctx, submitted)
+            )
+            _background_tasks.add(background)
+            background.add_done_callback(_background_tasks.discard)
+
+            logger.info(
+                f"Workflow {self.intent}: responding before {', '.join(pending)}",
+                extra={"intent": self.intent, "pending": pending}
+            )
+
+        return WorkflowResult(results=dict(ctx.results), pending=pending)
+
+    async def _finish_async(
+        self,
+        tasks: Dict[asyncio.Task, str],
+        send_task: Callable[..., Awaitable[Dict[str, Any]]],
+        ctx: WorkflowContext,
+        submitted: set,
+    ) -> None:
+        """Record background nodes and start any nodes they unblock."""
+        while tasks:
+            done, _ = await asyncio.wait(list(tasks), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = tasks.pop(task)
+                try:
+                    ctx.results[name] = task.result()
+                except Exception as e:
+                    logger.error(
+                        f"Workflow {self.intent}: background node {name} failed: {e}",
+                        extra={"intent": self.intent, "node": name}
+                    )
+
+            for node in self._take_ready(ctx, submitted):
+                tasks[asyncio.ensure_future(self._call_async(node, send_task, ctx))] = node.name
+
+    def _take_ready(self, ctx: WorkflowContext, submitted: set) -> List[WorkflowNode]:
+        """Mark and return nodes whose dependencies are done; record skipped nodes inline."""
+        ready = []
+        progress = True
+        while progress:
+            progress = False
+            for name, node in self.nodes.items():
+                if name in submitted:
+                    continue
+                if all(dependency in ctx.results for dependency in node.depends_on):
+                    submitted.add(name)
+                    if node.skip_if and node.skip_if(ctx):
+                        ctx.results[name] = {"status": "skipped", "agent": node.agent}
+                        progress = True
+                    else:
+                        ready.append(node)
+        return ready
+
+    @staticmethod
+    def _call(
+        node: WorkflowNode,
+        send_task: Callable[..., Dict[str, Any]],
+        ctx: WorkflowContext,
+    ) -> Dict[str, Any]:
+        with span("workflow.node", node=node.name, agent=node.agent, critical=node.critical):
+            return send_task(
+                agent_name=node.agent,
+                message=node.message,
+                context=node.build_context(ctx),
+                session_id=ctx.session_id,
+                timeout=node.timeout,
+            )
+
+    @staticmethod
+    async def _call_async(
+        node: WorkflowNode,
+        send_task: Callable[..., Awaitable[Dict[str, Any]]],
+        ctx: WorkflowContext,
+    ) -> Dict[str, Any]:
+        with span("workflow.node", node=node.name, agent=node.agent, critical=node.critical):
+            return await send_task(
+                agent_name=node.agent,
+                message=node.message,
+                context=node.build_context(ctx),
+                session_id=ctx.session_id,
+                timeout=node.timeout,
+            )
+
+
+class _BackgroundRun:
+    """Finishes the non-critical nodes of a workflow after the response is sent."""
+
+    def __init__(
+        self,
+        workflow: Workflow,
+        send_task: Callable[..., Dict[str, Any]],
+        ctx: WorkflowContext,
+        executor: ThreadPoolExecutor,
+        submitted: set,
+    ):
+        self.workflow = workflow
+        self.send_task = send_task
+        self.ctx = ctx
+        self.executor = executor
+        self.submitted = submitted
+        # Done callbacks run outside the request's context; keep a copy
+        self.context = contextvars.copy_context()
+        self._lock = threading.Lock()
+
+    def watch(self, name: str, future: Future) -> None:
+        future.add_done_callback(lambda f: self._on_done(name, f))
+
+    def _on_done(self, name: str, future: Future) -> None:
+        """Record a background node and start any nodes it unblocked."""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(
+                f"Workflow {self.workflow.intent}: background node {name} failed: {e}",
+                extra={"intent": self.workflow.intent, "node": name}
+            )
+            return
+
+        with self._lock:
+            self.ctx.results[name] = result
+            ready = self.workflow._take_ready(self.ctx, self.submitted)
+
+        for node in ready:
+            run_in_context = self.context.copy().run
+            self.watch(
+                node.name,
+                self.executor.submit(run_in_context, Workflow._call, node, self.send_task, self.ctx)
+            )
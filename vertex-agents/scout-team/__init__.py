@@ -3,14 +3,24 @@ Hustle Scout Team - Multi-Agent System
 Lead Scout orchestrates specialized sub-agents
 """
 
-from .agent import (
-    lead_scout_agent,
-    stats_logger_agent,
-    performance_analyst_agent,
-    recruitment_advisor_agent,
-    benchmark_specialist_agent,
-    root_agent,
-)
+try:
+    from .agent import (
+        lead_scout_agent,
+        stats_logger_agent,
+        performance_analyst_agent,
+        recruitment_advisor_agent,
+        benchmark_specialist_agent,
+        root_agent,
+    )
+except ImportError:  # Loaded as a top-level module (pytest in this directory)
+    from agent import (
+        lead_scout_agent,
+        stats_logger_agent,
+        performance_analyst_agent,
+        recruitment_advisor_agent,
+        benchmark_specialist_agent,
+        root_agent,
+    )
 
 __all__ = [
     "lead_scout_agent",
@@ -9,10 +9,36 @@ Lead Scout Agent orchestrates specialized sub-agents:
 - Benchmark Specialist: Percentile comparisons
 """
 
+import logging
+
 from google.adk.agents import Agent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
 from google.adk.tools.tool_context import ToolContext
+from google.genai import types
 from typing import Optional
 
+try:
+    from .compaction import compact_history_callback
+    from .router import record_turn, route_message
+    from .stats_parser import format_confirmation, parse_game_stats
+    from .tool_cache import cached_tool, invalidate_player
+except ImportError:  # Loaded as a top-level module (local tests, Agent Engine app)
+    from compaction import compact_history_callback
+    from router import record_turn, route_message
+    from stats_parser import format_confirmation, parse_game_stats
+    from tool_cache import cached_tool, invalidate_player
+
+logger = logging.getLogger(__name__)
+
+try:
+    from tools.adk_docs_crawler.docs_index import load_search_tool
+except ImportError:
+    try:  # Deployed without the repo root, with docs_index.py bundled alongside
+        from docs_index import load_search_tool
+    except ImportError:
+        load_search_tool = None
+
 
 # ============================================================================
 # TOOLS FOR STATS LOGGER AGENT
@@ -53,6 +79,8 @@ def log_game_stats(
     # TODO: Integrate with Firestore
     # Save to state for now
     if tool_context:
+        # New game data makes cached stats/insights for this player stale
+        invalidate_player(tool_context, player_name)
         tool_context.state[f"last_game_{player_name}"] = {
             "goals": goals,
             "assists": assists,
@@ -81,6 +109,7 @@ def log_game_stats(
 # TOOLS FOR PERFORMANCE ANALYST AGENT
 # ============================================================================
 
+@cached_tool("stats_{player_name}_{timeframe}")
 def get_player_stats(
     player_name: str,
     timeframe: str = "season",
@@ -126,6 +155,7 @@ def get_player_stats(
     }
 
 
+@cached_tool("trends_{player_name}_{stat_type}")
 def analyze_trends(
     player_name: str,
     stat_type: str = "goals",
@@ -168,6 +198,7 @@ def analyze_trends(
 # TOOLS FOR RECRUITMENT ADVISOR AGENT
 # ============================================================================
 
+@cached_tool("recruitment_{player_name}_{target_division}")
 def get_recruitment_insights(
     player_name: str,
     target_division: str = "D1",
@@ -226,6 +257,7 @@ def get_recruitment_insights(
 # TOOLS FOR BENCHMARK SPECIALIST AGENT
 # ============================================================================
 
+@cached_tool("benchmarks_{player_name}_{position}")
 def compare_to_benchmarks(
     player_name: str,
     position: str,
@@ -293,6 +325,7 @@ You: "✅ Logged 2 goals for Emma vs Riverside! Great performance!"
 DO NOT handle other types of requests. Stay focused on logging stats.
 """,
     tools=[log_game_stats],
+    before_model_callback=compact_history_callback,
 )
 
 # Performance Analyst Agent - Analyzes trends and insights
@@ -317,6 +350,7 @@ You: "Emma's having a great season! 18 goals in 10 games. Her goals per game
 DO NOT log stats or handle recruitment questions. Stay focused on analysis.
 """,
     tools=[get_player_stats, analyze_trends],
+    before_model_callback=compact_history_callback,
 )
 
 # Recruitment Advisor Agent - College recruitment guidance
@@ -351,6 +385,7 @@ She's on the right track!"
 DO NOT log stats or analyze trends. Stay focused on recruitment.
 """,
     tools=[get_recruitment_insights],
+    before_model_callback=compact_history_callback,
 )
 
 # Benchmark Specialist Agent - Percentile comparisons
@@ -375,13 +410,92 @@ You: "Emma's in the 85th percentile for goals per game among forwards!
 DO NOT log stats, analyze trends, or provide recruitment advice. Stay focused on benchmarks.
 """,
     tools=[compare_to_benchmarks],
+    before_model_callback=compact_history_callback,
 )
 
 
+# ============================================================================
+# LEAD SCOUT FAST PATH (skip the LLM routing hop for obvious intents)
+# ============================================================================
+
+def _new_user_message(
+    callback_context: CallbackContext,
+    llm_request: LlmRequest,
+) -> Optional[str]:
+    """
+    Return the user's message if this is the Lead Scout's first model call
+    of the turn, otherwise None (tool responses, transfers back, etc.).
+    """
+    user_content = callback_context.user_content
+    if not user_content or not llm_request.contents:
+        return None
+
+    last_content = llm_request.contents[-1]
+    if last_content.role != "user" or last_content != user_content:
+        return None
+
+    text = "".join(part.text for part in user_content.parts or [] if part.text)
+    return text or None
+
+
+def fast_route_callback(
+    callback_context: CallbackContext,
+    llm_request: LlmRequest,
+) -> Optional[LlmResponse]:
+    """
+    Route clear intents straight to a specialist without calling Gemini.
+
+    Formulaic stats messages are logged directly with `log_game_stats` and
+    answered without any model call. Other confident routes return a
+    `transfer_to_agent` function call in place of the model's response.
+    Returns None to let the LLM decide.
+    """
+    message = _new_user_message(callback_context, llm_request)
+    if message is None:
+        return None
+
+    decision = route_message(message)
+    record_turn(decision)
+
+    if not decision.fast_path:
+        return None
+
+    if decision.agent_name == "stats_logger":
+        parsed = parse_game_stats(message)
+        if parsed.complete:
+            # CallbackContext exposes the same session state a ToolContext does
+            result = log_game_stats(**parsed.args, tool_context=callback_context)
+            return LlmResponse(
+                content=types.Content(
+                    role="model",
+                    parts=[types.Part(text=format_confirmation(result))],
+                )
+            )
+
+    return LlmResponse(
+        content=types.Content(
+            role="model",
+            parts=[
+                types.Part(
+                    function_call=types.FunctionCall(
+                        name="transfer_to_agent",
+                        args={"agent_name": decision.agent_name},
+                    )
+                )
+            ],
+        )
+    )
+
+
 # ============================================================================
 # LEAD SCOUT AGENT (Root Orchestrator)
 # ============================================================================
 
+# Map the ADK docs index once at startup, not on the first "how do I" question
+search_adk_docs = load_search_tool() if load_search_tool else None
+if load_search_tool is None:
+    logger.warning("⚠️  search_adk_docs disabled: docs_index is not importable")
+
 lead_scout_agent = Agent(
     name="lead_scout",
     model="gemini-2.0-flash",
@@ -417,6 +531,9 @@ You coordinate a team of specialists:
 - Greetings and casual conversation
 - General questions about the app
 - Clarifying questions before delegating
+- "How do I..." questions about how Scout is built (Google ADK agents, tools,
+  sessions, deployment): call `search_adk_docs` and answer only from the
+  returned passages, citing their URLs
 
 ## Your Personality
 
@@ -454,7 +571,7 @@ You: [After delegation] "Keep up the great work!"
 - Celebrate achievements and progress
 - Be the friendly coordinator who ties everything together
 """,
-    tools=[],  # Lead Scout has no direct tools, only delegates
+    tools=[search_adk_docs] if search_adk_docs else [],  # Otherwise only delegates
     sub_agents=[
         stats_logger_agent,
         performance_analyst_agent,
@@ -462,6 +579,10 @@ You: [After delegation] "Keep up the great work!"
         benchmark_specialist_agent,
     ],
     output_key="last_scout_response",  # Auto-save response to state
+    before_model_callback=[
+        compact_history_callback,  # Keep long sessions within the token budget
+        fast_route_callback,  # Local routing for clear intents
+    ],
 )
 
 
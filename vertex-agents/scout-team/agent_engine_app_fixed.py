@@ -5,12 +5,20 @@ The key is to expose a `query` method that Agent Engine can call.
 """
 
 from google.adk.agents import Agent
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.sessions import VertexAiSessionService
+from google.genai import types
 from agent import lead_scout_agent
+from router import routing_stats
+from session_cache import CachedSessionService
+import asyncio
+import json
 import logging
 import os
-from typing import Optional, Dict, Any
+import queue
+import threading
+from typing import Optional, Dict, Any, AsyncIterator, Callable, Iterator
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +32,13 @@ APP_NAME = os.getenv("APP_NAME", "hustle-scout-team")
 PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT", "hustleapp-production")
 LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
 AGENT_ENGINE_ID = os.getenv("AGENT_ENGINE_ID", "")
+MAX_CONCURRENT_QUERIES = int(os.getenv("SCOUT_MAX_CONCURRENT_QUERIES", "16"))
+# Users whose warm session pool is filled at startup
+WARM_SESSION_USERS = [
+    user_id.strip()
+    for user_id in os.getenv("SCOUT_WARM_SESSION_USERS", "default").split(",")
+    if user_id.strip()
+]
 
 logger.info(
     f"Creating Agent Engine App",
@@ -39,15 +54,22 @@ class ScoutTeamApp:
     """
     Agent Engine App wrapper for Scout Team
 
-    This class exposes a `query` method that Agent Engine can call.
+    This class exposes a `query` method that Agent Engine can call, plus a
+    native `async_query`. All agent runs execute on one long-lived event loop
+    owned by the app (on a background thread), so concurrent requests are
+    in flight together instead of being serialized through one blocking
+    `run_until_complete`. A semaphore bounds how many run at once.
     """
 
-    def __init__(self):
-        # Create session service for Agent Engine
-        self.session_service = VertexAiSessionService(
-            project_id=PROJECT_ID,
-            location=LOCATION,
-            agent_engine_id=AGENT_ENGINE_ID
+    def __init__(self, max_concurrent_queries: int = MAX_CONCURRENT_QUERIES):
+        # Create session service for Agent Engine, fronted by a local
+        # write-through cache and warm session pool
+        self.session_service = CachedSessionService(
+            VertexAiSessionService(
+                project=PROJECT_ID,
+                location=LOCATION,
+                agent_engine_id=AGENT_ENGINE_ID
+            )
         )
 
         # Create Runner with Lead Scout multi-agent team
@@ -57,8 +79,139 @@ class ScoutTeamApp:
             session_service=self.session_service,
         )
 
+        self.max_concurrent_queries = max_concurrent_queries
+        self._init_runtime()
+
         logger.info("✅ Scout Team App initialized")
 
+    def _init_runtime(self) -> None:
+        # Event loop and thread start lazily on the first query
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._query_slots: Optional[asyncio.Semaphore] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Loops, threads and locks can't be pickled for Agent Engine deployment
+        state = self.__dict__.copy()
+        for key in ("_loop", "_loop_thread", "_loop_lock", "_query_slots"):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_runtime()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the app's background event loop if it isn't running yet."""
+        if self._loop is not None:
+            return self._loop
+
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="scout-team-event-loop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+                self._query_slots = asyncio.Semaphore(self.max_concurrent_queries)
+                self._loop = loop
+
+                asyncio.run_coroutine_threadsafe(
+                    self.session_service.prewarm(APP_NAME, WARM_SESSION_USERS),
+                    loop
+                )
+
+                logger.info(
+                    "Scout Team event loop started",
+                    extra={"max_concurrent_queries": self.max_concurrent_queries}
+                )
+
+        return self._loop
+
+    def _ensure_loop_for_blocking_call(self, method: str) -> asyncio.AbstractEventLoop:
+        """
+        _ensure_loop() for query/stream_query, which block until the turn ends.
+
+        Raises:
+            RuntimeError: If called from the app loop itself, where waiting
+                for the turn would deadlock
+        """
+        loop = self._ensure_loop()
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            raise RuntimeError(
+                f"{method}() blocks and would deadlock on the app event loop; "
+                f"use async_{method}() instead"
+            )
+        return loop
+
+    async def _ensure_session(self, user_id: str, session_id: Optional[str]) -> str:
+        """Return session_id, creating a new session when it is None."""
+        if session_id is None:
+            session = await self.session_service.create_session(
+                app_name=APP_NAME,
+                user_id=user_id
+            )
+            session_id = session.id
+        return session_id
+
+    async def _run_query(
+        self,
+        message: str,
+        user_id: str,
+        session_id: Optional[str]
+    ) -> str:
+        """Run one agent turn on the app loop and return the final text."""
+        async with self._query_slots:
+            session_id = await self._ensure_session(user_id, session_id)
+
+            new_message = types.Content(role="user", parts=[types.Part(text=message)])
+
+            response_text = ""
+            async for event in self.runner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=new_message
+            ):
+                if event.is_final_response() and event.content and event.content.parts:
+                    response_text += "".join(
+                        part.text for part in event.content.parts if part.text
+                    )
+
+            return response_text
+
+    async def async_query(
+        self,
+        message: str,
+        user_id: str = "default",
+        session_id: Optional[str] = None
+    ) -> str:
+        """
+        Query the Scout team without blocking the caller's event loop.
+
+        Args:
+            message: User message
+            user_id: User ID (for session tracking)
+            session_id: Session ID (optional, will create new session if None)
+
+        Returns:
+            Agent response as string
+        """
+        # Runs on the app loop even when Agent Engine awaits from its own loop,
+        # so the concurrency bound and runner state live on a single loop
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._logged_query(message, user_id, session_id),
+            loop
+        )
+        return await asyncio.wrap_future(future)
+
     def query(
         self,
         message: str,
@@ -69,6 +222,8 @@ class ScoutTeamApp:
         Query the Scout team with a message.
 
         This method is called by Agent Engine when handling user requests.
+        Each call is scheduled on the app's shared event loop, so other
+        in-flight queries keep running while this thread waits.
 
         Args:
             message: User message
@@ -77,42 +232,41 @@ class ScoutTeamApp:
 
         Returns:
             Agent response as string
+
+        Raises:
+            RuntimeError: If called from the app's own event loop
         """
+        loop = self._ensure_loop_for_blocking_call("query")
+        future = asyncio.run_coroutine_threadsafe(
+            self._logged_query(message, user_id, session_id),
+            loop
+        )
+        return future.result()
+
+    async def _logged_query(
+        self,
+        message: str,
+        user_id: str,
+        session_id: Optional[str]
+    ) -> str:
         logger.info(
             f"Query received",
             extra={
-                "message": message,
+                "user_message": message,
                 "user_id": user_id,
                 "session_id": session_id
             }
         )
 
         try:
-            # Run the agent
-            # Use run_async for Agent Engine (it expects async responses)
-            import asyncio
-
-            # Get or create event loop
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            # Run agent asynchronously
-            response = loop.run_until_complete(
-                self.runner.run_async(
-                    user_id=user_id,
-                    session_id=session_id,
-                    user_msg=message
-                )
-            )
+            response = await self._run_query(message, user_id, session_id)
 
             logger.info(
                 f"Query completed",
                 extra={
                     "user_id": user_id,
-                    "session_id": session_id
+                    "session_id": session_id,
+                    "fast_path_fraction": routing_stats()["fast_path_fraction"]
                 }
             )
 
@@ -129,6 +283,170 @@ class ScoutTeamApp:
             )
             return f"I encountered an error: {str(e)}"
 
+    async def async_stream_query(
+        self,
+        message: str,
+        user_id: str = "default",
+        session_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a Scout team turn as it runs.
+
+        Yields JSON-serializable chunks (one per server-sent event):
+        - {"type": "session", "session_id"}: first chunk, always
+        - {"type": "text_delta", "author", "text"}: partial model tokens
+        - {"type": "text", "author", "text"}: complete non-streamed text
+        - {"type": "delegation", "from", "to"}: Lead Scout handed off
+        - {"type": "tool_call", "author", "name"}: a specialist called a tool
+        - {"type": "done", "session_id", "text"}: final response text
+        - {"type": "error", "message"}: the turn failed
+
+        Args:
+            message: User message
+            user_id: User ID (for session tracking)
+            session_id: Session ID (optional, will create new session if None)
+        """
+        chunks: asyncio.Queue = asyncio.Queue()
+        caller_loop = asyncio.get_running_loop()
+
+        def emit(chunk: Optional[Dict[str, Any]]) -> None:
+            caller_loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._stream_turn(message, user_id, session_id, emit),
+            self._ensure_loop()
+        )
+
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            future.cancel()
+
+    def stream_query(
+        self,
+        message: str,
+        user_id: str = "default",
+        session_id: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a Scout team turn (called by Agent Engine's streamQuery).
+
+        Same chunks as `async_stream_query`; see `format_sse` for turning
+        them into server-sent events. Like `query`, it must not be iterated
+        on the app's own event loop.
+        """
+        chunks: queue.Queue = queue.Queue()
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._stream_turn(message, user_id, session_id, chunks.put),
+            self._ensure_loop_for_blocking_call("stream_query")
+        )
+
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            future.cancel()
+
+    async def _stream_turn(
+        self,
+        message: str,
+        user_id: str,
+        session_id: Optional[str],
+        emit: Callable[[Optional[Dict[str, Any]]], None]
+    ) -> None:
+        """Run one turn on the app loop, emitting chunks and a None sentinel."""
+        logger.info(
+            f"Stream query received",
+            extra={
+                "user_message": message,
+                "user_id": user_id,
+                "session_id": session_id
+            }
+        )
+
+        try:
+            async with self._query_slots:
+                session_id = await self._ensure_session(user_id, session_id)
+                emit({"type": "session", "session_id": session_id})
+
+                new_message = types.Content(role="user", parts=[types.Part(text=message)])
+                run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+
+                response_text = ""
+                streamed_partial = False
+                async for event in self.runner.run_async(
+                    user_id=user_id,
+                    session_id=session_id,
+                    new_message=new_message,
+                    run_config=run_config
+                ):
+                    text = ""
+                    if event.content and event.content.parts:
+                        text = "".join(part.text for part in event.content.parts if part.text)
+
+                    if event.partial:
+                        if text:
+                            streamed_partial = True
+                            emit({"type": "text_delta", "author": event.author, "text": text})
+                        continue
+
+                    # The aggregated event repeats text already sent as deltas
+                    if text and not streamed_partial:
+                        emit({"type": "text", "author": event.author, "text": text})
+                    streamed_partial = False
+
+                    for function_call in event.get_function_calls():
+                        if function_call.name != "transfer_to_agent":
+                            emit({"type": "tool_call", "author": event.author, "name": function_call.name})
+
+                    if event.actions and event.actions.transfer_to_agent:
+                        emit({
+                            "type": "delegation",
+                            "from": event.author,
+                            "to": event.actions.transfer_to_agent
+                        })
+
+                    if event.is_final_response() and text:
+                        response_text += text
+
+                emit({"type": "done", "session_id": session_id, "text": response_text})
+
+                logger.info(
+                    f"Stream query completed",
+                    extra={
+                        "user_id": user_id,
+                        "session_id": session_id,
+                        "fast_path_fraction": routing_stats()["fast_path_fraction"]
+                    }
+                )
+
+        except Exception as e:
+            logger.error(
+                f"Stream query failed: {e}",
+                extra={
+                    "user_id": user_id,
+                    "session_id": session_id,
+                    "error": str(e)
+                }
+            )
+            emit({"type": "error", "message": f"I encountered an error: {str(e)}"})
+
+        finally:
+            emit(None)
+
+
+def format_sse(chunk: Dict[str, Any]) -> str:
+    """Format a stream chunk as a server-sent event."""
+    return f"event: {chunk['type']}\ndata: {json.dumps(chunk)}\n\n"
+
 
 # Create the app instance
 # ADK CLI will look for a variable called 'app'
@@ -141,6 +459,7 @@ logger.info(
         "project_id": PROJECT_ID,
         "location": LOCATION,
         "has_query_method": hasattr(app, "query"),
+        "has_stream_query_method": hasattr(app, "stream_query"),
         "agent_type": "multi-agent-team"
     }
 )
@@ -0,0 +1,189 @@
+"""
+Context-window compaction for long-running Scout sessions.
+
+A parent chatting all season builds up every turn and tool payload in the
+session, and ADK sends that whole history with each model call. This module
+adds a `before_model_callback` that keeps each prompt within a token budget:
+
+1. The most recent turns are always sent as-is.
+2. Older tool outputs (full stats dicts, recruitment reports) are replaced
+   with compact references that keep only top-level scalar fields.
+3. If the prompt is still over budget, the oldest turns are folded into one
+   short extractive summary ("User: ... / Scout: ...").
+
+Only the outgoing LLM request is compacted; session history is untouched.
+The summary is built locally, so compaction adds no model call.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+# Prompt history budget per model call (rough: ~4 chars per token)
+CONTEXT_TOKEN_BUDGET = int(os.getenv("SCOUT_CONTEXT_TOKEN_BUDGET", "8000"))
+# User turns always sent in full
+KEEP_RECENT_TURNS = int(os.getenv("SCOUT_CONTEXT_KEEP_RECENT_TURNS", "4"))
+
+_SUMMARY_PREFIX = "Summary of earlier conversation:"
+_MAX_SCALAR_CHARS = 80
+_MAX_SUMMARY_LINE_CHARS = 160
+
+
+def _estimate_tokens(contents: List[types.Content]) -> int:
+    chars = 0
+    for content in contents:
+        for part in content.parts or []:
+            if part.text:
+                chars += len(part.text)
+            if part.function_call:
+                chars += len(json.dumps(part.function_call.args or {}, default=str))
+            if part.function_response:
+                chars += len(json.dumps(part.function_response.response or {}, default=str))
+    return chars // 4
+
+
+def _is_user_turn_start(content: types.Content) -> bool:
+    return content.role == "user" and any(
+        part.text and not part.function_response for part in content.parts or []
+    )
+
+
+def _split_turns(contents: List[types.Content]) -> List[List[types.Content]]:
+    """Group contents into turns, each starting at a user text message."""
+    turns: List[List[types.Content]] = []
+    for content in contents:
+        if not turns or _is_user_turn_start(content):
+            turns.append([])
+        turns[-1].append(content)
+    return turns
+
+
+def _compact_payload(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep top-level scalars of a tool output; replace nested data with sizes."""
+    compact: Dict[str, Any] = {"compacted": True}
+    for key, value in response.items():
+        if isinstance(value, str):
+            compact[key] = value[:_MAX_SCALAR_CHARS]
+        elif isinstance(value, (int, float, bool)) or value is None:
+            compact[key] = value
+        elif isinstance(value, (dict, list)):
+            compact[key] = f"<{len(value)} items omitted>"
+    return compact
+
+
+def _compact_tool_outputs(turn: List[types.Content]) -> List[types.Content]:
+    compacted = []
+    for content in turn:
+        parts = []
+        for part in content.parts or []:
+            if part.function_response and not (part.function_response.response or {}).get("compacted"):
+                part = types.Part(
+                    function_response=types.FunctionResponse(
+                        id=part.function_response.id,
+                        name=part.function_response.name,
+                        response=_compact_payload(part.function_response.response or {}),
+                    )
+                )
+            parts.append(part)
+        compacted.append(types.Content(role=content.role, parts=parts))
+    return compacted
+
+
+def _summarize_turn(turn: List[types.Content]) -> List[str]:
+    lines = []
+    for content in turn:
+        text = " ".join(part.text.strip() for part in content.parts or [] if part.text).strip()
+        if not text:
+            continue
+        speaker = "User" if content.role == "user" else "Scout"
+        lines.append(f"- {speaker}: {text[:_MAX_SUMMARY_LINE_CHARS]}")
+    return lines
+
+
+def compact_contents(
+    contents: List[types.Content],
+    token_budget: int = CONTEXT_TOKEN_BUDGET,
+    keep_recent_turns: int = KEEP_RECENT_TURNS,
+) -> List[types.Content]:
+    """
+    Compact prompt history to fit a token budget.
+
+    Args:
+        contents: LLM request contents, oldest first.
+        token_budget: Target size of the history in tokens.
+        keep_recent_turns: Number of latest user turns never compacted.
+
+    Returns:
+        New contents list (the input is not modified).
+    """
+    if _estimate_tokens(contents) <= token_budget:
+        return contents
+
+    turns = _split_turns(contents)
+    if len(turns) <= keep_recent_turns:
+        return contents
+
+    old_turns = turns[:-keep_recent_turns]
+    recent_turns = turns[-keep_recent_turns:]
+
+    # Step 1: aged-out tool outputs become compact references
+    old_turns = [_compact_tool_outputs(turn) for turn in old_turns]
+
+    def flatten(summary_lines: List[str], remaining: List[List[types.Content]]) -> List[types.Content]:
+        result: List[types.Content] = []
+        if summary_lines:
+            result.append(types.Content(
+                role="user",
+                parts=[types.Part(text="\n".join([_SUMMARY_PREFIX] + summary_lines))],
+            ))
+        for turn in remaining + recent_turns:
+            result.extend(turn)
+        return result
+
+    # Step 2: fold the oldest turns into the summary until within budget
+    summary_lines: List[str] = []
+    compacted = flatten(summary_lines, old_turns)
+    while old_turns and _estimate_tokens(compacted) > token_budget:
+        turn = old_turns.pop(0)
+        summary_lines.extend(_summarize_turn(turn))
+
+        # The summary itself gets at most a quarter of the budget
+        while summary_lines and len("\n".join(summary_lines)) // 4 > token_budget // 4:
+            summary_lines.pop(0)
+
+        compacted = flatten(summary_lines, old_turns)
+
+    return compacted
+
+
+def compact_history_callback(
+    callback_context: CallbackContext,
+    llm_request: LlmRequest,
+) -> Optional[LlmResponse]:
+    """
+    Compact `llm_request.contents` in place before each model call.
+
+    Always returns None so the model (or the next callback) still runs.
+    """
+    before = _estimate_tokens(llm_request.contents)
+    llm_request.contents = compact_contents(llm_request.contents)
+    after = _estimate_tokens(llm_request.contents)
+
+    if after < before:
+        logger.info(
+            f"Compacted context for {callback_context.agent_name}",
+            extra={
+                "agent": callback_context.agent_name,
+                "tokens_before": before,
+                "tokens_after": after,
+            }
+        )
+
+    return None
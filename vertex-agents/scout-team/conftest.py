@@ -0,0 +1,20 @@
+"""
+pytest configuration for the Scout team unit tests.
+
+The older test_*.py files here are scripts that call Gemini or deployed
+Agent Engine instances (run them directly with python); they are not
+collected as unit tests.
+"""
+
+collect_ignore = [
+    "test_agent_engine_correct.py",
+    "test_agent_proper.py",
+    "test_agent_working.py",
+    "test_deployed.py",
+    "test_deployed_final.py",
+    "test_deployed_v2.py",
+    "test_deployed_v3.py",
+    "test_local.py",
+    "test_new_deployment.py",
+    "test_scout_WORKING.py",
+]
@@ -0,0 +1,274 @@
+"""
+Fast-path router for the Lead Scout.
+
+Every message to `lead_scout_agent` normally costs a Gemini call just to pick
+which specialist to delegate to. This module decides obvious cases locally:
+
+1. Keyword/regex rules for each specialist
+2. A tiny naive Bayes classifier trained on example phrases
+
+When both agree (or the classifier alone is very confident) the Lead Scout
+transfers straight to the specialist. Anything ambiguous falls back to the
+LLM router. `routing_stats()` reports how many turns skipped the model hop.
+"""
+
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Minimum confidence required to skip the LLM router
+MIN_CONFIDENCE = float(os.getenv("SCOUT_FAST_ROUTE_MIN_CONFIDENCE", "0.85"))
+
+# Class used by the classifier for messages the Lead Scout should answer itself
+LEAD_SCOUT = "lead_scout"
+
+
+# ============================================================================
+# RULES
+# ============================================================================
+
+_QUESTION = re.compile(
+    r"\?\s*$|^\s*(how|what|is|are|does|do|can|should|which|when|why|who)\b",
+    re.IGNORECASE,
+)
+
+_RULES = {
+    "stats_logger": [
+        re.compile(r"\b(scored|had|made|got|recorded|tallied)\b.*\b\d+\s+(goals?|assists?|saves?)\b", re.IGNORECASE),
+        re.compile(r"\b(scored|had|made|got)\s+(a|an|one|two|three|four|five|\d+)\s+(goals?|assists?|saves?|hat[- ]trick)\b", re.IGNORECASE),
+        re.compile(r"\b(log|record|save)\s+(the\s+|her\s+|his\s+|today'?s\s+)?(game|stats|match)\b", re.IGNORECASE),
+        re.compile(r"\bplayed\s+\d+\s+min(ute)?s?\b", re.IGNORECASE),
+    ],
+    "performance_analyst": [
+        re.compile(r"\bhow\s+(is|has|was)\s+\w+(\s+\w+)?\s+(doing|playing|performing|progressing)\b", re.IGNORECASE),
+        re.compile(r"\b(trends?|progress|improv(ing|ed|ement)|averages?|season stats|stats this season)\b", re.IGNORECASE),
+    ],
+    "recruitment_advisor": [
+        re.compile(r"\b(recruit(ing|ment|ed)?|scholarships?|college coach(es)?|showcases?)\b", re.IGNORECASE),
+        re.compile(r"\b(d1|d2|d3|naia)\s+(ready|readiness)\b|\bready\s+for\s+(d1|d2|d3|naia|college)\b", re.IGNORECASE),
+    ],
+    "benchmark_specialist": [
+        re.compile(r"\b(compare[sd]?|comparison|percentiles?|benchmarks?|stack\s+up|rank(ing|s)?)\b", re.IGNORECASE),
+        re.compile(r"\bdivision\s+fit\b", re.IGNORECASE),
+    ],
+}
+
+
+def _rule_matches(message: str) -> List[str]:
+    """Return the specialists whose rules match the message."""
+    matches = [
+        agent_name
+        for agent_name, patterns in _RULES.items()
+        if any(pattern.search(message) for pattern in patterns)
+    ]
+
+    # Questions are never stats to log ("how many goals did Emma score?")
+    if "stats_logger" in matches and _QUESTION.search(message):
+        matches.remove("stats_logger")
+
+    return matches
+
+
+# ============================================================================
+# CLASSIFIER
+# ============================================================================
+
+_TRAINING_EXAMPLES = {
+    "stats_logger": [
+        "Emma scored 2 goals vs Riverside",
+        "Emma scored 2 goals and 1 assist today against Riverside High",
+        "log stats for Jake 1 goal 3 assists",
+        "Mia had 6 saves in the tournament game",
+        "record the game he played 70 minutes and scored once",
+        "she got a hat trick against the Strikers",
+        "game results 3 goals and 2 assists in the league match",
+    ],
+    "performance_analyst": [
+        "how is Emma doing this season",
+        "show me Emma's trends",
+        "what are Jake's stats",
+        "is she improving in assists",
+        "how has his scoring changed over the last 5 games",
+        "give me a performance summary",
+        "what are her averages per game",
+    ],
+    "recruitment_advisor": [
+        "is Emma ready for D1",
+        "what does Emma need for college recruitment",
+        "which showcases should she attend",
+        "how do we get noticed by college coaches",
+        "what are her chances for a scholarship",
+        "is he D2 ready",
+        "help with the recruiting process",
+    ],
+    "benchmark_specialist": [
+        "how does Emma compare to other forwards",
+        "what percentile is she in",
+        "compare Jake to D1 midfielders",
+        "what is her division fit",
+        "how does he stack up against college benchmarks",
+        "rank her against other goalkeepers",
+    ],
+    LEAD_SCOUT: [
+        "hi scout",
+        "hello there",
+        "thanks",
+        "what can you do",
+        "who are you",
+        "how does this app work",
+        "good morning",
+    ],
+}
+
+
+def _tokenize(text: str) -> List[str]:
+    tokens = re.findall(r"[a-z0-9']+", text.lower())
+    return ["<num>" if token.isdigit() else token for token in tokens]
+
+
+class NaiveBayesRouter:
+    """Multinomial naive Bayes over example phrases (Laplace smoothed)."""
+
+    def __init__(self, examples: Dict[str, List[str]]):
+        self.labels = list(examples)
+        self.word_counts = {label: Counter() for label in self.labels}
+        self.vocab = set()
+
+        for label, phrases in examples.items():
+            for phrase in phrases:
+                tokens = _tokenize(phrase)
+                self.word_counts[label].update(tokens)
+                self.vocab.update(tokens)
+
+        self.totals = {label: sum(counts.values()) for label, counts in self.word_counts.items()}
+        total_examples = sum(len(phrases) for phrases in examples.values())
+        self.log_priors = {
+            label: math.log(len(examples[label]) / total_examples) for label in self.labels
+        }
+
+    def predict(self, text: str) -> Dict[str, float]:
+        """Return posterior probabilities per label."""
+        tokens = [token for token in _tokenize(text) if token in self.vocab]
+        vocab_size = len(self.vocab)
+
+        scores = {}
+        for label in self.labels:
+            score = self.log_priors[label]
+            for token in tokens:
+                score += math.log(
+                    (self.word_counts[label][token] + 1) / (self.totals[label] + vocab_size)
+                )
+            scores[label] = score
+
+        top = max(scores.values())
+        exp_scores = {label: math.exp(score - top) for label, score in scores.items()}
+        norm = sum(exp_scores.values())
+        return {label: value / norm for label, value in exp_scores.items()}
+
+
+_classifier = NaiveBayesRouter(_TRAINING_EXAMPLES)
+
+
+# ============================================================================
+# ROUTING
+# ============================================================================
+
+@dataclass
+class RouteDecision:
+    """Result of local routing for one message"""
+    agent_name: Optional[str]  # None = let the LLM router decide
+    confidence: float  # Classifier posterior for the chosen (or best) label
+    source: str  # rules | classifier | llm
+    matched_rule: Optional[str] = None  # Specialist whose rules matched, if exactly one
+
+    @property
+    def fast_path(self) -> bool:
+        return self.agent_name is not None
+
+
+def route_message(message: str, min_confidence: float = MIN_CONFIDENCE) -> RouteDecision:
+    """
+    Decide locally which specialist should handle a message.
+
+    Args:
+        message: The user's message.
+        min_confidence: Confidence needed to skip the LLM router.
+
+    Returns:
+        RouteDecision with `agent_name` set only for confident routes.
+    """
+    posteriors = _classifier.predict(message)
+    best_label = max(posteriors, key=posteriors.get)
+    matches = _rule_matches(message)
+
+    if len(matches) == 1:
+        agent_name = matches[0]
+        # Rules and classifier agree: routed on the agreement, not the posterior
+        if best_label == agent_name:
+            return RouteDecision(agent_name, posteriors[agent_name], "rules", matched_rule=agent_name)
+        return RouteDecision(None, posteriors[agent_name], "llm", matched_rule=agent_name)
+
+    if not matches and best_label != LEAD_SCOUT and posteriors[best_label] >= min_confidence:
+        return RouteDecision(best_label, posteriors[best_label], "classifier")
+
+    return RouteDecision(None, posteriors[best_label], "llm")
+
+
+class RoutingStats:
+    """Thread-safe counters for fast-path routing"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.turns = 0
+        self.fast_path_turns = 0
+        self.by_route: Counter = Counter()
+
+    def record(self, decision: RouteDecision) -> None:
+        with self._lock:
+            self.turns += 1
+            if decision.fast_path:
+                self.fast_path_turns += 1
+                self.by_route[decision.agent_name] += 1
+            else:
+                self.by_route["llm"] += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "turns": self.turns,
+                "fast_path_turns": self.fast_path_turns,
+                "fast_path_fraction": (
+                    self.fast_path_turns / self.turns if self.turns else 0.0
+                ),
+                "by_route": dict(self.by_route),
+            }
+
+
+_stats = RoutingStats()
+
+
+def record_turn(decision: RouteDecision) -> None:
+    """Record a routed turn and log the decision."""
+    _stats.record(decision)
+    logger.info(
+        f"Scout router: {decision.agent_name or 'llm'} ({decision.source})",
+        extra={
+            "route": decision.agent_name or "llm",
+            "source": decision.source,
+            "confidence": round(decision.confidence, 3),
+            "matched_rule": decision.matched_rule,
+            "fast_path_fraction": round(_stats.snapshot()["fast_path_fraction"], 3),
+        }
+    )
+
+
+def routing_stats() -> Dict[str, object]:
+    """Return fast-path routing counters (fraction of turns skipping the LLM hop)."""
+    return _stats.snapshot()
@@ -0,0 +1,245 @@
+"""
+Session cache and warm session pool for the Scout Team app.
+
+`VertexAiSessionService` makes a remote call for every session lookup, and a
+first message with `session_id=None` waits on a remote session creation.
+`CachedSessionService` wraps any session service with:
+
+- A write-through LRU cache of sessions. The Runner fetches the session
+  once per turn; repeat turns read it locally, and `append_event` goes to
+  the remote service and updates the cached copy.
+- A warm pool of pre-created sessions for the users passed to `prewarm`, so
+  a new conversation takes an existing session instead of waiting for a
+  remote create. The pool is refilled in the background after each one is
+  handed out. Other users always get a normal create.
+
+Another Agent Engine replica can append to the same session. A cached copy
+is only served as-is for a few seconds (SCOUT_SESSION_CACHE_TTL_SECONDS);
+after that it is replaced by a fresh copy from the service.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+
+logger = logging.getLogger(__name__)
+
+SESSION_CACHE_SIZE = int(os.getenv("SCOUT_SESSION_CACHE_SIZE", "1000"))
+# How long a cached session is served without revalidating it
+SESSION_CACHE_TTL_SECONDS = float(os.getenv("SCOUT_SESSION_CACHE_TTL_SECONDS", "5"))
+WARM_SESSIONS_PER_USER = int(os.getenv("SCOUT_WARM_SESSIONS_PER_USER", "1"))
+WARM_SESSION_TTL_SECONDS = float(os.getenv("SCOUT_WARM_SESSION_TTL_SECONDS", "1800"))
+
+SessionKey = Tuple[str, str, str]  # app_name, user_id, session_id
+UserKey = Tuple[str, str]  # app_name, user_id
+
+
+class CachedSessionService(BaseSessionService):
+    """
+    Write-through session cache with a warm session pool.
+
+    Must be used from a single event loop (the ScoutTeamApp loop).
+    """
+
+    def __init__(
+        self,
+        inner: BaseSessionService,
+        max_size: int = SESSION_CACHE_SIZE,
+        ttl_seconds: float = SESSION_CACHE_TTL_SECONDS,
+        warm_per_user: int = WARM_SESSIONS_PER_USER,
+        warm_ttl_seconds: float = WARM_SESSION_TTL_SECONDS,
+    ):
+        self.inner = inner
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.warm_per_user = warm_per_user
+        self.warm_ttl_seconds = warm_ttl_seconds
+
+        self._sessions: "OrderedDict[SessionKey, Tuple[Session, float]]" = OrderedDict()
+        self._warm: Dict[UserKey, Deque[Tuple[Session, float]]] = {}
+        self._refilling: Set[UserKey] = set()
+        self._background: Set[asyncio.Task] = set()
+
+        self.stats = {"hits": 0, "misses": 0, "revalidations": 0, "warm_hits": 0, "cold_creates": 0}
+
+    # ------------------------------------------------------------------
+    # Session cache
+    # ------------------------------------------------------------------
+
+    def _put(self, session: Session) -> None:
+        key = (session.app_name, session.user_id, session.id)
+        self._sessions[key] = (session, time.monotonic())
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self.max_size:
+            self._sessions.popitem(last=False)
+
+    async def _revalidate(self, key: SessionKey) -> Optional[Session]:
+        """Replace a stale cached session with a fresh copy from the service."""
+        # A full fetch, not a delta merge: VertexAiSessionService reassigns event
+        # ids server-side and does not advance last_update_time on append, so
+        # neither can tell which events the cached copy already has
+        app_name, user_id, session_id = key
+        latest = await self.inner.get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        if latest is None:
+            self._sessions.pop(key, None)
+            return None
+
+        self._put(latest)
+        return latest
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        # Filtered reads (recent events only) always go to the service
+        if config is not None:
+            return await self.inner.get_session(
+                app_name=app_name, user_id=user_id, session_id=session_id, config=config
+            )
+
+        key = (app_name, user_id, session_id)
+        entry = self._sessions.get(key)
+        if entry is not None:
+            session, cached_at = entry
+            if time.monotonic() - cached_at <= self.ttl_seconds:
+                self.stats["hits"] += 1
+                self._sessions.move_to_end(key)
+                return session
+
+            self.stats["revalidations"] += 1
+            return await self._revalidate(key)
+
+        self.stats["misses"] += 1
+        session = await self.inner.get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        if session is not None:
+            self._put(session)
+        return session
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        # The inner service updates `session` in place, which is the cached copy
+        event = await self.inner.append_event(session, event)
+        self._put(session)
+        return event
+
+    async def list_sessions(
+        self,
+        *,
+        app_name: str,
+        user_id: Optional[str] = None,
+    ) -> ListSessionsResponse:
+        return await self.inner.list_sessions(app_name=app_name, user_id=user_id)
+
+    async def delete_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> None:
+        self._sessions.pop((app_name, user_id, session_id), None)
+        await self.inner.delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+
+    # ------------------------------------------------------------------
+    # Warm session pool
+    # ------------------------------------------------------------------
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        # Only blank sessions are interchangeable
+        if state is None and session_id is None:
+            session = self._take_warm((app_name, user_id))
+            if session is not None:
+                self.stats["warm_hits"] += 1
+                self._put(session)
+                self._schedule_refill(app_name, user_id)
+                return session
+
+        self.stats["cold_creates"] += 1
+        session = await self.inner.create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        self._put(session)
+        self._schedule_refill(app_name, user_id)
+        return session
+
+    def _take_warm(self, user_key: UserKey) -> Optional[Session]:
+        pool = self._warm.get(user_key)
+        while pool:
+            session, created_at = pool.popleft()
+            if time.monotonic() - created_at <= self.warm_ttl_seconds:
+                return session
+            self._spawn(self._discard(session))
+        return None
+
+    def _schedule_refill(self, app_name: str, user_id: str) -> None:
+        user_key = (app_name, user_id)
+        # Only users registered by prewarm() have a pool
+        if user_key in self._warm and user_key not in self._refilling:
+            self._refilling.add(user_key)
+            self._spawn(self._refill(user_key))
+
+    async def _refill(self, user_key: UserKey) -> None:
+        app_name, user_id = user_key
+        try:
+            pool = self._warm[user_key]
+            while len(pool) < self.warm_per_user:
+                session = await self.inner.create_session(app_name=app_name, user_id=user_id)
+                pool.append((session, time.monotonic()))
+
+        except Exception as e:
+            logger.warning(
+                f"Warm session refill failed: {e}",
+                extra={"app_name": app_name, "user_id": user_id, "error": str(e)}
+            )
+
+        finally:
+            self._refilling.discard(user_key)
+
+    async def prewarm(self, app_name: str, user_ids: List[str]) -> None:
+        """
+        Keep a warm pool for the given users, filling it now (e.g. at startup).
+
+        Only these users get warm sessions, which bounds how many remote
+        sessions the pool holds.
+        """
+        if self.warm_per_user <= 0:
+            return
+        for user_id in user_ids:
+            self._warm.setdefault((app_name, user_id), deque())
+            self._schedule_refill(app_name, user_id)
+
+    async def _discard(self, session: Session) -> None:
+        try:
+            await self.inner.delete_session(
+                app_name=session.app_name, user_id=session.user_id, session_id=session.id
+            )
+        except Exception as e:
+            logger.debug(f"Discarding warm session failed: {e}")
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
@@ -0,0 +1,195 @@
+"""
+Deterministic game-stat parser for the Scout team.
+
+Most stats-logging messages are formulaic ("Emma scored 2 goals and 1 assist
+vs Riverside in a league game"). This module extracts `log_game_stats`
+arguments from them so the Lead Scout can log the game directly, without the
+Lead Scout and Stats Logger model round trips. When the parse is incomplete
+the message goes to `stats_logger_agent` as before.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+_NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+_COUNT = r"(\d+|a|an|one|two|three|four|five|six|seven|eight|nine|ten)"
+
+_GAME_TYPES = ("league", "tournament", "showcase", "scrimmage")
+
+_NAME = r"([A-Z][a-z'-]+(?:\s+[A-Z][a-z'-]+)?)"
+_STAT_VERB = r"(?:scored|had|made|got|recorded|tallied|played)"
+
+# Leading time words are not part of the player's name ("Today Emma scored...")
+_TIME_WORDS = ("today", "yesterday", "tonight", "this morning", "this afternoon", "last night")
+_LEADING_TIME = r"(?i:(?:" + "|".join(_TIME_WORDS) + r")\b,?\s+)?"
+
+_PLAYER = re.compile(
+    r"^\s*" + _LEADING_TIME + r"(?:"
+    r"(?i:(?:log|record)\s+(?:(?:the\s+)?(?:stats|game)\s+)?for\s+)" + _NAME + r"\b"
+    r"|" + _NAME + r"\s+" + _STAT_VERB + r"\b"
+    r")"
+)
+_VERB = re.compile(r"\b" + _STAT_VERB + r"\b", re.IGNORECASE)
+_CAPITALIZED = re.compile(r"(?<![.!?]\s)(?<!^)\b[A-Z][a-z'-]+\b")
+
+# Capitalized words that never name a player
+_NOT_NAMES = frozenset(
+    ["I", "Today", "Yesterday", "Tonight"]
+    + "Monday Tuesday Wednesday Thursday Friday Saturday Sunday".split()
+    + "January February March April May June July August September October November December".split()
+)
+_STATS = {
+    "goals": re.compile(_COUNT + r"\s+goals?\b", re.IGNORECASE),
+    "assists": re.compile(_COUNT + r"\s+assists?\b", re.IGNORECASE),
+    "saves": re.compile(_COUNT + r"\s+saves?\b", re.IGNORECASE),
+    "minutes_played": re.compile(r"(\d+)\s+min(?:ute)?s?\b", re.IGNORECASE),
+}
+_SCORED_ADVERB = re.compile(r"\bscored\s+(once|twice)\b", re.IGNORECASE)
+_HAT_TRICK = re.compile(r"\bhat[- ]trick\b", re.IGNORECASE)
+_OPPONENT = re.compile(
+    r"\b(?:vs\.?|versus|against|v\.)\s+(?:the\s+)?"
+    r"(.+?)(?=\s+(?:in|today|yesterday|tonight|this|last|and|at|on|during|with|for"
+    r"|but|though|although|actually|or)\b|[,.!;]|$)",
+    re.IGNORECASE,
+)
+# "St." or "Mt." before the period that ended the opponent: the name was cut short
+_ABBREVIATED = re.compile(r"\b[A-Za-z]{1,3}$")
+# The user is unsure of the numbers ("... but I think it was 3")
+_HEDGE = re.compile(
+    r"\b(?:but|though|although|actually|i think|maybe|probably|not sure|or so)\b",
+    re.IGNORECASE,
+)
+_GAME_TYPE = re.compile(r"\b(" + "|".join(_GAME_TYPES) + r")\b", re.IGNORECASE)
+
+# Stats log_game_stats cannot record; leave these to the Stats Logger agent
+_UNSUPPORTED = re.compile(r"\b(tackles?|shots?|yellow|red card|interceptions?|passes)\b", re.IGNORECASE)
+_QUESTION = re.compile(r"\?\s*$")
+
+
+def _to_int(value: str) -> int:
+    value = value.lower()
+    return int(value) if value.isdigit() else _NUMBER_WORDS[value]
+
+
+@dataclass
+class ParsedGameStats:
+    """Arguments extracted for log_game_stats"""
+    args: Dict[str, Any] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
+
+
+def parse_game_stats(message: str) -> ParsedGameStats:
+    """
+    Extract `log_game_stats` arguments from a stats-logging message.
+
+    A parse is complete when it found the player, the opponent and at least
+    one stat, and the message has nothing the parser can't represent or the
+    user hedges ("but I think it was 3"). An opponent cut short at an
+    abbreviation ("St. Mary's") or holding a number is incomplete. A second
+    stat clause ("..., Mia had 3 saves") or another name outside the player
+    and opponent makes it incomplete, since the stats may belong to someone else.
+
+    Args:
+        message: The user's message.
+
+    Returns:
+        ParsedGameStats with extracted args and a list of missing pieces.
+    """
+    parsed = ParsedGameStats()
+
+    if _QUESTION.search(message):
+        parsed.missing.append("statement")
+    if _UNSUPPORTED.search(message):
+        parsed.missing.append("unsupported_stat")
+    if _HEDGE.search(message):
+        parsed.missing.append("certain")
+
+    player_match = _PLAYER.match(message)
+    if player_match:
+        parsed.args["player_name"] = player_match.group(1) or player_match.group(2)
+    else:
+        parsed.missing.append("player_name")
+
+    if len(_VERB.findall(message)) > 1:
+        parsed.missing.append("single_clause")
+
+    for stat, pattern in _STATS.items():
+        matches = pattern.findall(message)
+        if len(matches) > 1:
+            # "2 goals ... 1 goal" is ambiguous (several players or games)
+            parsed.missing.append(stat)
+        elif matches:
+            parsed.args[stat] = _to_int(matches[0])
+
+    if "goals" not in parsed.args:
+        adverb = _SCORED_ADVERB.search(message)
+        if adverb:
+            parsed.args["goals"] = 1 if adverb.group(1).lower() == "once" else 2
+        elif _HAT_TRICK.search(message):
+            parsed.args["goals"] = 3
+
+    if not any(stat in parsed.args for stat in ("goals", "assists", "saves")):
+        parsed.missing.append("stats")
+
+    opponent_match = _OPPONENT.search(message)
+    if opponent_match and _opponent_is_whole(message, opponent_match):
+        parsed.args["opponent"] = opponent_match.group(1).strip()
+    else:
+        parsed.missing.append("opponent")
+
+    if player_match and _other_name(message, player_match, opponent_match):
+        parsed.missing.append("single_player")
+
+    game_types = {value.lower() for value in _GAME_TYPE.findall(message)}
+    if len(game_types) > 1:
+        parsed.missing.append("game_type")
+    elif game_types:
+        parsed.args["game_type"] = game_types.pop()
+
+    return parsed
+
+
+def _opponent_is_whole(message: str, opponent_match: re.Match) -> bool:
+    """False if the opponent looks cut short at an abbreviation or holds a number."""
+    opponent = opponent_match.group(1).strip()
+    if any(char.isdigit() for char in opponent):
+        return False
+    abbreviated = message[opponent_match.end(1):].startswith(".") and _ABBREVIATED.search(opponent)
+    return not abbreviated
+
+
+def _other_name(message: str, player_match: re.Match, opponent_match: Optional[re.Match]) -> bool:
+    """True if a capitalized word outside the player and opponent may name someone else."""
+    spans = [player_match.span()]
+    if opponent_match:
+        spans.append(opponent_match.span(1))
+
+    for word in _CAPITALIZED.finditer(message):
+        if word.group() in _NOT_NAMES:
+            continue
+        if not any(start <= word.start() < end for start, end in spans):
+            return True
+    return False
+
+
+def format_confirmation(result: Dict[str, Any]) -> str:
+    """Build the Lead Scout's reply for a directly logged game."""
+    stats = result.get("stats", {})
+    parts = []
+    for stat, label in (("goals", "goal"), ("assists", "assist"), ("saves", "save")):
+        count = stats.get(stat, 0)
+        if count:
+            parts.append(f"{count} {label}{'' if count == 1 else 's'}")
+    if stats.get("minutes_played"):
+        parts.append(f"{stats['minutes_played']} minutes")
+
+    summary = f": {', '.join(parts)}" if parts else ""
+    return f"{result['message']}{summary}. Great game, {stats.get('player', 'team')}!"
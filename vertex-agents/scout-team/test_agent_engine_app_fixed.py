@@ -0,0 +1,164 @@
+"""Unit tests for agent_engine_app_fixed (run: pytest test_agent_engine_app_fixed.py)"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agent_engine_app_fixed import ScoutTeamApp, format_sse
+
+
+class StubEvent:
+    """The parts of an ADK Event that ScoutTeamApp reads"""
+
+    def __init__(self, author, text="", partial=False, final=False, calls=(), transfer=None):
+        self.author = author
+        self.partial = partial
+        self.content = SimpleNamespace(parts=[SimpleNamespace(text=text)]) if text else None
+        self.actions = SimpleNamespace(transfer_to_agent=transfer)
+        self._final = final
+        self._calls = [SimpleNamespace(name=name) for name in calls]
+
+    def is_final_response(self):
+        return self._final
+
+    def get_function_calls(self):
+        return self._calls
+
+
+class StubRunner:
+    """Runner stand-in yielding canned events, recording peak concurrency"""
+
+    def __init__(self, events, delay=0.0, fail_after=None):
+        self.events = events
+        self.delay = delay
+        self.fail_after = fail_after
+        self.active = 0
+        self.max_active = 0
+
+    async def run_async(self, user_id, session_id, new_message, run_config=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            for index, event in enumerate(self.events):
+                if index == self.fail_after:
+                    raise RuntimeError("model unavailable")
+                await asyncio.sleep(self.delay)
+                yield event
+        finally:
+            self.active -= 1
+
+
+class StubSessions:
+    async def prewarm(self, app_name, user_ids):
+        pass
+
+    async def create_session(self, app_name, user_id):
+        return SimpleNamespace(id="session-1")
+
+
+FINAL = StubEvent("lead_scout", "Great game!", final=True)
+
+
+@pytest.fixture
+def make_app():
+    apps = []
+
+    def make(runner, max_concurrent_queries=16):
+        app = ScoutTeamApp.__new__(ScoutTeamApp)
+        app.session_service = StubSessions()
+        app.runner = runner
+        app.max_concurrent_queries = max_concurrent_queries
+        app._init_runtime()
+        apps.append(app)
+        return app
+
+    yield make
+
+    for app in apps:
+        if app._loop is not None:
+            app._loop.call_soon_threadsafe(app._loop.stop)
+
+
+def test_query_returns_the_final_text(make_app):
+    app = make_app(StubRunner([StubEvent("lead_scout", "thinking"), FINAL]))
+
+    assert app.query("Emma scored 2 goals vs Riverside") == "Great game!"
+
+
+def test_concurrent_async_queries_are_bounded(make_app):
+    runner = StubRunner([FINAL], delay=0.05)
+    app = make_app(runner, max_concurrent_queries=2)
+
+    async def burst():
+        return await asyncio.gather(*(app.async_query(f"message {i}") for i in range(6)))
+
+    assert asyncio.run(burst()) == ["Great game!"] * 6
+    assert runner.max_active == 2
+
+
+def test_stream_query_chunk_order(make_app):
+    app = make_app(StubRunner([
+        StubEvent("lead_scout", transfer="stats_logger"),
+        StubEvent("stats_logger", calls=["log_game_stats"]),
+        StubEvent("stats_logger", "Logged ", partial=True),
+        StubEvent("stats_logger", "it!", partial=True),
+        StubEvent("stats_logger", "Logged it!", final=True),
+    ]))
+
+    chunks = list(app.stream_query("Emma scored 2 goals vs Riverside"))
+
+    assert chunks == [
+        {"type": "session", "session_id": "session-1"},
+        {"type": "delegation", "from": "lead_scout", "to": "stats_logger"},
+        {"type": "tool_call", "author": "stats_logger", "name": "log_game_stats"},
+        {"type": "text_delta", "author": "stats_logger", "text": "Logged "},
+        {"type": "text_delta", "author": "stats_logger", "text": "it!"},
+        {"type": "done", "session_id": "session-1", "text": "Logged it!"},
+    ]
+
+
+def test_async_stream_query_matches_stream_query(make_app):
+    app = make_app(StubRunner([FINAL]))
+
+    async def collect():
+        return [chunk async for chunk in app.async_stream_query("hi", session_id="session-2")]
+
+    assert asyncio.run(collect()) == [
+        {"type": "session", "session_id": "session-2"},
+        {"type": "text", "author": "lead_scout", "text": "Great game!"},
+        {"type": "done", "session_id": "session-2", "text": "Great game!"},
+    ]
+
+
+def test_error_mid_stream_ends_with_an_error_chunk(make_app):
+    app = make_app(StubRunner([StubEvent("lead_scout", "Let me ", partial=True), FINAL], fail_after=1))
+
+    chunks = list(app.stream_query("hi"))
+
+    assert [chunk["type"] for chunk in chunks] == ["session", "text_delta", "error"]
+    assert "model unavailable" in chunks[-1]["message"]
+
+
+def test_format_sse():
+    chunk = {"type": "text_delta", "author": "lead_scout", "text": "Hi"}
+
+    assert format_sse(chunk) == (
+        'event: text_delta\n'
+        'data: {"type": "text_delta", "author": "lead_scout", "text": "Hi"}\n\n'
+    )
+
+
+@pytest.mark.parametrize("call", [
+    lambda app: app.query("hi"),
+    lambda app: list(app.stream_query("hi")),
+])
+def test_blocking_calls_on_the_app_loop_raise(make_app, call):
+    app = make_app(StubRunner([FINAL]))
+
+    async def on_app_loop():
+        return call(app)
+
+    future = asyncio.run_coroutine_threadsafe(on_app_loop(), app._ensure_loop())
+    with pytest.raises(RuntimeError, match="deadlock"):
+        future.result(timeout=5)
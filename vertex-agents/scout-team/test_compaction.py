@@ -0,0 +1,111 @@
+"""Unit tests for compaction (run: pytest test_compaction.py)"""
+
+from google.genai import types
+
+from compaction import _SUMMARY_PREFIX, _estimate_tokens, compact_contents
+
+
+def _user(text):
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+def _model(text):
+    return types.Content(role="model", parts=[types.Part(text=text)])
+
+
+def _tool_call(name, response):
+    return [
+        types.Content(role="model", parts=[types.Part(
+            function_call=types.FunctionCall(id=f"call-{name}", name=name, args={"player_name": "Emma"}),
+        )]),
+        types.Content(role="user", parts=[types.Part(
+            function_response=types.FunctionResponse(id=f"call-{name}", name=name, response=response),
+        )]),
+    ]
+
+
+def _turn(i, payload_items=50):
+    stats = {"status": "success", "player": "Emma", "games": [{"goals": g} for g in range(payload_items)]}
+    return [_user(f"question {i}"), *_tool_call("get_player_stats", stats), _model(f"answer {i}")]
+
+
+def _history(turns, payload_items=50):
+    return [content for i in range(turns) for content in _turn(i, payload_items)]
+
+
+def _texts(contents):
+    return [part.text for content in contents for part in content.parts or [] if part.text]
+
+
+def test_history_within_budget_is_untouched():
+    contents = _history(3, payload_items=1)
+
+    assert compact_contents(contents, token_budget=10_000) is contents
+
+
+def test_recent_turns_are_kept_verbatim():
+    contents = _history(10)
+
+    compacted = compact_contents(contents, token_budget=800, keep_recent_turns=2)
+
+    assert compacted[-8:] == contents[-8:]
+
+
+def test_old_tool_outputs_become_compact_references():
+    contents = _history(6)
+    # Large enough to keep every turn, too small for the full payloads
+    budget = _estimate_tokens(contents) - 100
+
+    compacted = compact_contents(contents, token_budget=budget, keep_recent_turns=2)
+    responses = [
+        part.function_response.response
+        for content in compacted for part in content.parts or [] if part.function_response
+    ]
+
+    assert len(responses) == 6
+    assert responses[0] == {
+        "compacted": True,
+        "status": "success",
+        "player": "Emma",
+        "games": "<50 items omitted>",
+    }
+    assert "compacted" not in responses[-1]
+    assert _estimate_tokens(compacted) <= budget
+
+
+def test_oldest_turns_are_folded_into_a_summary():
+    contents = _history(6)
+
+    compacted = compact_contents(contents, token_budget=300, keep_recent_turns=2)
+    summary = _texts(compacted)[0]
+
+    assert summary.startswith(_SUMMARY_PREFIX)
+    assert "- User: question 0\n- Scout: answer 0" in summary
+    assert "question 5" in _texts(compacted)
+    assert len(compacted) < len(contents)
+
+
+def test_summary_keeps_its_newest_lines_within_a_quarter_of_the_budget():
+    contents = _history(40)
+
+    compacted = compact_contents(contents, token_budget=300, keep_recent_turns=2)
+    summary = _texts(compacted)[0]
+
+    assert len(summary.split("\n", 1)[1]) // 4 <= 300 // 4
+    assert "question 0\n" not in summary
+    assert "- Scout: answer 37" in summary
+
+
+def test_input_is_not_modified():
+    contents = _history(10)
+    snapshot = [content.model_copy(deep=True) for content in contents]
+
+    compact_contents(contents, token_budget=300, keep_recent_turns=2)
+
+    assert contents == snapshot
+
+
+def test_fewer_turns_than_keep_recent_is_untouched():
+    contents = _history(2)
+
+    assert compact_contents(contents, token_budget=10, keep_recent_turns=4) is contents
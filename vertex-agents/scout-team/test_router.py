@@ -0,0 +1,71 @@
+"""Unit tests for router (run: pytest test_router.py)"""
+
+import pytest
+
+from router import LEAD_SCOUT, NaiveBayesRouter, RoutingStats, route_message
+
+
+@pytest.mark.parametrize("message, agent_name", [
+    ("Emma scored 2 goals vs Riverside", "stats_logger"),
+    ("is Emma ready for D1", "recruitment_advisor"),
+    ("how does Emma compare to other forwards", "benchmark_specialist"),
+])
+def test_rule_and_classifier_agreement_routes(message, agent_name):
+    decision = route_message(message)
+
+    assert decision.fast_path
+    assert decision.agent_name == agent_name
+    assert decision.source == "rules"
+    assert decision.matched_rule == agent_name
+
+
+def test_rule_route_reports_the_real_posterior():
+    # A weak rule hit must not be reported as near-certain
+    decision = route_message("show me the progress chart")
+
+    assert decision.matched_rule == "performance_analyst"
+    assert decision.confidence < 0.95
+
+
+def test_questions_are_never_logged_as_stats():
+    decision = route_message("how many goals did Emma score?")
+
+    assert decision.agent_name != "stats_logger"
+
+
+def test_greetings_go_to_the_llm():
+    decision = route_message("hi scout")
+
+    assert not decision.fast_path
+    assert decision.source == "llm"
+    assert decision.matched_rule is None
+
+
+def test_classifier_route_needs_min_confidence():
+    message = "give me a performance summary"  # No rule matches
+
+    decision = route_message(message, min_confidence=0.5)
+    assert decision.agent_name == "performance_analyst"
+    assert decision.source == "classifier"
+    assert decision.matched_rule is None
+
+    assert not route_message(message, min_confidence=0.99).fast_path
+
+
+def test_naive_bayes_posteriors_sum_to_one():
+    router = NaiveBayesRouter({"a": ["goal goal"], LEAD_SCOUT: ["hello"]})
+    posteriors = router.predict("goal")
+
+    assert sum(posteriors.values()) == pytest.approx(1.0)
+    assert posteriors["a"] > posteriors[LEAD_SCOUT]
+
+
+def test_routing_stats_fraction():
+    stats = RoutingStats()
+    stats.record(route_message("Emma scored 2 goals vs Riverside"))
+    stats.record(route_message("hi scout"))
+
+    snapshot = stats.snapshot()
+    assert snapshot["turns"] == 2
+    assert snapshot["fast_path_fraction"] == 0.5
+    assert snapshot["by_route"] == {"stats_logger": 1, "llm": 1}
@@ -0,0 +1,178 @@
+"""Unit tests for session_cache (run: pytest test_session_cache.py)"""
+
+import asyncio
+
+import pytest
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService
+
+from session_cache import CachedSessionService
+
+APP = "scout-test"
+
+
+class CountingSessionService(InMemorySessionService):
+    """In-memory service that counts calls the cache should save"""
+
+    def __init__(self):
+        super().__init__()
+        self.gets = []
+        self.creates = 0
+
+    async def get_session(self, *, app_name, user_id, session_id, config=None):
+        self.gets.append(config)
+        return await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+
+    async def create_session(self, *, app_name, user_id, state=None, session_id=None):
+        self.creates += 1
+        return await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+
+
+class ServerIdSessionService(CountingSessionService):
+    """
+    Mimics VertexAiSessionService: stored events get server-assigned ids, and
+    append_event does not advance the caller's last_update_time
+    """
+
+    async def append_event(self, session, event):
+        last_update_time = session.last_update_time
+        event = await super().append_event(session, event)
+        stored = self.sessions[session.app_name][session.user_id][session.id]
+        stored.events[-1] = stored.events[-1].model_copy(update={"id": Event.new_id()})
+        session.last_update_time = last_update_time
+        return event
+
+
+def _event(text_id: str) -> Event:
+    return Event(author="user", invocation_id=text_id)
+
+
+async def _settle():
+    # Let background refills run
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_repeat_reads_are_served_from_cache():
+    async def scenario():
+        inner = CountingSessionService()
+        cache = CachedSessionService(inner, ttl_seconds=60)
+        session = await cache.create_session(app_name=APP, user_id="u1")
+
+        for _ in range(3):
+            assert await cache.get_session(app_name=APP, user_id="u1", session_id=session.id) is session
+
+        assert inner.gets == []
+        assert cache.stats["hits"] == 3
+
+    asyncio.run(scenario())
+
+
+def test_stale_copy_picks_up_events_from_another_replica():
+    async def scenario():
+        inner = CountingSessionService()
+        replica_a = CachedSessionService(inner, ttl_seconds=0)
+        replica_b = CachedSessionService(inner, ttl_seconds=0)
+
+        session = await replica_a.create_session(app_name=APP, user_id="u1")
+        await replica_a.append_event(session, _event("turn-1"))
+        cached = await replica_a.get_session(app_name=APP, user_id="u1", session_id=session.id)
+
+        other = await replica_b.get_session(app_name=APP, user_id="u1", session_id=session.id)
+        await replica_b.append_event(other, _event("turn-2"))
+
+        fresh = await replica_a.get_session(app_name=APP, user_id="u1", session_id=session.id)
+
+        assert fresh is not cached
+        assert [event.invocation_id for event in fresh.events] == ["turn-1", "turn-2"]
+        assert replica_a.stats["revalidations"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_unchanged_session_revalidates_without_duplicating_events():
+    async def scenario():
+        inner = CountingSessionService()
+        cache = CachedSessionService(inner, ttl_seconds=0)
+        session = await cache.create_session(app_name=APP, user_id="u1")
+        await cache.append_event(session, _event("turn-1"))
+
+        for _ in range(2):
+            fresh = await cache.get_session(app_name=APP, user_id="u1", session_id=session.id)
+
+        assert [event.invocation_id for event in fresh.events] == ["turn-1"]
+
+    asyncio.run(scenario())
+
+
+def test_server_assigned_ids_do_not_duplicate_history():
+    async def scenario():
+        inner = ServerIdSessionService()
+        cache = CachedSessionService(inner, ttl_seconds=0)
+        session = await cache.create_session(app_name=APP, user_id="u1")
+
+        for turn in ("turn-1", "turn-2"):
+            session = await cache.get_session(app_name=APP, user_id="u1", session_id=session.id)
+            await cache.append_event(session, _event(turn))
+
+        for _ in range(2):
+            fresh = await cache.get_session(app_name=APP, user_id="u1", session_id=session.id)
+
+        assert [event.invocation_id for event in fresh.events] == ["turn-1", "turn-2"]
+
+    asyncio.run(scenario())
+
+
+def test_deleted_session_is_dropped_on_revalidation():
+    async def scenario():
+        inner = CountingSessionService()
+        cache = CachedSessionService(inner, ttl_seconds=0)
+        session = await cache.create_session(app_name=APP, user_id="u1")
+        await inner.delete_session(app_name=APP, user_id="u1", session_id=session.id)
+
+        assert await cache.get_session(app_name=APP, user_id="u1", session_id=session.id) is None
+
+    asyncio.run(scenario())
+
+
+def test_only_prewarmed_users_get_warm_sessions():
+    async def scenario():
+        inner = CountingSessionService()
+        cache = CachedSessionService(inner, warm_per_user=1)
+        await cache.prewarm(APP, ["coach"])
+        await _settle()
+        assert inner.creates == 1
+
+        await cache.create_session(app_name=APP, user_id="coach")
+        await _settle()
+        assert cache.stats["warm_hits"] == 1
+        assert inner.creates == 2  # Refill
+
+        for user_id in ("a", "b", "c"):
+            await cache.create_session(app_name=APP, user_id=user_id)
+        await _settle()
+
+        # One cold create each, no pools for users that weren't configured
+        assert inner.creates == 5
+        assert cache.stats["cold_creates"] == 3
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("state, session_id", [({"k": "v"}, None), (None, "chosen-id")])
+def test_sessions_with_state_or_id_are_never_taken_from_the_pool(state, session_id):
+    async def scenario():
+        inner = CountingSessionService()
+        cache = CachedSessionService(inner, warm_per_user=1)
+        await cache.prewarm(APP, ["coach"])
+        await _settle()
+
+        await cache.create_session(app_name=APP, user_id="coach", state=state, session_id=session_id)
+
+        assert cache.stats["warm_hits"] == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,113 @@
+"""Unit tests for stats_parser (run: pytest test_stats_parser.py)"""
+
+import pytest
+
+from stats_parser import format_confirmation, parse_game_stats
+
+
+def test_formulaic_message_is_complete():
+    parsed = parse_game_stats("Emma scored 2 goals and 1 assist vs Riverside in a league game")
+
+    assert parsed.complete
+    assert parsed.args == {
+        "player_name": "Emma",
+        "goals": 2,
+        "assists": 1,
+        "opponent": "Riverside",
+        "game_type": "league",
+    }
+
+
+@pytest.mark.parametrize("message", [
+    "Today Emma scored 2 goals vs Riverside",
+    "Yesterday, Emma scored 2 goals vs Riverside",
+    "tonight Emma scored 2 goals vs Riverside",
+    "Last night Emma scored 2 goals vs Riverside",
+])
+def test_leading_time_word_is_not_part_of_the_name(message):
+    parsed = parse_game_stats(message)
+
+    assert parsed.complete
+    assert parsed.args["player_name"] == "Emma"
+
+
+def test_two_word_name_is_kept():
+    parsed = parse_game_stats("Emma Jones had 5 saves against the Rovers")
+
+    assert parsed.complete
+    assert parsed.args["player_name"] == "Emma Jones"
+    assert parsed.args["opponent"] == "Rovers"
+
+
+@pytest.mark.parametrize("message", [
+    # Mia's saves must not be logged for Emma
+    "Emma scored 2 goals vs Riverside, Mia had 3 saves",
+    "Emma scored 2 goals vs Riverside. Mia had 3 saves",
+    "Emma scored 2 goals vs Riverside with Mia in goal",
+])
+def test_second_player_is_incomplete(message):
+    assert not parse_game_stats(message).complete
+
+
+def test_second_clause_is_incomplete():
+    parsed = parse_game_stats("Emma scored 2 goals vs Riverside and had 3 saves")
+
+    assert not parsed.complete
+    assert "single_clause" in parsed.missing
+
+
+def test_days_and_sentence_starts_are_not_names():
+    assert parse_game_stats("Log stats for Emma: 2 goals vs Riverside on Saturday").complete
+    assert parse_game_stats("Emma scored twice vs Riverside. Great game").complete
+
+
+@pytest.mark.parametrize("message, missing", [
+    ("How many goals did Emma score vs Riverside?", "statement"),
+    ("Emma scored 2 goals and had 4 tackles vs Riverside", "unsupported_stat"),
+    ("Emma scored 2 goals", "opponent"),
+    ("Emma played vs Riverside", "stats"),
+    ("Emma scored 2 goals vs Riverside, then 1 goal vs Lakeside", "goals"),
+])
+def test_incomplete_parses(message, missing):
+    parsed = parse_game_stats(message)
+
+    assert not parsed.complete
+    assert missing in parsed.missing
+
+
+@pytest.mark.parametrize("message, missing", [
+    # The opponent must not be saved as "St" or "Riverside but I think it was 3"
+    ("Emma scored 2 goals vs St. Mary's", "opponent"),
+    ("Emma scored 2 goals vs Mt. Hood in a league game", "opponent"),
+    ("Emma scored 2 goals vs Riverside 3", "opponent"),
+    ("Emma scored 2 goals vs Riverside but I think it was 3", "certain"),
+    ("Emma scored 2 goals vs Riverside, actually maybe 3", "certain"),
+    ("Emma scored 2 goals vs Riverside though not sure", "certain"),
+])
+def test_doubtful_parses_go_to_the_llm(message, missing):
+    parsed = parse_game_stats(message)
+
+    assert not parsed.complete
+    assert missing in parsed.missing
+
+
+def test_opponent_stops_at_clause_words():
+    parsed = parse_game_stats("Emma scored 2 goals vs Riverside but I think it was 3")
+
+    assert parsed.args["opponent"] == "Riverside"
+
+
+def test_number_words_and_hat_trick():
+    assert parse_game_stats("Emma had two assists vs Riverside").args["assists"] == 2
+    assert parse_game_stats("Emma scored a hat-trick vs Riverside").args["goals"] == 3
+
+
+def test_format_confirmation():
+    result = {
+        "message": "✅ Logged stats for Emma vs Riverside (league)",
+        "stats": {"player": "Emma", "goals": 1, "assists": 2, "saves": 0, "minutes_played": 60},
+    }
+
+    assert format_confirmation(result) == (
+        "✅ Logged stats for Emma vs Riverside (league): 1 goal, 2 assists, 60 minutes. Great game, Emma!"
+    )
@@ -0,0 +1,103 @@
+"""Unit tests for tool_cache (run: pytest test_tool_cache.py)"""
+
+import inspect
+from types import SimpleNamespace
+
+import tool_cache
+from tool_cache import cached_tool, invalidate_player
+
+
+def _context():
+    return SimpleNamespace(state={})
+
+
+def _counting_tool(status="success", ttl_seconds=None):
+    calls = []
+
+    @cached_tool("stats_{player_name}_{timeframe}", ttl_seconds=ttl_seconds)
+    def get_stats(player_name: str, timeframe: str = "season", tool_context=None) -> dict:
+        calls.append((player_name, timeframe))
+        return {"status": status, "player": player_name, "call": len(calls)}
+
+    return get_stats, calls
+
+
+def test_repeat_call_is_served_from_state():
+    get_stats, calls = _counting_tool()
+    context = _context()
+
+    first = get_stats("Emma", tool_context=context)
+    second = get_stats("Emma", "season", tool_context=context)
+
+    assert second == first
+    assert len(calls) == 1
+    assert "tool_cache_stats_Emma_season" in context.state
+
+
+def test_different_arguments_are_cached_separately():
+    get_stats, calls = _counting_tool()
+    context = _context()
+
+    get_stats("Emma", tool_context=context)
+    get_stats("Emma", "last_5", tool_context=context)
+    get_stats("Mia", tool_context=context)
+
+    assert len(calls) == 3
+
+
+def test_invalidate_player_only_affects_that_player():
+    get_stats, calls = _counting_tool()
+    context = _context()
+    get_stats("Emma", tool_context=context)
+    get_stats("Mia", tool_context=context)
+
+    invalidate_player(context, "Emma")
+    get_stats("Emma", tool_context=context)
+    get_stats("Mia", tool_context=context)
+
+    assert calls == [("Emma", "season"), ("Mia", "season"), ("Emma", "season")]
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(tool_cache.time, "time", lambda: now[0])
+    get_stats, calls = _counting_tool(ttl_seconds=60)
+    context = _context()
+
+    get_stats("Emma", tool_context=context)
+    now[0] += 59
+    get_stats("Emma", tool_context=context)
+    assert len(calls) == 1
+
+    now[0] += 2
+    get_stats("Emma", tool_context=context)
+    assert len(calls) == 2
+
+
+def test_errors_are_not_cached():
+    get_stats, calls = _counting_tool(status="error")
+    context = _context()
+
+    get_stats("Emma", tool_context=context)
+    get_stats("Emma", tool_context=context)
+
+    assert len(calls) == 2
+    assert context.state == {}
+
+
+def test_calls_without_tool_context_bypass_the_cache():
+    get_stats, calls = _counting_tool()
+
+    get_stats("Emma")
+    get_stats("Emma")
+
+    assert len(calls) == 2
+
+
+def test_signature_is_preserved_for_adk():
+    get_stats, _ = _counting_tool()
+
+    assert get_stats.__name__ == "get_stats"
+    assert list(inspect.signature(get_stats).parameters) == [
+        "player_name", "timeframe", "tool_context",
+    ]
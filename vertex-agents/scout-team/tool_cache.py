@@ -0,0 +1,113 @@
+"""
+Per-session tool result cache for the Scout team.
+
+Scout tools already stash their results in `tool_context.state` (e.g.
+`stats_{player}_{timeframe}`). This module adds a decorator that reads those
+results back, so when the Lead Scout delegates to several specialists in one
+session the same data is only fetched once.
+
+Cache entries live in session state next to the tool's own keys:
+- `tool_cache_{key}`: {"result": ..., "cached_at": ..., "player_version": ...}
+- `cache_version_{player}`: bumped by `invalidate_player` whenever new game
+  stats are logged, which makes every older entry for that player stale.
+"""
+
+import functools
+import inspect
+import logging
+import os
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default time-to-live for cached tool results
+DEFAULT_TTL_SECONDS = float(os.getenv("SCOUT_TOOL_CACHE_TTL_SECONDS", "300"))
+
+
+def _entry_key(key: str) -> str:
+    return f"tool_cache_{key}"
+
+
+def _version_key(player_name: str) -> str:
+    return f"cache_version_{player_name}"
+
+
+def invalidate_player(tool_context: Any, player_name: str) -> None:
+    """
+    Invalidate every cached tool result for a player.
+
+    Args:
+        tool_context: Context with session state (ToolContext or CallbackContext).
+        player_name: The player whose cached results are now stale.
+    """
+    if tool_context is None:
+        return
+
+    version_key = _version_key(player_name)
+    tool_context.state[version_key] = tool_context.state.get(version_key, 0) + 1
+
+
+def cached_tool(
+    key_template: str,
+    ttl_seconds: Optional[float] = None,
+) -> Callable[[Callable[..., dict]], Callable[..., dict]]:
+    """
+    Serve repeat tool calls within a session from session state.
+
+    The wrapped function keeps its original signature so ADK still builds
+    the same function declaration for it.
+
+    Args:
+        key_template: State key format string, filled from the tool's bound
+            arguments (e.g. "stats_{player_name}_{timeframe}").
+        ttl_seconds: How long a result stays fresh. Defaults to
+            SCOUT_TOOL_CACHE_TTL_SECONDS (300s).
+
+    Returns:
+        Decorator for an ADK tool function taking `tool_context`.
+    """
+    ttl = DEFAULT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+
+    def decorator(func: Callable[..., dict]) -> Callable[..., dict]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> dict:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+
+            tool_context = bound.arguments.get("tool_context")
+            if tool_context is None:
+                return func(*args, **kwargs)
+
+            key = key_template.format(**bound.arguments)
+            player_name = bound.arguments.get("player_name", "")
+            player_version = tool_context.state.get(_version_key(player_name), 0)
+
+            entry = tool_context.state.get(_entry_key(key))
+            if (
+                entry
+                and entry.get("player_version") == player_version
+                and time.time() - entry.get("cached_at", 0) < ttl
+            ):
+                logger.info(
+                    f"Tool cache hit: {func.__name__}",
+                    extra={"tool": func.__name__, "key": key}
+                )
+                return entry["result"]
+
+            result = func(*args, **kwargs)
+
+            if result.get("status") == "success":
+                tool_context.state[_entry_key(key)] = {
+                    "result": result,
+                    "cached_at": time.time(),
+                    "player_version": player_version,
+                }
+
+            return result
+
+        return wrapper
+
+    return decorator
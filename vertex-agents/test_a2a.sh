@@ -50,7 +50,9 @@ test_registration() {
                     \"firstName\": \"Test\",
                     \"lastName\": \"User\",
                     \"email\": \"$EMAIL\",
-                    \"password\": \"TestPass123!\"
+                    \"password\": \"TestPass123!\",
+                    \"agreedToTerms\": true,
+                    \"isParentGuardian\": true
                 }
             }
         }")